@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Box Fill Planner Benchmark
+==========================
+Times plan_floor_boxes on synthetic floors, with and without a limit on
+the number of distinct box types.
+
+Usage:
+    python3 benchmarks/bench_box_planner.py
+    python3 benchmarks/bench_box_planner.py --sizes 1000 1000000 --max-types 2 3 4
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import sovereign_paths  # noqa: F401,E402
+from box_fill_planner import build_catalog, plan_floor_boxes  # noqa: E402
+
+
+def synthetic_floor(n: int, seed: int = 314) -> dict:
+    """n junction boxes with a realistic spread of conductors and devices"""
+    rng = np.random.default_rng(seed)
+    return dict(
+        conductors=rng.integers(2, 10, size=n),
+        largest_awg=rng.choice([14, 12, 10], size=n, p=[0.3, 0.6, 0.1]),
+        devices=rng.integers(0, 3, size=n),
+        grounds=rng.random(n) < 0.95,
+        clamps=rng.random(n) < 0.5,
+        fittings=(rng.random(n) < 0.1).astype(int),
+    )
+
+
+def synthetic_catalog(extra: int, seed: int = 314) -> list:
+    """STANDARD_BOXES plus `extra` random catalog entries with costs"""
+    rng = np.random.default_rng(seed)
+    volumes = np.sort(rng.uniform(10, 80, size=extra)).round(1)
+    return build_catalog(
+        extra_boxes=[(f'CAT-{i}', v, round(0.5 + v * rng.uniform(0.03, 0.06), 2))
+                     for i, v in enumerate(volumes)],
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10_000, 100_000, 1_000_000])
+    parser.add_argument('--max-types', type=int, nargs='+', default=[2, 4])
+    parser.add_argument('--catalog', type=int, default=60, help="extra catalog entries")
+    args = parser.parse_args()
+
+    catalog = synthetic_catalog(args.catalog)
+    print(f"catalog: {len(catalog)} boxes")
+    print(f"{'boxes':>10} {'types':>6} {'time (s)':>10} {'total cost':>14}")
+    for n in args.sizes:
+        floor = synthetic_floor(n)
+        for k in [None] + args.max_types:
+            start = time.perf_counter()
+            plan = plan_floor_boxes(floor, catalog, objective='cost', max_box_types=k)
+            elapsed = time.perf_counter() - start
+            label = 'any' if k is None else str(k)
+            print(f"{n:>10,} {label:>6} {elapsed:>10.4f} {plan.total_cost:>14,.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Columnar Schedule IO Benchmark
+==============================
+Writes one synthetic schedule as CSV, JSON Lines, Parquet and Arrow IPC,
+then times loading each into a CircuitTable and running the vectorized
+VA pass. The plain csv-module reader (list of dicts) is timed as well.
+
+Usage:
+    python3 benchmarks/bench_columnar_io.py
+    python3 benchmarks/bench_columnar_io.py --rows 1000000 --repeat 3 --keep /tmp/io
+"""
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import sovereign_paths  # noqa: F401,E402
+from audit_io import read_schedule_table, write_schedule_table  # noqa: E402
+from circuit_table import CircuitTable  # noqa: E402
+from panel_schedule import read_panel_schedule  # noqa: E402
+
+
+FORMATS = ('csv', 'jsonl', 'parquet', 'arrow')
+
+
+def synthetic_schedule(n: int, seed: int = 66) -> pd.DataFrame:
+    """n circuits with realistic voltages, breaker sizes and phase spread"""
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        'circuit_name': [f'CKT-{i}' for i in range(n)],
+        'voltage': rng.choice([120.0, 208.0, 277.0, 480.0], size=n),
+        'amps': rng.choice([15.0, 20.0, 30.0, 40.0, 60.0, 100.0], size=n),
+        'phases': rng.choice([1, 3], size=n, p=[0.8, 0.2]),
+        'continuous': rng.random(n) < 0.4,
+        'phase': rng.choice(['A', 'B', 'C'], size=n),
+    })
+
+
+def best_of(fn, repeat: int) -> float:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--keep', metavar='DIR', default=None, help="write files here and keep them")
+    parser.add_argument('--skip-dict-reader', action='store_true',
+                        help="skip the (slow) csv-module list-of-dicts baseline")
+    args = parser.parse_args()
+
+    directory = args.keep or tempfile.mkdtemp(prefix='sca_io_')
+    os.makedirs(directory, exist_ok=True)
+    df = synthetic_schedule(args.rows)
+    expected = CircuitTable.from_frame(df).va().sum()
+
+    print(f"{args.rows:,} circuits → {directory}")
+    print(f"{'format':<22} {'size (MB)':>10} {'load (s)':>10} {'load+VA (s)':>12} {'vs CSV':>8}")
+    try:
+        paths = {fmt: write_schedule_table(df, os.path.join(directory, f'schedule.{fmt}'))
+                 for fmt in FORMATS}
+        csv_time = None
+        for fmt, path in paths.items():
+            load = best_of(lambda: read_schedule_table(path), args.repeat)
+            table = read_schedule_table(path)
+            assert np.isclose(table.va().sum(), expected), fmt
+            total = best_of(lambda: read_schedule_table(path).va().sum(), args.repeat)
+            csv_time = csv_time or load
+            size = os.path.getsize(path) / 1e6
+            print(f"{fmt + ' → CircuitTable':<22} {size:>10.1f} {load:>10.3f} {total:>12.3f} "
+                  f"{csv_time / load:>7.1f}×")
+        if not args.skip_dict_reader:
+            load = best_of(lambda: read_panel_schedule(paths['csv']), 1)
+            print(f"{'csv → list of dicts':<22} {os.path.getsize(paths['csv']) / 1e6:>10.1f} "
+                  f"{load:>10.3f} {'':>12} {csv_time / load:>7.1f}×")
+    finally:
+        if args.keep is None:
+            shutil.rmtree(directory, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Critical Classifier Microbenchmark
+==================================
+any(k in name for k in keywords) per circuit vs the compiled, memoized
+CriticalCircuitClassifier — on a list of names and on a pandas column.
+
+Usage:
+    python3 benchmarks/bench_critical_classifier.py
+    python3 benchmarks/bench_critical_classifier.py --rows 1000000 --distinct 5000
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import sovereign_paths  # noqa: F401,E402
+from critical_circuits import CRITICAL_KEYWORDS, CriticalCircuitClassifier  # noqa: E402
+
+
+PREFIXES = ['ICU_Outlet', 'OR_Lighting', 'Emergency_Panel', 'Life Safety Pump', 'Nurse_Call',
+            'General_Lighting', 'HVAC_RTU', 'Kitchen_Recept', 'Lab_Hood', 'Parking_Lot']
+
+
+def synthetic_names(rows: int, distinct: int, seed: int = 517) -> list:
+    """Circuit names drawn from `distinct` templates repeated across panels"""
+    rng = np.random.default_rng(seed)
+    templates = [f'{PREFIXES[i % len(PREFIXES)]}_{i}' for i in range(distinct)]
+    return [templates[i] for i in rng.integers(0, distinct, size=rows)]
+
+
+def substring_loop(names: list) -> list:
+    """The pre-classifier check from v2/v3"""
+    return [any(k in str(n) for k in CRITICAL_KEYWORDS) for n in names]
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return time.perf_counter() - start, result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--rows', type=int, default=200_000)
+    parser.add_argument('--distinct', type=int, default=2_000)
+    args = parser.parse_args()
+
+    names = synthetic_names(args.rows, args.distinct)
+    series = pd.Series(names)
+
+    loop_t, expected = timed(substring_loop, names)
+    cold_t, cold = timed(CriticalCircuitClassifier().classify, names)
+    warm = CriticalCircuitClassifier()
+    warm.classify(names)
+    warm_t, _ = timed(warm.classify, names)
+    column_t, column = timed(CriticalCircuitClassifier().classify, series)
+
+    assert cold == expected and column.tolist() == expected
+
+    print(f"{args.rows:,} names, {args.distinct:,} distinct")
+    print(f"  substring loop        {loop_t:8.4f} s")
+    print(f"  classifier (cold)     {cold_t:8.4f} s   {loop_t / cold_t:6.1f}×")
+    print(f"  classifier (memoized) {warm_t:8.4f} s   {loop_t / warm_t:6.1f}×")
+    print(f"  classifier (column)   {column_t:8.4f} s   {loop_t / column_t:6.1f}×")
+
+
+if __name__ == '__main__':
+    main()
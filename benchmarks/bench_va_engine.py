@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+VA Engine Benchmark - row-wise apply/iterrows vs columnar engine
+================================================================
+Times the baseline imperial_load_audit_v3 core, verbatim (df.apply +
+df.iterrows), against imperial_va_engine on synthetic panel schedules.
+
+Usage:
+    python3 benchmarks/bench_va_engine.py
+    python3 benchmarks/bench_va_engine.py --sizes 10000 100000
+"""
+
+import argparse
+import math
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from imperial_va_engine import compute_circuit_va, compute_phase_loads  # noqa: E402
+
+
+def synthetic_schedule(n: int, seed: int = 1085) -> pd.DataFrame:
+    """Random hospital-style panel schedule with n circuits"""
+    rng = np.random.default_rng(seed)
+    phases = rng.choice([1, 3], size=n, p=[0.8, 0.2])
+    return pd.DataFrame({
+        'circuit_name': [f'CKT-{i}' for i in range(n)],
+        'voltage': np.where(phases == 3, rng.choice([208, 480], size=n), rng.choice([120, 277], size=n)),
+        'amps': rng.uniform(5, 100, size=n).round(1),
+        'phases': phases,
+        'continuous': rng.random(n) < 0.6,
+        'phase': rng.choice(list('ABC'), size=n),
+    })
+
+
+def legacy_path(df: pd.DataFrame) -> dict:
+    """The baseline v3 core verbatim (df.apply VA, iterrows phase loop), kept as the reference"""
+    df = df.copy()
+    df["va"] = df.apply(
+        lambda r: (
+            r["voltage"] * r["amps"] * math.sqrt(3)
+            if r.get("phases", 1) == 3
+            else r["voltage"] * r["amps"]
+        ) * (1.25 if r.get("continuous", False) else 1.0),
+        axis=1
+    )
+
+    total_va = df["va"].sum()
+    max_unit = df["va"].max()
+
+    # Baseline phase loop: 3-phase rows land on their label, no even split
+    phase_loads = {}
+    for idx, row in df.iterrows():
+        phase = row.get('phase', 'A')
+        if phase not in phase_loads:
+            phase_loads[phase] = 0
+        phase_loads[phase] += row['va']
+
+    return {'va': df["va"].to_numpy(), 'total_va': total_va, 'max_unit': max_unit,
+            'phase_loads': phase_loads}
+
+
+def engine_path(df: pd.DataFrame) -> dict:
+    """Columnar engine: VA + per-phase totals"""
+    va = compute_circuit_va(df)
+    return {'va': va, 'total_va': va.sum(), 'max_unit': va.max(),
+            'phase_loads': compute_phase_loads(df, va)}
+
+
+def best_of(fn, df, repeat):
+    """Best wall-clock time of `repeat` runs"""
+    best = float('inf')
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn(df)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10_000, 100_000, 1_000_000])
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'rows':>10} {'legacy (s)':>12} {'engine (s)':>12} {'speedup':>10}")
+    for n in args.sizes:
+        df = synthetic_schedule(n)
+        legacy_t, legacy_loads = best_of(legacy_path, df, 1)
+        engine_t, engine_loads = best_of(engine_path, df, args.repeat)
+        # VA, total and largest unit must match the baseline exactly; phase loads
+        # differ by design (the engine splits 3-phase VA evenly, v2 style)
+        assert np.allclose(legacy_loads['va'], engine_loads['va'], rtol=1e-12)
+        assert math.isclose(legacy_loads['total_va'], engine_loads['total_va'], rel_tol=1e-9)
+        assert legacy_loads['max_unit'] == engine_loads['max_unit']
+        print(f"{n:>10,} {legacy_t:>12.3f} {engine_t:>12.4f} {legacy_t / engine_t:>9.0f}×")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+CLI Startup Check
+=================
+Times sovereign_cli invocations end to end (fresh interpreter each run)
+and fails if the light subcommands exceed the startup budget or load
+numpy / pandas / matplotlib.
+
+Budget: median wall time of the light subcommands ≤ BUDGET_MS above a
+bare `python -c pass`, so the target holds on slow and fast machines.
+
+Usage:
+    python3 benchmarks/check_cli_startup.py
+    python3 benchmarks/check_cli_startup.py --runs 20 --budget-ms 80
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CLI = os.path.join(REPO_ROOT, 'sovereign_cli.py')
+
+BUDGET_MS = 100
+HEAVY_MODULES = ('numpy', 'pandas', 'matplotlib', 'pyarrow')
+
+SAMPLE_SCHEDULE = [
+    {'circuit_name': 'ICU Ventilator', 'voltage': 120, 'amps': 20, 'continuous': True, 'phase': 'A'},
+    {'circuit_name': 'OR Lights', 'voltage': 277, 'amps': 30, 'continuous': True, 'phase': 'B'},
+    {'circuit_name': 'Chiller', 'voltage': 480, 'amps': 60, 'phases': 3, 'continuous': True},
+]
+
+
+def light_commands(schedule: str):
+    return {
+        'box-fill': ['box-fill', '--conductors', '6', '--awg', '12'],
+        'manual-j': ['manual-j', '--example'],
+        'audit-v2': ['audit-v2', schedule],
+    }
+
+
+def time_command(argv, runs: int) -> float:
+    """Median wall time (ms) of `python argv`"""
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, *argv], check=True, stdout=subprocess.DEVNULL)
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def heavy_imports(args) -> list:
+    """Heavy modules left in sys.modules after running one subcommand in-process"""
+    probe = (
+        "import sys, io, contextlib; sys.path.insert(0, %r); import sovereign_cli; "
+        "out = io.StringIO()\n"
+        "with contextlib.redirect_stdout(out): sovereign_cli.main(%r)\n"
+        "print([m for m in %r if m in sys.modules])"
+    ) % (REPO_ROOT, args, HEAVY_MODULES)
+    result = subprocess.run([sys.executable, '-c', probe], check=True, capture_output=True, text=True)
+    return json.loads(result.stdout.strip().replace("'", '"'))
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--runs', type=int, default=15)
+    parser.add_argument('--budget-ms', type=float, default=BUDGET_MS)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        schedule = os.path.join(tmp, 'node.json')
+        with open(schedule, 'w') as f:
+            json.dump(SAMPLE_SCHEDULE, f)
+
+        baseline = time_command(['-c', 'pass'], args.runs)
+        print(f"{'python -c pass':<16} {baseline:>8.1f} ms")
+        failures = []
+        for name, argv in light_commands(schedule).items():
+            elapsed = time_command([CLI, *argv], args.runs) - baseline
+            heavy = heavy_imports(argv)
+            status = 'ok'
+            if elapsed > args.budget_ms:
+                status = f'over budget ({args.budget_ms:.0f} ms)'
+            if heavy:
+                status = f'imports {", ".join(heavy)}'
+            if status != 'ok':
+                failures.append(name)
+            print(f"{name:<16} {elapsed:>+8.1f} ms  {status}")
+        audit = time_command([CLI, 'audit', schedule], max(3, args.runs // 5)) - baseline
+        print(f"{'audit (v3)':<16} {audit:>+8.1f} ms  (pandas path, informational)")
+
+    if failures:
+        print(f"❌ startup check failed: {', '.join(failures)}")
+        return 1
+    print("✅ startup within budget")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
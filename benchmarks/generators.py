@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Synthetic Inputs for Benchmarks
+===============================
+Deterministic generators for panel schedules, junction boxes and
+buildings at any scale. Each comes in a columnar form (DataFrame / dict
+of arrays, for the vectorized paths) and a row form (list of dicts, for
+the scalar calculators).
+"""
+
+from typing import Any, Dict, List
+
+import numpy as np
+import pandas as pd
+
+CIRCUIT_PREFIXES = ['ICU Ventilator', 'OR Lights', 'Emergency Egress', 'Nurse Call',
+                    'Lab Freezer', 'Lobby Receptacles', 'AHU', 'Chiller', 'Elevator', 'Kitchen']
+
+
+def panel_schedule(n: int, seed: int = 1085) -> pd.DataFrame:
+    """Hospital-style panel schedule with n circuits (~20% three-phase, ~60% continuous)"""
+    rng = np.random.default_rng(seed)
+    phases = rng.choice([1, 3], size=n, p=[0.8, 0.2])
+    prefixes = np.asarray(CIRCUIT_PREFIXES, dtype=object)[rng.integers(0, len(CIRCUIT_PREFIXES), size=n)]
+    return pd.DataFrame({
+        'circuit_name': prefixes + ' ' + np.arange(n).astype(str).astype(object),
+        'voltage': np.where(phases == 3, rng.choice([208.0, 480.0], size=n),
+                            rng.choice([120.0, 277.0], size=n)),
+        'amps': rng.choice([15.0, 20.0, 30.0, 40.0, 60.0, 100.0], size=n),
+        'phases': phases,
+        'continuous': rng.random(n) < 0.6,
+        'phase': rng.choice(['A', 'B', 'C'], size=n),
+    })
+
+
+def panel_circuits(n: int, seed: int = 1085) -> List[Dict[str, Any]]:
+    """panel_schedule as the list of circuit dicts the auditors take"""
+    return panel_schedule(n, seed).to_dict('records')
+
+
+def boxes(n: int, seed: int = 314) -> Dict[str, np.ndarray]:
+    """n junction boxes as box_fill_calculator argument arrays"""
+    rng = np.random.default_rng(seed)
+    return {
+        'conductors': rng.integers(2, 12, size=n),
+        'largest_awg': rng.choice([14, 12, 10, 8], size=n, p=[0.3, 0.5, 0.15, 0.05]),
+        'devices': rng.integers(0, 3, size=n),
+        'grounds': rng.random(n) < 0.95,
+        'clamps': rng.random(n) < 0.5,
+        'fittings': (rng.random(n) < 0.1).astype(np.int64),
+    }
+
+
+def box_list(n: int, seed: int = 314) -> List[Dict[str, Any]]:
+    """boxes() as per-call keyword dicts (Python scalars)"""
+    columns = {k: v.tolist() for k, v in boxes(n, seed).items()}
+    return [dict(zip(columns, row)) for row in zip(*columns.values())]
+
+
+def buildings(n: int, seed: int = 75) -> Dict[str, np.ndarray]:
+    """n residential buildings as manual_j_thermal_load field arrays"""
+    rng = np.random.default_rng(seed)
+    return {
+        'square_footage': rng.integers(800, 6000, size=n),
+        'ceiling_height': rng.choice([8, 9, 10], size=n),
+        'insulation_r_value': rng.choice([11, 13, 19, 30, 38, 49], size=n),
+        'window_shgc': rng.choice([0.25, 0.3, 0.4, 0.55], size=n),
+        'window_area_sqft': rng.integers(100, 800, size=n),
+        'outdoor_design_temp': rng.integers(-10, 115, size=n),
+        'indoor_design_temp': rng.choice([68, 70, 72, 75], size=n),
+        'occupants': rng.integers(1, 8, size=n),
+        'lighting_watts': rng.integers(500, 4000, size=n),
+        'appliance_watts': rng.integers(1000, 8000, size=n),
+    }
+
+
+def building_list(n: int, seed: int = 75) -> List[Dict[str, Any]]:
+    """buildings() as per-call dicts (Python scalars)"""
+    columns = {k: v.tolist() for k, v in buildings(n, seed).items()}
+    return [dict(zip(columns, row)) for row in zip(*columns.values())]
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+Sovereign Service Load Test
+===========================
+Drives sovereign_service.py over keep-alive connections from many
+concurrent asyncio clients and reports p50 / p99 latency and requests
+per second for each endpoint mix.
+
+Usage:
+    python3 benchmarks/loadtest_service.py                 # spawns a local service
+    python3 benchmarks/loadtest_service.py --port 8766 --no-spawn
+    python3 benchmarks/loadtest_service.py --requests 20000 --concurrency 128
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import statistics
+import subprocess
+import sys
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SERVICE = os.path.join(REPO_ROOT, 'sovereign_service.py')
+
+SCENARIOS = ('box-fill', 'manual-j', 'audit-v2', 'audit-v3', 'mixed')
+
+
+def make_payloads(n_templates: int = 50, circuits: int = 120, seed: int = 66):
+    """Request bodies per endpoint: a few panel templates, varied boxes and homes"""
+    rng = random.Random(seed)
+    templates = [
+        [{'circuit_name': f"{rng.choice(['ICU', 'OR', 'Lab', 'Lobby', 'HVAC'])} {i}",
+          'voltage': rng.choice([120, 208, 277, 480]),
+          'amps': rng.choice([15, 20, 30, 60]),
+          'phases': rng.choice([1, 1, 1, 3]),
+          'continuous': rng.random() < 0.4,
+          'phase': rng.choice('ABC')} for i in range(circuits)]
+        for _ in range(n_templates)
+    ]
+
+    def box():
+        return {'conductors': rng.randint(2, 10), 'largest_awg': rng.choice([14, 12, 10]),
+                'devices': rng.randint(0, 2), 'grounds': True, 'clamps': rng.random() < 0.5}
+
+    def home():
+        return {'square_footage': rng.randint(1200, 4000), 'ceiling_height': 9,
+                'insulation_r_value': rng.choice([13, 19, 30, 38]), 'window_shgc': 0.25,
+                'window_area_sqft': rng.randint(150, 500), 'outdoor_design_temp': rng.randint(85, 110),
+                'indoor_design_temp': 75, 'occupants': rng.randint(1, 6),
+                'lighting_watts': 1500, 'appliance_watts': 3000}
+
+    return {
+        'box-fill': lambda: ('/box-fill', box()),
+        'manual-j': lambda: ('/manual-j', home()),
+        'audit-v2': lambda: ('/audit/v2', rng.choice(templates)),
+        'audit-v3': lambda: ('/audit/v3', {'circuits': rng.choice(templates), 'sq_ft': 50_000}),
+    }
+
+
+async def request(reader, writer, host: str, path: str, body) -> int:
+    data = json.dumps(body).encode()
+    writer.write(
+        f'POST {path} HTTP/1.1\r\nHost: {host}\r\nContent-Type: application/json\r\n'
+        f'Content-Length: {len(data)}\r\n\r\n'.encode() + data
+    )
+    await writer.drain()
+    status = int((await reader.readline()).split()[1])
+    length = 0
+    while True:
+        line = await reader.readline()
+        if line in (b'\r\n', b''):
+            break
+        if line.lower().startswith(b'content-length:'):
+            length = int(line.split(b':')[1])
+    await reader.readexactly(length)
+    return status
+
+
+async def run_scenario(host: str, port: int, scenario: str, total: int, concurrency: int):
+    generators = make_payloads()
+    choices = list(generators) if scenario == 'mixed' else [scenario]
+    latencies, errors = [], 0
+    remaining = total
+
+    async def client():
+        nonlocal remaining, errors
+        reader, writer = await asyncio.open_connection(host, port)
+        try:
+            while remaining > 0:
+                remaining -= 1
+                path, body = generators[random.choice(choices)]()
+                start = time.perf_counter()
+                status = await request(reader, writer, host, path, body)
+                latencies.append(time.perf_counter() - start)
+                errors += status != 200
+        finally:
+            writer.close()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+    return {
+        'scenario': scenario,
+        'requests': len(latencies),
+        'errors': errors,
+        'rps': len(latencies) / elapsed,
+        'p50_ms': statistics.median(latencies) * 1000,
+        'p99_ms': latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))] * 1000,
+    }
+
+
+async def wait_ready(host: str, port: int, timeout: float = 30.0) -> None:
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            reader, writer = await asyncio.open_connection(host, port)
+            writer.write(b'GET /health HTTP/1.1\r\nConnection: close\r\n\r\n')
+            await writer.drain()
+            if b'200' in await reader.readline():
+                writer.close()
+                return
+        except OSError:
+            pass
+        await asyncio.sleep(0.1)
+    raise TimeoutError(f"service on {host}:{port} did not start")
+
+
+async def fetch_stats(host: str, port: int):
+    reader, writer = await asyncio.open_connection(host, port)
+    writer.write(b'GET /stats HTTP/1.1\r\nConnection: close\r\n\r\n')
+    await writer.drain()
+    raw = await reader.read()
+    writer.close()
+    return json.loads(raw.split(b'\r\n\r\n', 1)[1])
+
+
+async def main_async(args) -> None:
+    await wait_ready(args.host, args.port)
+    print(f"{'scenario':<10} {'requests':>9} {'errors':>7} {'req/s':>10} {'p50 (ms)':>10} {'p99 (ms)':>10}")
+    for scenario in args.scenarios:
+        r = await run_scenario(args.host, args.port, scenario, args.requests, args.concurrency)
+        print(f"{r['scenario']:<10} {r['requests']:>9,} {r['errors']:>7} {r['rps']:>10,.0f} "
+              f"{r['p50_ms']:>10.2f} {r['p99_ms']:>10.2f}")
+    if args.stats:
+        print(json.dumps(await fetch_stats(args.host, args.port), indent=2))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8766)
+    parser.add_argument('--no-spawn', action='store_true', help="use an already running service")
+    parser.add_argument('--requests', type=int, default=5_000, help="requests per scenario")
+    parser.add_argument('--concurrency', type=int, default=64)
+    parser.add_argument('--scenarios', nargs='+', choices=SCENARIOS, default=list(SCENARIOS))
+    parser.add_argument('--stats', action='store_true', help="print /stats afterwards")
+    args = parser.parse_args()
+
+    proc = None
+    if not args.no_spawn:
+        proc = subprocess.Popen([sys.executable, SERVICE, '--host', args.host, '--port', str(args.port)],
+                                stdout=subprocess.DEVNULL)
+    try:
+        asyncio.run(main_async(args))
+    finally:
+        if proc is not None:
+            proc.terminate()
+            proc.wait()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+"""
+Calculator Benchmark Suite and Regression Gate
+==============================================
+Times every calculator — scalar and batch paths — on synthetic inputs
+from benchmarks/generators.py, records peak traced memory, and compares
+runs against stored JSON baselines.
+
+Usage:
+    python3 benchmarks/run_benchmarks.py run                        # print results
+    python3 benchmarks/run_benchmarks.py run --save                 # write baselines/baseline.json
+    python3 benchmarks/run_benchmarks.py run --scales 10 1000 --only audit_v2 box_fill
+    python3 benchmarks/run_benchmarks.py compare                    # fresh run vs baseline
+    python3 benchmarks/run_benchmarks.py compare --current new.json --threshold 0.25
+
+compare exits with status 1 when any case is slower than the baseline
+by more than --threshold (fractional, default 0.25). Cases faster than
+--min-seconds in the baseline are reported but never fail the gate —
+they are dominated by timer noise.
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+sys.path.insert(0, BENCH_DIR)
+
+import sovereign_paths  # noqa: F401,E402
+import generators  # noqa: E402
+
+BASELINE_DIR = os.path.join(BENCH_DIR, 'baselines')
+DEFAULT_BASELINE = os.path.join(BASELINE_DIR, 'baseline.json')
+DEFAULT_SCALES = (10, 1_000, 100_000, 1_000_000)
+
+
+@dataclass
+class BenchCase:
+    """One calculator path: setup(n) builds inputs (untimed), run(inputs) is measured"""
+    name: str
+    setup: Callable[[int], Any]
+    run: Callable[[Any], Any]
+    max_scale: int = 1_000_000
+    description: str = ''
+
+
+# ═══════════════════════════════════════════════════════════
+# CASES
+# ═══════════════════════════════════════════════════════════
+def _audit_v3(df):
+    from imperial_load_audit_v3 import audit_hospital_node
+    return audit_hospital_node(df, sq_ft=50_000, climate_zone='Chicago IL')
+
+
+def _audit_v3_validated(df):
+    from imperial_load_audit_v3 import audit_hospital_node
+    return audit_hospital_node(df, sq_ft=50_000, climate_zone='Chicago IL', validate='raise')
+
+
+def _audit_v2(circuits):
+    from vader_load_audit_v2 import check_n_plus_one_redundancy, imperial_load_audit_v2
+    return imperial_load_audit_v2(circuits, verbose=False), check_n_plus_one_redundancy(circuits)
+
+
+def _circuit_table(n):
+    from circuit_table import CircuitTable
+    return CircuitTable.from_frame(generators.panel_schedule(n))
+
+
+def _phase_balance(table):
+    from phase_balancer import balance_phases
+    return balance_phases(table)
+
+
+def _box_fill_scalar(box_list):
+    from box_fill_calculator import _box_fill_cached, box_fill_calculator
+    _box_fill_cached.cache_clear()
+    return [box_fill_calculator(**box) for box in box_list]
+
+
+def _box_fill_batch(boxes):
+    from box_fill_batch import box_fill_batch
+    return box_fill_batch(**boxes)
+
+
+def _manual_j_scalar(building_list):
+    from manual_j_thermal import manual_j_thermal_load
+    return [manual_j_thermal_load(b) for b in building_list]
+
+
+def _manual_j_array(buildings):
+    from manual_j_vectorized import manual_j_thermal_load_array
+    return manual_j_thermal_load_array(buildings)
+
+
+CASES: List[BenchCase] = [
+    BenchCase('audit_v3', generators.panel_schedule, _audit_v3,
+              description="audit_hospital_node on a DataFrame"),
+    BenchCase('audit_v3_valid', generators.panel_schedule, _audit_v3_validated,
+              description="audit_hospital_node with validate='raise'"),
+    BenchCase('audit_v2', generators.panel_circuits, _audit_v2, max_scale=100_000,
+              description="v2 audit + N+1 on a list of dicts"),
+    BenchCase('audit_v2_table', _circuit_table, _audit_v2,
+              description="v2 audit + N+1 on a CircuitTable"),
+    BenchCase('phase_balance', _circuit_table, _phase_balance,
+              description="balance_phases (LPT + local search) on a CircuitTable"),
+    BenchCase('box_fill', generators.box_list, _box_fill_scalar, max_scale=100_000,
+              description="box_fill_calculator per box (cold lru_cache)"),
+    BenchCase('box_fill_batch', generators.boxes, _box_fill_batch,
+              description="box_fill_batch on arrays"),
+    BenchCase('manual_j', generators.building_list, _manual_j_scalar, max_scale=100_000,
+              description="manual_j_thermal_load per building"),
+    BenchCase('manual_j_array', generators.buildings, _manual_j_array,
+              description="manual_j_thermal_load_array on arrays"),
+]
+
+
+# ═══════════════════════════════════════════════════════════
+# MEASUREMENT
+# ═══════════════════════════════════════════════════════════
+def measure(case: BenchCase, n: int, repeat: int) -> Dict[str, float]:
+    """Best-of-`repeat` wall time, then one traced run for peak memory"""
+    inputs = case.setup(n)
+    case.run(inputs)                     # warm imports and caches outside the timing
+    times = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        case.run(inputs)
+        times.append(time.perf_counter() - start)
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        case.run(inputs)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    best = min(times)
+    return {
+        'seconds': best,
+        'per_item_us': best / n * 1e6,
+        'peak_bytes': peak,
+    }
+
+
+def run_suite(scales, only: Optional[List[str]] = None, repeat: int = 3,
+              verbose: bool = True) -> Dict[str, Any]:
+    selected = [c for c in CASES if not only or c.name in only]
+    unknown = set(only or ()) - {c.name for c in CASES}
+    if unknown:
+        raise SystemExit(f"unknown case(s): {sorted(unknown)}; choose from {[c.name for c in CASES]}")
+
+    results: Dict[str, Dict[str, Any]] = {}
+    if verbose:
+        print(f"{'case':<16} {'n':>10} {'time (s)':>11} {'µs/item':>9} {'peak MB':>9}")
+    for case in selected:
+        results[case.name] = {}
+        for n in scales:
+            if n > case.max_scale:
+                continue
+            r = measure(case, n, repeat)
+            results[case.name][str(n)] = r
+            if verbose:
+                print(f"{case.name:<16} {n:>10,} {r['seconds']:>11.5f} {r['per_item_us']:>9.3f} "
+                      f"{r['peak_bytes'] / 1e6:>9.1f}", flush=True)
+    return {
+        'meta': {
+            'created': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'pandas': sys.modules['pandas'].__version__,
+            'machine': platform.machine(),
+            'processor': platform.processor() or platform.machine(),
+            'cpus': os.cpu_count(),
+            'repeat': repeat,
+        },
+        'results': results,
+    }
+
+
+def compare(baseline: Dict[str, Any], current: Dict[str, Any], threshold: float,
+            min_seconds: float, memory_threshold: Optional[float] = None) -> List[str]:
+    """Print a side-by-side table; return the regressions that fail the gate"""
+    failures = []
+    print(f"{'case':<16} {'n':>10} {'base (s)':>10} {'now (s)':>10} {'Δ time':>8} {'Δ peak':>8}")
+    for name, scales in baseline['results'].items():
+        for n, base in scales.items():
+            now = current['results'].get(name, {}).get(n)
+            if now is None:
+                continue
+            ratio = now['seconds'] / base['seconds'] - 1 if base['seconds'] else 0.0
+            mem = now['peak_bytes'] / base['peak_bytes'] - 1 if base['peak_bytes'] else 0.0
+            flag = ''
+            if ratio > threshold and base['seconds'] >= min_seconds:
+                flag = '❌ slower'
+                failures.append(f"{name}[n={n}] {ratio:+.0%} time")
+            elif ratio > threshold:
+                flag = '(noise floor)'
+            if memory_threshold is not None and mem > memory_threshold:
+                flag = (flag + ' ❌ memory').strip()
+                failures.append(f"{name}[n={n}] {mem:+.0%} peak memory")
+            print(f"{name:<16} {int(n):>10,} {base['seconds']:>10.5f} {now['seconds']:>10.5f} "
+                  f"{ratio:>+8.0%} {mem:>+8.0%}  {flag}")
+    return failures
+
+
+def _scales_of(report: Dict[str, Any]) -> List[int]:
+    return sorted({int(n) for scales in report['results'].values() for n in scales})
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    p = sub.add_parser('run', help="run the suite")
+    p.add_argument('--scales', type=int, nargs='+', default=list(DEFAULT_SCALES))
+    p.add_argument('--only', nargs='+', help="case names to run")
+    p.add_argument('--repeat', type=int, default=3)
+    p.add_argument('--output', metavar='JSON', help="write results here")
+    p.add_argument('--save', action='store_true', help=f"write {os.path.relpath(DEFAULT_BASELINE)}")
+
+    p = sub.add_parser('compare', help="compare a run against a baseline")
+    p.add_argument('--baseline', default=DEFAULT_BASELINE)
+    p.add_argument('--current', metavar='JSON', help="existing results (default: run now)")
+    p.add_argument('--only', nargs='+')
+    p.add_argument('--repeat', type=int, default=3)
+    p.add_argument('--threshold', type=float, default=0.25, help="allowed slowdown (0.25 = 25%%)")
+    p.add_argument('--min-seconds', type=float, default=0.01)
+    p.add_argument('--memory-threshold', type=float, default=None,
+                   help="also fail on peak-memory growth above this fraction")
+
+    p = sub.add_parser('list', help="list benchmark cases")
+    args = parser.parse_args()
+
+    if args.command == 'list':
+        for case in CASES:
+            print(f"{case.name:<16} ≤{case.max_scale:>9,}  {case.description}")
+        return 0
+
+    if args.command == 'run':
+        report = run_suite(args.scales, args.only, args.repeat)
+        for path in filter(None, [args.output, DEFAULT_BASELINE if args.save else None]):
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+            with open(path, 'w') as f:
+                json.dump(report, f, indent=2)
+                f.write('\n')
+            print(f"📊 Results saved: {path}")
+        return 0
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    if args.current:
+        with open(args.current) as f:
+            current = json.load(f)
+    else:
+        only = args.only or list(baseline['results'])
+        current = run_suite(_scales_of(baseline), only, args.repeat, verbose=False)
+    print(f"baseline: {args.baseline} ({baseline['meta']['created']}, "
+          f"{baseline['meta']['processor']}, Python {baseline['meta']['python']})")
+    failures = compare(baseline, current, args.threshold, args.min_seconds, args.memory_threshold)
+    if failures:
+        print(f"❌ {len(failures)} regression(s) past {args.threshold:.0%}: " + '; '.join(failures))
+        return 1
+    print(f"✅ no regressions past {args.threshold:.0%}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
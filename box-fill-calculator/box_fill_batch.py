@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Box Fill Calculator - Batch Mode (NEC 314.16)
+=============================================
+Sizes every junction box in a building model in one vectorized pass.
+Takes arrays (or scalars, broadcast) of the box_fill_calculator
+arguments and returns arrays of the same results.
+
+"Ten thousand boxes. One breath."
+"""
+
+from typing import Any, Dict
+
+import numpy as np
+
+from box_fill_calculator import STANDARD_BOXES, VOLUME_PER_CONDUCTOR
+
+
+# Dense AWG → cu in lookup (unknown sizes fall back to 12 AWG, as the scalar version does)
+_AWG_VOLUME = np.full(max(VOLUME_PER_CONDUCTOR) + 1, 2.25)
+for _awg, _volume in VOLUME_PER_CONDUCTOR.items():
+    _AWG_VOLUME[_awg] = _volume
+
+# Sorted-volume index for np.searchsorted
+_ORDER = np.argsort([volume for _, volume in STANDARD_BOXES], kind='stable')
+_BOX_VOLUMES = np.array([STANDARD_BOXES[i][1] for i in _ORDER])
+_BOX_NAMES = np.array([STANDARD_BOXES[i][0] for i in _ORDER] + ['CUSTOM BOX REQUIRED'], dtype=object)
+
+
+def awg_volume(largest_awg) -> np.ndarray:
+    """Vectorized VOLUME_PER_CONDUCTOR.get(awg, 2.25) — 12.0 counts as 12, 12.5 as unknown"""
+    awg = np.asarray(largest_awg, dtype=np.float64)
+    known = (awg >= 0) & (awg < len(_AWG_VOLUME)) & (awg == np.floor(awg))
+    index = np.where(known, awg, 0).astype(np.int64)
+    return np.where(known, _AWG_VOLUME[index], 2.25)
+
+
+def _counts(values: np.ndarray, name: str) -> np.ndarray:
+    """Integer counts; 3.0 is fine, 2.5 raises instead of being truncated"""
+    if values.dtype.kind in 'iub':
+        return values.astype(np.int64)
+    as_float = values.astype(np.float64)
+    whole = np.isfinite(as_float) & (as_float == np.floor(as_float))
+    if not whole.all():
+        raise ValueError(f"{name} must be whole numbers, got {as_float[~whole][:5].tolist()}")
+    return as_float.astype(np.int64)
+
+
+def required_volume(conductors, largest_awg=12, devices=1, grounds=True, clamps=True, fittings=0):
+    """
+    Vectorized NEC 314.16 allowance math
+
+    Raises:
+        ValueError: conductors, devices or fittings are not whole numbers
+
+    Returns:
+        (total_allowances, conductor_volume_per_unit, required_cubic_inches) arrays
+    """
+    conductors, largest_awg, devices, grounds, clamps, fittings = np.broadcast_arrays(
+        conductors, largest_awg, devices, grounds, clamps, fittings
+    )
+
+    allowances = (
+        _counts(conductors, 'conductors')
+        + grounds.astype(bool)
+        + _counts(devices, 'devices') * 2
+        + clamps.astype(bool)
+        + _counts(fittings, 'fittings')
+    )
+    volume_per_cond = awg_volume(largest_awg)
+    return allowances, volume_per_cond, allowances * volume_per_cond
+
+
+def box_fill_batch(
+    conductors,
+    largest_awg=12,
+    devices=1,
+    grounds=True,
+    clamps=True,
+    fittings=0
+) -> Dict[str, Any]:
+    """
+    NEC 314.16 box fill for many boxes at once
+
+    Args:
+        conductors, largest_awg, devices, grounds, clamps, fittings:
+            Arrays (or scalars) with the same meaning as box_fill_calculator;
+            all arguments are broadcast together
+
+    Returns:
+        Dictionary of arrays keyed like box_fill_calculator's result, plus
+        'box_index' (position in the sorted standard-box index, or -1) and
+        'compliant' (bool)
+    """
+    allowances, volume_per_cond, required = required_volume(
+        conductors, largest_awg, devices, grounds, clamps, fittings
+    )
+
+    box_index = np.searchsorted(_BOX_VOLUMES, required, side='left')
+    compliant = box_index < len(_BOX_VOLUMES)
+
+    return {
+        'total_allowances': allowances,
+        'conductor_volume_per_unit': volume_per_cond,
+        'required_cubic_inches': np.round(required, 2),
+        'recommended_box': _BOX_NAMES[box_index],
+        'compliance': np.where(compliant, 'NEC 314.16 COMPLIANT', 'OVERFILLED - VIOLATION'),
+        'box_index': np.where(compliant, box_index, -1),
+        'compliant': compliant,
+    }
+
+
+def box_fill_frame(df):
+    """
+    Batch box fill for a DataFrame of boxes
+
+    Columns match box_fill_calculator's argument names; missing optional
+    columns take the scalar defaults. Returns a copy with result columns.
+    """
+    defaults = {'largest_awg': 12, 'devices': 1, 'grounds': True, 'clamps': True, 'fittings': 0}
+    args = {k: df[k].to_numpy() if k in df.columns else v for k, v in defaults.items()}
+    results = box_fill_batch(df['conductors'].to_numpy(), **args)
+    out = df.copy()
+    for key in ('total_allowances', 'required_cubic_inches', 'recommended_box', 'compliance'):
+        out[key] = results[key]
+    return out
+
+
+if __name__ == '__main__':
+    import time
+
+    from box_fill_calculator import box_fill_calculator
+
+    rng = np.random.default_rng(314)
+    n = 100_000
+    boxes = dict(
+        conductors=rng.integers(2, 10, size=n),
+        largest_awg=rng.choice([14, 12, 10], size=n),
+        devices=rng.integers(0, 3, size=n),
+        grounds=rng.random(n) < 0.9,
+        clamps=rng.random(n) < 0.5,
+        fittings=rng.integers(0, 2, size=n),
+    )
+
+    start = time.perf_counter()
+    batch = box_fill_batch(**boxes)
+    batch_t = time.perf_counter() - start
+
+    start = time.perf_counter()
+    scalar = [box_fill_calculator(*(int(boxes[k][i]) for k in boxes)) for i in range(n)]
+    scalar_t = time.perf_counter() - start
+
+    assert all(batch['recommended_box'][i] == scalar[i]['recommended_box'] for i in range(n))
+    print(f"{n:,} boxes — batch {batch_t:.4f} s, scalar (cached) {scalar_t:.3f} s")
+    print(f"Overfilled: {int((~batch['compliant']).sum()):,}")
@@ -5,7 +5,9 @@ Box Fill Calculator - NEC 314.16 Compliance
 "The box must have room to breathe, or the heat will consume you."
 """
 
-from typing import Dict, List, Any
+from bisect import bisect_left
+from functools import lru_cache
+from typing import Dict, List, Any, Optional, Tuple
 
 
 # NEC Table 314.16(B) - Volume allowance per conductor (cubic inches)
@@ -32,6 +34,16 @@ STANDARD_BOXES = [
     ('4-11/16" × 2.125"', 60.0),
 ]
 
+# Sorted-volume index: the smallest fitting box is one bisect away
+_BOXES_BY_VOLUME = sorted(STANDARD_BOXES, key=lambda box: box[1])
+_BOX_VOLUMES = [volume for _, volume in _BOXES_BY_VOLUME]
+
+
+def select_standard_box(required_cu_in: float) -> Optional[str]:
+    """Smallest standard box with at least the required volume (None if none fits)"""
+    i = bisect_left(_BOX_VOLUMES, required_cu_in)
+    return _BOXES_BY_VOLUME[i][0] if i < len(_BOXES_BY_VOLUME) else None
+
 
 def box_fill_calculator(
     conductors: int,
@@ -55,6 +67,29 @@ def box_fill_calculator(
     Returns:
         Dictionary with total allowances, required volume, recommended box
     """
+    allowances, volume_per_cond, required_cu_in, recommended_box = _box_fill_cached(
+        conductors, largest_awg, devices, bool(grounds), bool(clamps), fittings
+    )
+    
+    return {
+        'total_allowances': allowances,
+        'conductor_volume_per_unit': volume_per_cond,
+        'required_cubic_inches': round(required_cu_in, 2),
+        'recommended_box': recommended_box if recommended_box else 'CUSTOM BOX REQUIRED',
+        'compliance': 'NEC 314.16 COMPLIANT' if recommended_box else 'OVERFILLED - VIOLATION'
+    }
+
+
+@lru_cache(maxsize=4096)
+def _box_fill_cached(
+    conductors: int,
+    largest_awg: int,
+    devices: int,
+    grounds: bool,
+    clamps: bool,
+    fittings: int
+) -> Tuple[int, float, float, Optional[str]]:
+    """Core calculation, memoized — identical box configurations repeat constantly"""
     # Calculate total volume allowances
     allowances = conductors
     
@@ -77,19 +112,7 @@ def box_fill_calculator(
     required_cu_in = allowances * volume_per_cond
     
     # Find minimum standard box
-    recommended_box = None
-    for box_name, volume in STANDARD_BOXES:
-        if volume >= required_cu_in:
-            recommended_box = box_name
-            break
-    
-    return {
-        'total_allowances': allowances,
-        'conductor_volume_per_unit': volume_per_cond,
-        'required_cubic_inches': round(required_cu_in, 2),
-        'recommended_box': recommended_box if recommended_box else 'CUSTOM BOX REQUIRED',
-        'compliance': 'NEC 314.16 COMPLIANT' if recommended_box else 'OVERFILLED - VIOLATION'
-    }
+    return allowances, volume_per_cond, required_cu_in, select_standard_box(required_cu_in)
 
 
 def print_box_fill_report(results: Dict[str, Any]) -> None:
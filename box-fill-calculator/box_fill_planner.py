@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+"""
+Box Fill Planner - Whole-Floor Box Sizing (NEC 314.16)
+======================================================
+Assigns a box to every junction box on a floor at once, minimizing total
+box volume or cost from a configurable catalog, with every box meeting
+its NEC 314.16 required volume.
+
+• Unlimited box types: after pruning dominated catalog entries, the
+  smallest fitting box is also the cheapest, so one searchsorted pass
+  is optimal.
+• Limited box types (max_box_types=k, for standardized purchasing):
+  exact dynamic program over the sorted catalog — O(k · m²) in the
+  catalog size m, independent of the number of boxes on the floor.
+
+"Order the boxes as one. Waste no cubic inch."
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from box_fill_batch import required_volume
+from box_fill_calculator import STANDARD_BOXES
+
+
+OBJECTIVES = ('volume', 'cost')
+
+
+@dataclass(frozen=True)
+class BoxSpec:
+    """One purchasable box: trade name, usable volume (cu in), unit cost"""
+    name: str
+    volume: float
+    cost: Optional[float] = None
+
+
+def build_catalog(extra_boxes: Iterable[Sequence[Any]] = (),
+                  costs: Optional[Dict[str, float]] = None) -> List[BoxSpec]:
+    """
+    STANDARD_BOXES plus site-specific boxes
+
+    Args:
+        extra_boxes: (name, volume) or (name, volume, cost) tuples, e.g.
+            deep device boxes or boxes with plaster rings / extension rings
+        costs: Unit cost by box name (applies to standard and extra boxes)
+    """
+    costs = costs or {}
+    catalog = [BoxSpec(name, volume, costs.get(name)) for name, volume in STANDARD_BOXES]
+    for entry in extra_boxes:
+        name, volume = entry[0], entry[1]
+        cost = entry[2] if len(entry) > 2 else costs.get(name)
+        catalog.append(BoxSpec(name, float(volume), cost))
+    _check_unique_names(catalog)
+    return catalog
+
+
+def _check_unique_names(catalog: List[BoxSpec]) -> None:
+    """Box names key the plan's type list and counts, so they must be unique"""
+    seen, duplicates = set(), []
+    for box in catalog:
+        if box.name in seen and box.name not in duplicates:
+            duplicates.append(box.name)
+        seen.add(box.name)
+    if duplicates:
+        raise ValueError(f"Duplicate box names in catalog: {duplicates}")
+
+
+@dataclass
+class FloorPlan:
+    """Box assignment for a whole floor"""
+    required_cubic_inches: np.ndarray
+    box_index: np.ndarray            # index into `catalog`, -1 = custom box required
+    catalog: List[BoxSpec]
+    objective: str
+    box_types: List[str] = field(default_factory=list)
+
+    @property
+    def assigned_boxes(self) -> np.ndarray:
+        names = np.array([b.name for b in self.catalog] + ['CUSTOM BOX REQUIRED'], dtype=object)
+        return names[self.box_index]
+
+    @property
+    def compliant(self) -> np.ndarray:
+        return self.box_index >= 0
+
+    def _catalog_array(self, attr: str) -> np.ndarray:
+        values = [getattr(b, attr) if getattr(b, attr) is not None else b.volume for b in self.catalog]
+        return np.array(values + [0.0])
+
+    @property
+    def total_volume(self) -> float:
+        return float(self._catalog_array('volume')[self.box_index].sum())
+
+    @property
+    def total_cost(self) -> float:
+        return float(self._catalog_array('cost')[self.box_index].sum())
+
+    def box_counts(self) -> Dict[str, int]:
+        names, counts = np.unique(self.assigned_boxes.astype(str), return_counts=True)
+        return {str(n): int(c) for n, c in zip(names, counts)}
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            'boxes': int(len(self.box_index)),
+            'objective': self.objective,
+            'total_volume_cu_in': round(self.total_volume, 2),
+            'total_cost': round(self.total_cost, 2),
+            'box_types': self.box_types,
+            'box_counts': self.box_counts(),
+            'custom_boxes_required': int((~self.compliant).sum()),
+        }
+
+
+def _pruned_catalog(catalog: List[BoxSpec], objective: str) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Drop dominated boxes (another box is at least as large and no dearer)
+
+    Returns (catalog indices, volumes, values) sorted by volume, with
+    values strictly increasing — so "smallest fitting" == "cheapest fitting".
+    """
+    volumes = np.array([b.volume for b in catalog], dtype=np.float64)
+    if objective == 'cost':
+        values = np.array([b.cost if b.cost is not None else b.volume for b in catalog], dtype=np.float64)
+    else:
+        values = volumes.copy()
+
+    # Largest volume first; on equal volume the cheaper entry first
+    order = np.lexsort((values, -volumes))
+    keep = []
+    best = np.inf
+    for i in order:
+        if values[i] < best:
+            keep.append(i)
+            best = values[i]
+    keep = np.array(keep[::-1], dtype=np.int64)
+    return keep, volumes[keep], values[keep]
+
+
+def _choose_box_types(demand: np.ndarray, values: np.ndarray, k: int) -> np.ndarray:
+    """
+    Exact DP: pick ≤ k catalog slots minimizing Σ value(assigned box)
+
+    demand[i] = boxes whose smallest fitting slot is i. Each box goes to
+    the smallest chosen slot ≥ i. Returns the chosen slot indices.
+    """
+    m = len(values)
+    needed = np.flatnonzero(demand)
+    if len(needed) == 0:
+        return np.array([], dtype=np.int64)
+    top = needed[-1]
+    cum = np.concatenate(([0], np.cumsum(demand)))   # cum[j + 1] = Σ demand[0..j]
+
+    # f[j] = best cost covering demand[0..j] with slot j as the largest chosen
+    f = values * cum[1:]
+    # parents[t][j]: previous chosen slot for the (t+1)-slot plan, or -1 when
+    # that plan is just the t-slot plan ending at j
+    parents = [np.full(m, -1, dtype=np.int64)]
+    for _ in range(2, k + 1):
+        g = f.copy()
+        parent = np.full(m, -1, dtype=np.int64)
+        for j in range(1, top + 1):
+            # Cover demand (p, j] with slot j, the rest with the best plan ending at p
+            candidates = f[:j] + values[j] * (cum[j + 1] - cum[1:j + 1])
+            p = int(np.argmin(candidates))
+            if candidates[p] < g[j]:
+                g[j], parent[j] = candidates[p], p
+        parents.append(parent)
+        f = g
+
+    chosen = [top]
+    j = top
+    for parent in reversed(parents[1:]):
+        if parent[j] >= 0:
+            j = int(parent[j])
+            chosen.append(j)
+    return np.array(sorted(chosen), dtype=np.int64)
+
+
+def plan_floor_boxes(
+    boxes,
+    catalog: Optional[List[BoxSpec]] = None,
+    objective: str = 'volume',
+    max_box_types: Optional[int] = None,
+) -> FloorPlan:
+    """
+    Size every box on a floor together
+
+    Args:
+        boxes: DataFrame or dict of arrays with box_fill_calculator's
+            argument names (conductors required; others default as in
+            box_fill_calculator)
+        catalog: Box catalog (default: build_catalog() = STANDARD_BOXES)
+        objective: 'volume' or 'cost' (entries without cost use volume)
+        max_box_types: Limit the number of distinct box types on the floor
+
+    Raises:
+        ValueError: bad objective / max_box_types, or duplicate box names
+
+    Returns:
+        FloorPlan with the per-box assignment and totals
+    """
+    if objective not in OBJECTIVES:
+        raise ValueError(f"objective must be one of {OBJECTIVES}, got {objective!r}")
+    if max_box_types is not None and max_box_types < 1:
+        raise ValueError("max_box_types must be at least 1")
+    catalog = catalog or build_catalog()
+    _check_unique_names(catalog)
+
+    columns = ('conductors', 'largest_awg', 'devices', 'grounds', 'clamps', 'fittings')
+    args = {k: np.asarray(boxes[k]) for k in columns if k in boxes}
+    _, _, required = required_volume(**args)
+    required = np.atleast_1d(required)
+
+    keep, volumes, values = _pruned_catalog(catalog, objective)
+    slot = np.searchsorted(volumes, required, side='left')
+    fits = slot < len(volumes)
+
+    if max_box_types is not None:
+        demand = np.bincount(slot[fits], minlength=len(volumes))
+        chosen = _choose_box_types(demand, values, max_box_types)
+        if len(chosen):
+            slot[fits] = chosen[np.searchsorted(chosen, slot[fits], side='left')]
+
+    box_index = np.where(fits, keep[np.where(fits, slot, 0)], -1)
+    used = [catalog[i].name for i in sorted(np.unique(box_index[fits]), key=lambda i: catalog[i].volume)]
+    return FloorPlan(required, box_index, catalog, objective, used)
+
+
+def print_floor_plan_report(plan: FloorPlan) -> None:
+    """Print formatted floor plan report"""
+    summary = plan.summary()
+    print()
+    print("=" * 50)
+    print("FLOOR BOX PLAN - NEC 314.16")
+    print("=" * 50)
+    print(f"Boxes: {summary['boxes']:,}")
+    print(f"Total Volume: {summary['total_volume_cu_in']:,.1f} cu in")
+    print(f"Total Cost: {summary['total_cost']:,.2f}")
+    for name, count in summary['box_counts'].items():
+        print(f"  {name}: {count:,}")
+    if summary['custom_boxes_required']:
+        print(f"⚠️  Custom boxes required: {summary['custom_boxes_required']:,}")
+    print("=" * 50)
+
+
+# Example usage
+if __name__ == '__main__':
+    rng = np.random.default_rng(314)
+    n = 2_000
+    floor = dict(
+        conductors=rng.integers(2, 9, size=n),
+        largest_awg=rng.choice([14, 12], size=n),
+        devices=rng.integers(0, 3, size=n),
+        grounds=np.ones(n, dtype=bool),
+        clamps=rng.random(n) < 0.5,
+    )
+    catalog = build_catalog(
+        extra_boxes=[('3" × 2" × 3.5" device', 18.0, 0.95)],
+        costs={'4" × 1.5" round': 1.10, '4" × 2.0" round': 1.35, '4" × 2.125" square': 1.60,
+               '4" × 2.5" square': 2.10, '4-11/16" × 2.125"': 3.40},
+    )
+    print_floor_plan_report(plan_floor_boxes(floor, catalog, objective='cost'))
+    print_floor_plan_report(plan_floor_boxes(floor, catalog, objective='cost', max_box_types=2))
@@ -0,0 +1,317 @@
+#!/usr/bin/env python3
+"""
+Audit IO - Columnar Schedules, Per-Circuit Results and Summaries
+================================================================
+Readers and writers for moving audit data between runs and BI tools
+without re-parsing text or re-running audits.
+
+Schedules (CircuitTable in / out):
+    .parquet            Apache Parquet (compressed, typed)
+    .arrow / .feather   Arrow IPC — numeric columns memory-map zero-copy
+    .jsonl              one circuit per line
+    .csv / .json        existing text formats
+    read_schedule_frame keeps extra columns (panel, ...) as a DataFrame
+
+Results:
+    write_circuit_results   per-circuit frame (va, critical flag, ...)
+    write_audit_summaries   one flat row per facility (.json/.jsonl/.parquet/.csv)
+    read_audit_summaries    load those rows back as a DataFrame
+
+pyarrow is only imported for Parquet/Arrow files.
+
+"Write it once. Read it at lightspeed."
+"""
+
+import dataclasses
+import json
+import os
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from circuit_table import CONTINUOUS, PHASES, THREE_PHASE, Circuit, CircuitTable, read_schedule_csv
+from panel_schedule import ARROW_EXTENSIONS, COLUMNAR_EXTENSIONS, PARQUET_EXTENSIONS  # noqa: F401
+
+# Columns a CircuitTable holds; anything else in a file is an extra column
+SCHEDULE_COLUMNS = tuple(f.name for f in dataclasses.fields(Circuit))
+
+
+def _ext(path: str) -> str:
+    return os.path.splitext(path)[1].lower()
+
+
+def _numpy_column(table, name: str, dtype) -> np.ndarray:
+    """Arrow column → NumPy, zero-copy when it is one null-free chunk of the right type"""
+    column = table.column(name)
+    if column.num_chunks == 1 and column.null_count == 0:
+        chunk = column.chunk(0)
+        if chunk.type.to_pandas_dtype() == dtype:
+            return chunk.to_numpy(zero_copy_only=True)
+    return np.asarray(column.to_numpy(), dtype=dtype)
+
+
+def _phase_labels(values):
+    """Arrow phase labels → trimmed upper-case strings, blanks/nulls as 'A' (panel_schedule.normalize_phase)"""
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    labels = pc.utf8_upper(pc.utf8_trim_whitespace(pc.cast(pc.fill_null(values, 'A'), pa.string())))
+    return pc.if_else(pc.equal(labels, ''), 'A', labels)
+
+
+# ═══════════════════════════════════════════════════════════
+# SCHEDULES
+# ═══════════════════════════════════════════════════════════
+def table_from_arrow(table) -> CircuitTable:
+    """pyarrow.Table with the schedule columns → CircuitTable"""
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    n = table.num_rows
+    columns = set(table.column_names)
+
+    if 'phases' in columns:
+        three_phase = pc.fill_null(pc.equal(table.column('phases'), 3), False)
+        three_phase = three_phase.to_numpy(zero_copy_only=False)
+    else:
+        three_phase = np.zeros(n, dtype=bool)
+
+    if 'continuous' in columns:
+        col = table.column('continuous')
+        if pa.types.is_boolean(col.type):
+            continuous = pc.fill_null(col, False).to_numpy(zero_copy_only=False)
+        else:
+            return CircuitTable.from_frame(table.to_pandas(), normalize_labels=True)
+    else:
+        continuous = np.zeros(n, dtype=bool)
+
+    if 'phase' in columns:
+        column = table.column('phase')
+        if pa.types.is_dictionary(column.type) and column.null_count == 0:
+            # Normalize the (tiny) dictionary once, then gather by index
+            column = column.combine_chunks() if column.num_chunks != 1 else column.chunk(0)
+            labels = _phase_labels(column.dictionary)
+            indices = column.indices.to_numpy(zero_copy_only=False)
+        else:
+            labels = _phase_labels(column)
+            indices = None
+        codes = pc.index_in(labels, value_set=pa.array(PHASES)).to_numpy(zero_copy_only=False)
+        unknown = np.isnan(codes) if codes.dtype.kind == 'f' else codes < 0
+        codes = np.where(unknown, 0, np.nan_to_num(codes)).astype(np.uint8)
+        if indices is not None:
+            codes, unknown = codes[indices], unknown[indices]
+        bad = unknown & ~three_phase
+        if bad.any():
+            found = np.asarray(labels.to_numpy(zero_copy_only=False))
+            found = sorted(set(found[indices[bad]] if indices is not None else found[bad]))
+            raise ValueError(f"Unknown phase label(s) {found}; expected one of {PHASES}")
+        phase_code = codes
+    else:
+        phase_code = np.zeros(n, dtype=np.uint8)
+
+    flags = continuous.astype(np.uint8) * CONTINUOUS | three_phase.astype(np.uint8) * THREE_PHASE
+    if 'circuit_name' in columns:
+        names = table.column('circuit_name').to_numpy(zero_copy_only=False)
+    else:
+        names = np.array([f'CKT-{i}' for i in range(n)], dtype=object)
+    return CircuitTable(
+        names,
+        _numpy_column(table, 'voltage', np.float64),
+        _numpy_column(table, 'amps', np.float64),
+        phase_code,
+        flags,
+    )
+
+
+def table_to_arrow(table: CircuitTable):
+    """CircuitTable → pyarrow.Table (phase dictionary-encoded)"""
+    import pyarrow as pa
+
+    return pa.table({
+        'circuit_name': pa.array(table.names, type=pa.string()),
+        'voltage': table.voltage,
+        'amps': table.amps,
+        'phases': np.where(table.three_phase, 3, 1).astype(np.int8),
+        'continuous': table.continuous,
+        'phase': pa.DictionaryArray.from_arrays(
+            table.phase_code.astype(np.int8), pa.array(PHASES)),
+    })
+
+
+def _read_raw_schedule(path: str, memory_map: bool):
+    """Schedule file → pyarrow.Table (columnar) or DataFrame (text), every column kept"""
+    ext = _ext(path)
+    if ext in PARQUET_EXTENSIONS:
+        import pyarrow.parquet as pq
+        return pq.read_table(path, memory_map=memory_map)
+    if ext in ARROW_EXTENSIONS:
+        import pyarrow as pa
+        source = pa.memory_map(path) if memory_map else pa.OSFile(path)
+        return pa.ipc.open_file(source).read_all()
+    if ext == '.csv':
+        return read_schedule_csv(path)
+    if ext == '.jsonl':
+        return pd.read_json(path, lines=True)
+    if ext == '.json':
+        with open(path) as f:
+            data = json.load(f)
+        if isinstance(data, dict):
+            data = data['circuits']
+        return pd.DataFrame(data)
+    raise ValueError(f"Unsupported panel schedule format: {path}")
+
+
+def _to_table(raw) -> CircuitTable:
+    if isinstance(raw, pd.DataFrame):
+        return CircuitTable.from_frame(raw, normalize_labels=True)
+    return table_from_arrow(raw)
+
+
+def read_schedule_table(path: str, memory_map: bool = True) -> CircuitTable:
+    """
+    Load a panel schedule of any supported format as a CircuitTable
+
+    Arrow IPC files are memory-mapped, so voltage/amps arrays point
+    straight into the page cache.
+    """
+    return _to_table(_read_raw_schedule(path, memory_map))
+
+
+def read_schedule_frame(path: str, memory_map: bool = True) -> pd.DataFrame:
+    """
+    Load a panel schedule as a DataFrame: the typed schedule columns (as
+    CircuitTable.to_frame) plus every extra column in the file — panel,
+    position, schedule, ... — which a CircuitTable does not carry
+    """
+    raw = _read_raw_schedule(path, memory_map)
+    df = _to_table(raw).to_frame()
+    if isinstance(raw, pd.DataFrame):
+        extra = raw[[c for c in raw.columns if c not in SCHEDULE_COLUMNS]]
+    else:
+        extra = raw.select([c for c in raw.column_names if c not in SCHEDULE_COLUMNS]).to_pandas()
+    for column in extra.columns:
+        df[column] = extra[column].to_numpy()
+    return df
+
+
+def write_schedule_table(table, path: str, compression: Optional[str] = 'auto') -> str:
+    """
+    Write a schedule (CircuitTable, DataFrame or circuit list) to any supported format
+
+    Args:
+        compression: Parquet/Arrow codec, or None for uncompressed. 'auto'
+            is zstd for Parquet and None for Arrow IPC, because compressed
+            IPC buffers must be decoded into memory and cannot be mapped
+    """
+    if not isinstance(table, CircuitTable):
+        table = CircuitTable.from_frame(table) if isinstance(table, pd.DataFrame) \
+            else CircuitTable.from_circuits(table)
+    ext = _ext(path)
+    if ext in PARQUET_EXTENSIONS:
+        import pyarrow.parquet as pq
+        codec = 'zstd' if compression == 'auto' else compression
+        pq.write_table(table_to_arrow(table), path, compression=codec or 'none')
+    elif ext in ARROW_EXTENSIONS:
+        import pyarrow as pa
+        options = pa.ipc.IpcWriteOptions(compression=None if compression == 'auto' else compression)
+        arrow = table_to_arrow(table)
+        with pa.OSFile(path, 'wb') as sink, pa.ipc.new_file(sink, arrow.schema, options=options) as writer:
+            writer.write_table(arrow)
+    elif ext == '.jsonl':
+        table.to_frame().to_json(path, orient='records', lines=True)
+    elif ext == '.json':
+        table.to_frame().to_json(path, orient='records')
+    elif ext == '.csv':
+        table.to_frame().to_csv(path, index=False)
+    else:
+        raise ValueError(f"Unsupported panel schedule format: {path}")
+    return path
+
+
+# ═══════════════════════════════════════════════════════════
+# RESULTS
+# ═══════════════════════════════════════════════════════════
+def _write_frame(df: pd.DataFrame, path: str) -> str:
+    ext = _ext(path)
+    if ext in PARQUET_EXTENSIONS:
+        df.to_parquet(path, index=False)
+    elif ext in ARROW_EXTENSIONS:
+        df.reset_index(drop=True).to_feather(path)
+    elif ext == '.jsonl':
+        df.to_json(path, orient='records', lines=True)
+    elif ext == '.json':
+        df.to_json(path, orient='records', indent=2)
+    elif ext == '.csv':
+        df.to_csv(path, index=False)
+    else:
+        raise ValueError(f"Unsupported output format: {path}")
+    return path
+
+
+def write_circuit_results(result, path: str) -> str:
+    """
+    Per-circuit audit rows (schedule columns + va + critical flag)
+
+    Args:
+        result: HospitalAuditResult, or a DataFrame that already has a va column
+    """
+    df = getattr(result, 'df', result).copy()
+    critical = getattr(result, 'critical_circuits', None)
+    if critical is not None:
+        df['critical'] = df.index.isin(critical.index)
+    return _write_frame(df, path)
+
+
+def flatten_summary(summary: Dict[str, Any], prefix: str = '') -> Dict[str, Any]:
+    """Nested summary dict → one flat row (dotted keys, lists as JSON text)"""
+    row: Dict[str, Any] = {}
+    for key, value in summary.items():
+        name = f'{prefix}{key}'
+        if isinstance(value, dict):
+            row.update(flatten_summary(value, prefix=f'{name}.'))
+        elif isinstance(value, (list, tuple)):
+            row[name] = json.dumps(value)
+        else:
+            row[name] = value
+    return row
+
+
+def write_audit_summaries(summaries: Iterable[Any], path: str) -> str:
+    """
+    One row per audited facility, ready for BI tools
+
+    Args:
+        summaries: summary dicts, HospitalAuditResults, or FacilityAudits
+            from imperial_batch_audit (name / ok / error are kept)
+    """
+    rows: List[Dict[str, Any]] = []
+    for item in summaries:
+        if hasattr(item, 'ok') and hasattr(item, 'summary') and isinstance(item.summary, dict):
+            row = {'facility': item.name, 'ok': item.ok, 'error': item.error}
+            row.update(flatten_summary(item.summary))
+        elif hasattr(item, 'summary'):
+            row = flatten_summary(item.summary())
+        else:
+            row = flatten_summary(item)
+        rows.append(row)
+
+    if _ext(path) == '.json':
+        with open(path, 'w') as f:
+            json.dump(rows, f, indent=2, default=str)
+        return path
+    return _write_frame(pd.DataFrame(rows), path)
+
+
+def read_audit_summaries(path: str) -> pd.DataFrame:
+    """Load an exported summary file back into a DataFrame"""
+    ext = _ext(path)
+    if ext in PARQUET_EXTENSIONS:
+        return pd.read_parquet(path)
+    if ext in ARROW_EXTENSIONS:
+        return pd.read_feather(path)
+    if ext in ('.json', '.jsonl'):
+        return pd.read_json(path, lines=ext == '.jsonl')
+    if ext == '.csv':
+        return pd.read_csv(path)
+    raise ValueError(f"Unsupported summary format: {path}")
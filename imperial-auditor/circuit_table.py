@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+Circuit Records - Compact Typed Panel Schedules
+===============================================
+Two representations that both auditors accept in place of
+List[Dict[str, Any]]:
+
+• Circuit       one slotted record per circuit (no per-instance __dict__)
+• CircuitTable  column arrays — float64 voltage/amps, uint8 phase code,
+                uint8 packed flags — for schedules with millions of rows
+
+CircuitTable.from_csv / from_json load files straight into the arrays
+without building a dict per row.
+
+"Pack the circuits tight. Waste nothing."
+"""
+
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from panel_schedule import TRUE_STRINGS
+
+
+PHASES = ('A', 'B', 'C')
+
+# Packed flag bits
+CONTINUOUS = 0x01
+THREE_PHASE = 0x02
+
+_TRUE_STRINGS = sorted(TRUE_STRINGS)
+
+
+def read_schedule_csv(path: str, **read_csv_kwargs) -> pd.DataFrame:
+    """Raw CSV schedule frame, parsed the way from_csv needs it (extra columns kept)"""
+    return pd.read_csv(path, dtype={'voltage': np.float64, 'amps': np.float64,
+                                    'circuit_name': str, 'phase': str},
+                       keep_default_na=False, na_values={'phases': ['']}, **read_csv_kwargs)
+
+
+@dataclass(slots=True)
+class Circuit:
+    """One branch circuit (same fields as the schedule dictionaries)"""
+    circuit_name: str
+    voltage: float
+    amps: float
+    phases: int = 1
+    continuous: bool = False
+    phase: str = 'A'
+
+    # Mapping-style access so code written for dicts keeps working
+    def __getitem__(self, key: str) -> Any:
+        return getattr(self, key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return getattr(self, key, default)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+class CircuitTable:
+    """
+    Column-oriented panel schedule
+
+    Attributes:
+        names: object array of circuit names
+        voltage: float64 array
+        amps: float64 array
+        phase_code: uint8 array (0=A, 1=B, 2=C; ignored for 3-phase rows)
+        flags: uint8 array of CONTINUOUS | THREE_PHASE bits
+    """
+
+    __slots__ = ('names', 'voltage', 'amps', 'phase_code', 'flags')
+
+    def __init__(self, names, voltage, amps, phase_code, flags):
+        self.names = np.asarray(names, dtype=object)
+        self.voltage = np.asarray(voltage, dtype=np.float64)
+        self.amps = np.asarray(amps, dtype=np.float64)
+        self.phase_code = np.asarray(phase_code, dtype=np.uint8)
+        self.flags = np.asarray(flags, dtype=np.uint8)
+        n = len(self.names)
+        if not all(len(a) == n for a in (self.voltage, self.amps, self.phase_code, self.flags)):
+            raise ValueError("CircuitTable columns must all have the same length")
+
+    # ───────────────────────────────────────────────────────
+    # Construction
+    # ───────────────────────────────────────────────────────
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame, normalize_labels: bool = False) -> 'CircuitTable':
+        """
+        Build from a DataFrame with the schedule column names
+
+        Phase labels must be 'A'/'B'/'C' (missing = 'A'), as for the
+        auditors. File loaders pass normalize_labels=True to trim and
+        upper-case them first (panel_schedule.normalize_phase).
+        """
+        n = len(df)
+        if 'phases' in df.columns:
+            three_phase = pd.to_numeric(df['phases']).fillna(1).to_numpy() == 3
+        else:
+            three_phase = np.zeros(n, dtype=bool)
+
+        if 'continuous' in df.columns:
+            col = df['continuous']
+            if col.dtype == bool:
+                continuous = col.to_numpy()
+            else:
+                continuous = col.astype(str).str.strip().str.lower().isin(_TRUE_STRINGS).to_numpy()
+        else:
+            continuous = np.zeros(n, dtype=bool)
+
+        if 'phase' in df.columns:
+            labels = df['phase'].fillna('A').astype(str)
+            if normalize_labels:
+                labels = labels.str.strip().str.upper()
+                labels = labels.where(labels != '', 'A')
+            # Unknown labels → NaN first (code -1) instead of relying on deprecated coercion
+            codes = pd.Categorical(labels.where(labels.isin(PHASES)), categories=PHASES).codes
+            bad = (codes < 0) & ~three_phase
+            if bad.any():
+                raise ValueError(
+                    f"Unknown phase label(s) {sorted(set(labels[bad]))}; expected one of {PHASES}"
+                )
+            phase_code = np.where(codes < 0, 0, codes)
+        else:
+            phase_code = np.zeros(n, dtype=np.uint8)
+
+        flags = continuous.astype(np.uint8) * CONTINUOUS | three_phase.astype(np.uint8) * THREE_PHASE
+        names = df['circuit_name'].astype(str).to_numpy() if 'circuit_name' in df.columns \
+            else np.array([f'CKT-{i}' for i in range(n)], dtype=object)
+        return cls(names, df['voltage'].to_numpy(), df['amps'].to_numpy(), phase_code, flags)
+
+    @classmethod
+    def from_circuits(cls, circuits: Iterable[Any]) -> 'CircuitTable':
+        """Build from dicts or Circuit records"""
+        rows = [c.to_dict() if isinstance(c, Circuit) else c for c in circuits]
+        # An empty schedule still needs the required columns
+        return cls.from_frame(pd.DataFrame(rows, columns=None if rows else ['voltage', 'amps']))
+
+    @classmethod
+    def from_csv(cls, path: str, **read_csv_kwargs) -> 'CircuitTable':
+        """Parse a CSV schedule directly into arrays (C parser, no row dicts)"""
+        return cls.from_frame(read_schedule_csv(path, **read_csv_kwargs), normalize_labels=True)
+
+    @classmethod
+    def from_json(cls, path: str) -> 'CircuitTable':
+        """Parse a .json array or .jsonl schedule directly into arrays"""
+        return cls.from_frame(pd.read_json(path, lines=path.lower().endswith('.jsonl')), normalize_labels=True)
+
+    # ───────────────────────────────────────────────────────
+    # Columnar load math
+    # ───────────────────────────────────────────────────────
+    @property
+    def continuous(self) -> np.ndarray:
+        return (self.flags & CONTINUOUS).astype(bool)
+
+    @property
+    def three_phase(self) -> np.ndarray:
+        return (self.flags & THREE_PHASE).astype(bool)
+
+    def va(self) -> np.ndarray:
+        """Per-circuit VA including the 125% continuous multiplier"""
+        va = self.voltage * self.amps
+        va = np.where(self.three_phase, va * np.sqrt(3), va)
+        return va * np.where(self.continuous, 1.25, 1.0)
+
+    def phase_loads(self, va: Optional[np.ndarray] = None) -> Dict[str, float]:
+        """v2-style per-phase totals (3-phase VA split evenly across A/B/C)"""
+        if va is None:
+            va = self.va()
+        three = self.three_phase
+        loads = np.bincount(self.phase_code[~three], weights=va[~three], minlength=3)
+        loads = loads + va[three].sum() / 3
+        return {p: float(v) for p, v in zip(PHASES, loads)}
+
+    # ───────────────────────────────────────────────────────
+    # Interop
+    # ───────────────────────────────────────────────────────
+    def to_frame(self) -> pd.DataFrame:
+        """DataFrame with the schedule column names (for imperial_load_audit_v3)"""
+        return pd.DataFrame({
+            'circuit_name': self.names,
+            'voltage': self.voltage,
+            'amps': self.amps,
+            'phases': np.where(self.three_phase, 3, 1),
+            'continuous': self.continuous,
+            'phase': np.asarray(PHASES, dtype=object)[self.phase_code],
+        })
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __getitem__(self, i: int) -> Circuit:
+        return Circuit(
+            circuit_name=self.names[i],
+            voltage=float(self.voltage[i]),
+            amps=float(self.amps[i]),
+            phases=3 if self.flags[i] & THREE_PHASE else 1,
+            continuous=bool(self.flags[i] & CONTINUOUS),
+            phase=PHASES[self.phase_code[i]],
+        )
+
+    def __iter__(self) -> Iterator[Circuit]:
+        for i in range(len(self)):
+            yield self[i]
+
+    def to_circuits(self) -> List[Circuit]:
+        return list(self)
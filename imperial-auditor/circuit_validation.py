@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+"""
+Circuit Schedule Validation - Schema Checks Before the Audit
+============================================================
+Column-wise checks over a whole schedule in one pass (Pandera-style
+lazy validation, no extra dependency). Every violation is collected
+with its row number instead of failing on the first bad circuit:
+
+    voltage      required, numeric, finite, > 0
+    amps         required, numeric, finite, >= 0
+    phases       1 or 3 (missing = 1)
+    continuous   boolean or 0/1 (missing = False) — strings like 'False'
+                 are rejected because the auditors would read them as True
+    phase        'A', 'B' or 'C' on single-phase rows (missing = 'A')
+    circuit_name unique, when unique_names=True
+
+Modes:
+    'raise'       ScheduleValidationError (a ValueError) listing violations
+    'quarantine'  drop the bad rows, audit the rest, keep them in the report
+                  (a missing required column still raises — no row could be audited)
+
+Rows are 0-based positions in the schedule as given.
+
+"Trust nothing until it is typed. Then check it anyway."
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+from circuit_table import Circuit, CircuitTable, PHASES
+
+
+VALIDATION_MODES = ('raise', 'quarantine')
+REQUIRED_COLUMNS = ('voltage', 'amps')
+MAX_LISTED_VIOLATIONS = 20
+
+_BOOL_VALUES = [True, False, 0, 1]
+
+
+@dataclass
+class ValidationReport:
+    """All violations found in one schedule"""
+    rows: int
+    violations: pd.DataFrame                 # row, column, check, value (row -1 = whole column)
+    bad_rows: np.ndarray                     # sorted unique row positions
+    quarantined: Any = None                  # bad rows, same type as the input (quarantine mode)
+    missing_columns: List[str] = field(default_factory=list)
+
+    @property
+    def valid(self) -> bool:
+        return len(self.violations) == 0
+
+    def counts(self) -> Dict[str, int]:
+        """Violations per 'column: check'"""
+        if self.valid:
+            return {}
+        keys = self.violations['column'] + ': ' + self.violations['check']
+        return {str(k): int(v) for k, v in keys.value_counts().items()}
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            'rows': self.rows,
+            'valid': self.valid,
+            'violation_count': int(len(self.violations)),
+            'bad_row_count': int(len(self.bad_rows)),
+            'violations_by_check': self.counts(),
+            'missing_columns': self.missing_columns,
+        }
+
+    def describe(self, limit: int = MAX_LISTED_VIOLATIONS) -> str:
+        lines = [f"{len(self.violations):,} violation(s) in {len(self.bad_rows):,} of {self.rows:,} rows"]
+        for row, column, check, value in self.violations.head(limit).itertuples(index=False):
+            where = 'column' if row < 0 else f'row {row}'
+            lines.append(f"  {where}: {column} {check} (got {value!r})")
+        if len(self.violations) > limit:
+            lines.append(f"  ... and {len(self.violations) - limit:,} more")
+        return '\n'.join(lines)
+
+
+class ScheduleValidationError(ValueError):
+    """Schedule failed validation; `.report` holds every violation"""
+
+    def __init__(self, report: ValidationReport):
+        self.report = report
+        super().__init__(report.describe())
+
+
+# ═══════════════════════════════════════════════════════════
+# CHECKS
+# ═══════════════════════════════════════════════════════════
+def _as_frame(circuits) -> pd.DataFrame:
+    if isinstance(circuits, pd.DataFrame):
+        return circuits
+    if isinstance(circuits, CircuitTable):
+        # Phase codes and flags are valid by construction; only the floats can be bad
+        return pd.DataFrame({'voltage': circuits.voltage, 'amps': circuits.amps}, copy=False)
+    return pd.DataFrame([c.to_dict() if isinstance(c, Circuit) else c for c in circuits])
+
+
+def _value_types(col: pd.Series) -> Tuple[np.ndarray, List[type]]:
+    """(per-row codes, distinct Python types) — type checks then run once per type, not per row"""
+    values = col.to_numpy(dtype=object)
+    codes, uniques = pd.factorize(np.fromiter(map(type, values), dtype=object, count=len(values)))
+    return codes, list(uniques)
+
+
+def _not_a_number(col: pd.Series) -> np.ndarray:
+    """Present values that are not real numbers (strings, None-like objects, bools)"""
+    if pd.api.types.is_bool_dtype(col):
+        return np.ones(len(col), dtype=bool)
+    if pd.api.types.is_numeric_dtype(col):
+        return np.zeros(len(col), dtype=bool)
+    codes, types = _value_types(col)
+    not_real = np.array([not issubclass(t, (int, float, np.number)) or issubclass(t, (str, bool))
+                         for t in types], dtype=bool)
+    return not_real[codes] & col.notna().to_numpy()
+
+
+def _numeric_checks(col: pd.Series, positive: bool) -> List[Tuple[str, np.ndarray]]:
+    missing = col.isna().to_numpy()
+    wrong_type = _not_a_number(col)
+    values = pd.to_numeric(col.where(~wrong_type), errors='coerce').to_numpy(dtype=np.float64)
+    with np.errstate(invalid='ignore'):
+        bad_range = ~missing & ~wrong_type & ~(np.isfinite(values) & ((values > 0) if positive else (values >= 0)))
+    return [('not_null', missing), ('numeric', wrong_type),
+            ('greater_than_0' if positive else 'non_negative', bad_range)]
+
+
+def _phases_check(col: pd.Series) -> Tuple[np.ndarray, np.ndarray]:
+    """(bad mask, three-phase mask)"""
+    present = col.notna().to_numpy()
+    wrong_type = _not_a_number(col)
+    values = pd.to_numeric(col.where(~wrong_type), errors='coerce').to_numpy(dtype=np.float64)
+    bad = present & (wrong_type | ~np.isin(values, (1, 3)))
+    return bad, ~bad & (values == 3)
+
+
+def _continuous_check(col: pd.Series) -> np.ndarray:
+    if pd.api.types.is_bool_dtype(col):
+        return np.zeros(len(col), dtype=bool)
+    if pd.api.types.is_numeric_dtype(col):
+        return ~(col.isna() | col.isin([0, 1])).to_numpy()
+    # Object column: Python/NumPy bools and 0/1 numbers only
+    codes, types = _value_types(col)
+    real = np.array([issubclass(t, (int, float, np.integer, np.floating, np.bool_)) for t in types], dtype=bool)[codes]
+    text = np.array([issubclass(t, str) for t in types], dtype=bool)[codes]
+    none = np.array([t is type(None) for t in types], dtype=bool)[codes]
+    values = col.to_numpy(dtype=object)
+    bad = text.copy()
+    numbers = values[real].astype(np.float64)
+    bad[real] = ~(np.isnan(numbers) | (numbers == 0) | (numbers == 1))
+    # Anything else (Decimal, complex, ...) keeps the per-value rule
+    other = np.flatnonzero(~(real | text | none))
+    if len(other):
+        bad[other] = [not (v is None or v != v or v in _BOOL_VALUES) for v in values[other]]
+    return bad
+
+
+def _phase_check(col: pd.Series, three_phase: np.ndarray) -> np.ndarray:
+    return ~col.isin(PHASES).to_numpy() & col.notna().to_numpy() & ~three_phase
+
+
+def validate_schedule(circuits, unique_names: bool = False) -> ValidationReport:
+    """
+    Check every row and column; never raises for bad data
+
+    Args:
+        circuits: List of circuit dicts / Circuit records, a CircuitTable
+            or a DataFrame
+        unique_names: Also require unique circuit_name values
+
+    Returns:
+        ValidationReport (valid == True when nothing was found)
+    """
+    df = _as_frame(circuits)
+    n = len(df)
+    found: List[Tuple[np.ndarray, str, str, np.ndarray]] = []
+    missing_columns = [c for c in REQUIRED_COLUMNS if c not in df.columns]
+
+    def record(column: str, check: str, mask: np.ndarray) -> None:
+        if mask.any():
+            idx = np.flatnonzero(mask)
+            found.append((idx, column, check, df[column].to_numpy(dtype=object)[idx]))
+
+    for column, positive in (('voltage', True), ('amps', False)):
+        if column in df.columns:
+            for check, mask in _numeric_checks(df[column], positive):
+                record(column, check, mask)
+
+    three_phase = np.zeros(n, dtype=bool)
+    if 'phases' in df.columns:
+        bad, three_phase = _phases_check(df['phases'])
+        record('phases', 'in {1, 3}', bad)
+    if 'continuous' in df.columns:
+        record('continuous', 'boolean', _continuous_check(df['continuous']))
+    if 'phase' in df.columns:
+        record('phase', "in {'A', 'B', 'C'}", _phase_check(df['phase'], three_phase))
+    if unique_names and 'circuit_name' in df.columns:
+        record('circuit_name', 'unique', df['circuit_name'].duplicated(keep=False).to_numpy())
+
+    if found:
+        violations = pd.DataFrame({
+            'row': np.concatenate([f[0] for f in found]),
+            'column': np.concatenate([np.full(len(f[0]), f[1], dtype=object) for f in found]),
+            'check': np.concatenate([np.full(len(f[0]), f[2], dtype=object) for f in found]),
+            'value': np.concatenate([f[3] for f in found]),
+        }).sort_values('row', kind='stable', ignore_index=True)
+        bad_rows = np.unique(violations['row'].to_numpy())
+    else:
+        violations = pd.DataFrame({'row': np.array([], dtype=np.int64), 'column': [], 'check': [], 'value': []})
+        bad_rows = np.array([], dtype=np.int64)
+
+    if missing_columns:
+        header = pd.DataFrame({'row': -1, 'column': missing_columns, 'check': 'column_present', 'value': None})
+        violations = pd.concat([header, violations], ignore_index=True)
+        bad_rows = np.arange(n)
+    return ValidationReport(n, violations, bad_rows, missing_columns=missing_columns)
+
+
+def _take(circuits, rows: np.ndarray):
+    """Subset of the schedule (same type as the input) at the given row positions"""
+    if isinstance(circuits, pd.DataFrame):
+        return circuits.iloc[rows]
+    if isinstance(circuits, CircuitTable):
+        return CircuitTable(circuits.names[rows], circuits.voltage[rows], circuits.amps[rows],
+                            circuits.phase_code[rows], circuits.flags[rows])
+    circuits = circuits if isinstance(circuits, list) else list(circuits)
+    return [circuits[i] for i in rows.tolist()]
+
+
+def enforce_schedule(circuits, mode: str = 'raise', unique_names: bool = False):
+    """
+    Validate, then raise or quarantine
+
+    Returns:
+        (circuits, report) — in 'quarantine' mode `circuits` holds only
+        the valid rows (same type as the input) and report.quarantined
+        the rest; in 'raise' mode the input comes back unchanged.
+
+    Raises:
+        ScheduleValidationError: mode='raise' and any violation was found,
+            or a required column is missing (either mode)
+    """
+    if mode not in VALIDATION_MODES:
+        raise ValueError(f"mode must be one of {VALIDATION_MODES}, got {mode!r}")
+    if not isinstance(circuits, (pd.DataFrame, CircuitTable, list)):
+        circuits = list(circuits)
+    report = validate_schedule(circuits, unique_names=unique_names)
+    if report.valid:
+        return circuits, report
+    if mode == 'raise' or report.missing_columns:
+        raise ScheduleValidationError(report)
+    keep = np.ones(report.rows, dtype=bool)
+    keep[report.bad_rows] = False
+    report.quarantined = _take(circuits, report.bad_rows)
+    return _take(circuits, np.flatnonzero(keep)), report
+
+
+def print_validation_report(report: ValidationReport, limit: int = MAX_LISTED_VIOLATIONS) -> None:
+    """Print formatted validation report"""
+    print()
+    print("=" * 50)
+    print("SCHEDULE VALIDATION")
+    print("=" * 50)
+    if report.valid:
+        print(f"✅ {report.rows:,} rows, no violations")
+    else:
+        print(f"❌ {report.describe(limit)}")
+        for key, count in report.counts().items():
+            print(f"  {key}: {count:,}")
+    print("=" * 50)
+
+
+# Example usage
+if __name__ == '__main__':
+    schedule = [
+        {'circuit_name': 'ICU-1', 'voltage': 120, 'amps': 20, 'phase': 'A', 'continuous': True},
+        {'circuit_name': 'ICU-2', 'amps': 20, 'phase': 'B'},
+        {'circuit_name': 'Chiller', 'voltage': 480, 'amps': 60, 'phases': 2},
+        {'circuit_name': 'Lobby', 'voltage': 120, 'amps': -5, 'phase': 'D', 'continuous': 'False'},
+        {'circuit_name': 'OR Lights', 'voltage': 277, 'amps': 20, 'phase': 'C'},
+    ]
+    good, report = enforce_schedule(schedule, mode='quarantine')
+    print_validation_report(report)
+    print(f"Auditing {len(good)} of {report.rows} circuits")
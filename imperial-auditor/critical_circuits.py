@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Critical Circuit Classifier - NEC Article 517
+=============================================
+One shared definition of "critical circuit" for every auditor.
+
+The keyword set is compiled into a single alternation regex, so each
+name is scanned once instead of once per keyword. Results are memoized
+per distinct name (panel templates repeat the same names across a
+portfolio), and whole name columns are classified by factorizing to
+unique names first.
+
+"Know which hearts must never stop."
+"""
+
+import re
+from typing import Any, Iterable, Optional
+
+
+CRITICAL_KEYWORDS = ('ICU', 'OR', 'Emergency', 'Life Safety', 'Critical', 'Nurse')
+
+
+class CriticalCircuitClassifier:
+    """
+    Compiled keyword matcher for circuit names
+
+    Args:
+        keywords: Substrings that mark a circuit as critical (case-sensitive)
+        memo_size: Distinct names remembered before the memo is reset
+    """
+
+    def __init__(self, keywords: Iterable[str] = CRITICAL_KEYWORDS, memo_size: int = 1 << 16):
+        self.keywords = tuple(dict.fromkeys(k for k in keywords if k))
+        # Longest first so overlapping keywords report the most specific match
+        ordered = sorted(self.keywords, key=len, reverse=True)
+        self._pattern: Optional[re.Pattern] = (
+            re.compile('|'.join(re.escape(k) for k in ordered)) if ordered else None
+        )
+        self._memo = {}
+        self._memo_size = memo_size
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def pattern(self) -> str:
+        return self._pattern.pattern if self._pattern else ''
+
+    def is_critical(self, name: Any) -> bool:
+        """Classify one circuit name"""
+        return self._lookup_many((name,))[0]
+
+    def classify(self, names):
+        """
+        Classify a whole name column in one pass
+
+        Args:
+            names: pandas Series, NumPy array, or any iterable of names
+
+        Returns:
+            NumPy bool array for array-like input, otherwise a list of bools
+        """
+        if hasattr(names, 'dtype'):
+            import numpy as np
+            import pandas as pd
+
+            codes, uniques = pd.factorize(names, use_na_sentinel=False)
+            flags = np.array(self._lookup_many(uniques), dtype=bool)
+            return flags[codes]
+        return self._lookup_many(names)
+
+    def _lookup_many(self, names: Iterable[Any]) -> list:
+        memo = self._memo
+        get = memo.get
+        search = self._pattern.search if self._pattern else (lambda _: None)
+        flags = []
+        append = flags.append
+        misses = 0
+        for name in names:
+            flag = get(name)
+            if flag is None:
+                flag = search(name if name.__class__ is str else str(name)) is not None
+                memo[name] = flag
+                misses += 1
+            append(flag)
+        self.misses += misses
+        self.hits += len(flags) - misses
+        if len(memo) > self._memo_size:
+            memo.clear()
+        return flags
+
+    def clear(self) -> None:
+        """Forget memoized names and reset counters"""
+        self._memo.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+# Shared by vader_load_audit_v2, imperial_va_engine and imperial_load_audit_v3
+DEFAULT_CLASSIFIER = CriticalCircuitClassifier()
+
+
+def is_critical_name(name: Any) -> bool:
+    return DEFAULT_CLASSIFIER.is_critical(name)
+
+
+def classify_names(names):
+    return DEFAULT_CLASSIFIER.classify(names)
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Imperial Auditor - Incremental Mode
+===================================
+A stateful LoadAudit that stays in memory while engineers iterate on a
+design one breaker at a time. Adding, updating or removing a circuit
+adjusts the running totals instead of re-auditing the whole schedule:
+
+• Total VA and per-phase loads      O(1)
+• Phase imbalance (v2 formula)      O(1)
+• Largest single unit (for N+1)     O(log n) — max-heap with lazy deletion
+
+"Change one breaker. Know the whole panel."
+"""
+
+import heapq
+from typing import Any, Dict, Iterable, List, Tuple
+
+from vader_load_audit_v2 import circuit_va, is_critical_circuit, summarize_phase_loads
+
+
+PHASES = ('A', 'B', 'C')
+
+
+def _as_dict(circuit: Any) -> Dict[str, Any]:
+    """Own copy of a circuit dict or a circuit_table.Circuit record"""
+    return circuit.to_dict() if hasattr(circuit, 'to_dict') else dict(circuit)
+
+
+def _phase_split(circuit: Dict[str, Any], va: float) -> Tuple[float, float, float]:
+    """VA contributed to (A, B, C), v2 style"""
+    if circuit.get('phases', 1) == 1:
+        phase = circuit.get('phase', 'A')
+        if phase not in PHASES:
+            raise KeyError(phase)
+        return tuple(va if p == phase else 0.0 for p in PHASES)
+    return (va / 3, va / 3, va / 3)
+
+
+class LoadAudit:
+    """
+    Live load audit keyed by circuit_name
+
+    Running sums are updated with += / -=, so after very long edit
+    sessions the totals can drift from a fresh audit in the last few
+    bits; call rebuild() to resynchronize.
+    """
+
+    def __init__(self, circuits: Iterable[Dict[str, Any]] = ()):
+        self._circuits: Dict[str, Dict[str, Any]] = {}
+        self._va: Dict[str, float] = {}
+        self._split: Dict[str, Tuple[float, float, float]] = {}
+        self._critical = set()
+        self._heap: List[Tuple[float, str]] = []
+        self.total_va = 0.0
+        self._phase = [0.0, 0.0, 0.0]
+        for circuit in circuits:
+            self.add(circuit)
+
+    def __len__(self) -> int:
+        return len(self._circuits)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._circuits
+
+    # ───────────────────────────────────────────────────────
+    # Edits
+    # ───────────────────────────────────────────────────────
+    def add(self, circuit: Dict[str, Any]) -> None:
+        """Add a new circuit dict or Circuit record (circuit_name must be unique)"""
+        circuit = _as_dict(circuit)
+        name = circuit['circuit_name']
+        if name in self._circuits:
+            raise ValueError(f"Circuit {name!r} already exists; use update()")
+        va = circuit_va(circuit)
+        split = _phase_split(circuit, va)
+
+        self._circuits[name] = circuit
+        self._va[name] = va
+        self._split[name] = split
+        if is_critical_circuit(circuit):
+            self._critical.add(name)
+
+        self.total_va += va
+        for i, share in enumerate(split):
+            self._phase[i] += share
+        heapq.heappush(self._heap, (-va, name))
+
+    def remove(self, name: str) -> Dict[str, Any]:
+        """Remove a circuit and return its record"""
+        circuit = self._circuits.pop(name)
+        va = self._va.pop(name)
+        split = self._split.pop(name)
+        self._critical.discard(name)
+
+        self.total_va -= va
+        for i, share in enumerate(split):
+            self._phase[i] -= share
+        # Heap entry is left behind and skipped lazily by max_unit
+        if len(self._heap) > 2 * len(self._va) + 32:
+            self._compact()
+        return circuit
+
+    def update(self, name: str, **changes: Any) -> None:
+        """Change fields on an existing circuit (amps, phase, continuous, ...)"""
+        circuit = dict(self._circuits[name])
+        circuit.update(changes)
+        # Validate before touching state so a bad edit leaves the audit intact
+        _phase_split(circuit, circuit_va(circuit))
+        new_name = circuit['circuit_name']
+        if new_name != name and new_name in self._circuits:
+            raise ValueError(f"Circuit {new_name!r} already exists; cannot rename {name!r}")
+        self.remove(name)
+        self.add(circuit)
+
+    def rebuild(self) -> None:
+        """Recompute every running total from the stored circuits"""
+        circuits = list(self._circuits.values())
+        self.__init__(circuits)
+
+    def _compact(self) -> None:
+        self._heap = [(-va, name) for name, va in self._va.items()]
+        heapq.heapify(self._heap)
+
+    # ───────────────────────────────────────────────────────
+    # Queries
+    # ───────────────────────────────────────────────────────
+    @property
+    def phase_loads(self) -> Dict[str, float]:
+        return dict(zip(PHASES, self._phase))
+
+    @property
+    def imbalance(self) -> float:
+        max_phase = max(self._phase)
+        min_phase = min(self._phase)
+        return ((max_phase - min_phase) / max_phase) * 100 if max_phase > 0 else 0
+
+    @property
+    def max_unit(self) -> float:
+        """Largest single circuit VA, discarding stale heap entries"""
+        heap = self._heap
+        while heap:
+            neg_va, name = heap[0]
+            if self._va.get(name) == -neg_va:
+                return -neg_va
+            heapq.heappop(heap)
+        return 0.0
+
+    @property
+    def n1_capacity(self) -> float:
+        """v3 N+1 selection: max(full mirror, total + largest unit)"""
+        return max(self.total_va * 2, self.total_va + self.max_unit)
+
+    @property
+    def critical_count(self) -> int:
+        return len(self._critical)
+
+    def results(self, verbose: bool = False) -> Dict[str, Any]:
+        """v2 results dictionary plus largest unit and N+1 capacity"""
+        results = summarize_phase_loads(self.total_va, self.phase_loads, verbose=verbose)
+        results['circuit_count'] = len(self)
+        results['max_unit_va'] = round(self.max_unit, 2)
+        results['n1_capacity'] = round(self.n1_capacity, 2)
+        results['critical_circuits_count'] = self.critical_count
+        return results
+
+
+if __name__ == '__main__':
+    from vader_load_audit_v2 import HOSPITAL_NODE_SAMPLE
+
+    audit = LoadAudit(HOSPITAL_NODE_SAMPLE)
+    print(f"Start:            {audit.total_va:,.0f} VA, largest {audit.max_unit:,.0f} VA, "
+          f"imbalance {audit.imbalance:.1f}%")
+
+    audit.update('General-Receptacles', phase='B', amps=30)
+    print(f"Move receptacles: {audit.total_va:,.0f} VA, imbalance {audit.imbalance:.1f}%")
+
+    audit.remove('Emergency-Panel')
+    print(f"Drop EP panel:    {audit.total_va:,.0f} VA, largest {audit.max_unit:,.0f} VA, "
+          f"N+1 {audit.n1_capacity:,.0f} VA")
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Panel Schedule Loader - CSV / JSON inputs for the Imperial Auditors
+===================================================================
+Turns panel schedule files into the circuit dictionaries that
+imperial_load_audit_v2 and imperial_load_audit_v3 expect.
+
+Supported files:
+    .csv    header row with circuit_name, voltage, amps, phases, continuous, phase
+    .json   list of circuits, or {"name", "sq_ft", "climate_zone", "circuits": [...]}
+    .jsonl  one circuit object per line
+    .parquet / .pq / .arrow / .feather / .ipc   columnar (pyarrow) —
+            circuits come back as a CircuitTable rather than a list of dicts
+
+"Read the schedule. Trust nothing until it is typed."
+"""
+
+import csv
+import json
+import os
+from typing import Any, Dict, Iterator, List
+
+
+TEXT_EXTENSIONS = ('.csv', '.json', '.jsonl')
+PARQUET_EXTENSIONS = ('.parquet', '.pq')
+ARROW_EXTENSIONS = ('.arrow', '.feather', '.ipc')
+COLUMNAR_EXTENSIONS = PARQUET_EXTENSIONS + ARROW_EXTENSIONS
+SCHEDULE_EXTENSIONS = TEXT_EXTENSIONS + COLUMNAR_EXTENSIONS
+
+# Shared with circuit_table so every loader reads the same cell the same way
+TRUE_STRINGS = frozenset({'true', 't', 'yes', 'y', '1', '1.0'})
+
+
+def _to_bool(value: Any) -> bool:
+    """CSV-friendly truthiness: 'True', 'yes', '1' → True"""
+    if isinstance(value, str):
+        return value.strip().lower() in TRUE_STRINGS
+    return bool(value)
+
+
+def normalize_phase(value: Any) -> str:
+    """
+    File phase label → canonical 'A'/'B'/'C' form (trimmed, upper-case,
+    blank = 'A'). Loaders apply this; in-memory schedules must already
+    use canonical labels, as the auditors and circuit_validation expect.
+    """
+    label = '' if value is None else str(value).strip().upper()
+    return label or 'A'
+
+
+def coerce_circuit(row: Dict[str, Any], strict: bool = True) -> Dict[str, Any]:
+    """
+    Type one raw schedule row (CSV strings or JSON values)
+
+    Empty optional cells are dropped so the auditors' defaults apply
+    (phases=1, continuous=False, phase='A'). With strict=False, values
+    that cannot be typed (and missing voltage/amps) are left as they are
+    for circuit_validation to report with their row numbers.
+    """
+    circuit = {k: v for k, v in row.items() if v is not None and v != ''}
+    try:
+        circuit['voltage'] = float(circuit['voltage'])
+        circuit['amps'] = float(circuit['amps'])
+        if 'phases' in circuit:
+            circuit['phases'] = int(float(circuit['phases']))
+    except (KeyError, TypeError, ValueError):
+        if strict:
+            raise
+        for key in ('voltage', 'amps', 'phases'):
+            try:
+                circuit[key] = float(circuit[key]) if key != 'phases' else int(float(circuit[key]))
+            except (KeyError, TypeError, ValueError):
+                pass
+    if 'continuous' in circuit:
+        circuit['continuous'] = _to_bool(circuit['continuous'])
+    if 'phase' in circuit:
+        circuit['phase'] = normalize_phase(circuit['phase'])
+    return circuit
+
+
+def read_panel_schedule(path: str, strict: bool = True) -> Dict[str, Any]:
+    """
+    Load one facility's panel schedule
+
+    strict=False keeps rows whose values cannot be typed (see
+    coerce_circuit) so a validation pass can report all of them.
+
+    Returns:
+        Dictionary with name, circuits and (optional) sq_ft / climate_zone
+    """
+    ext = os.path.splitext(path)[1].lower()
+    name = os.path.splitext(os.path.basename(path))[0]
+    facility: Dict[str, Any] = {'name': name}
+
+    if ext in COLUMNAR_EXTENSIONS:
+        # Columnar files go straight into arrays (numpy/pyarrow only loaded here)
+        from audit_io import read_schedule_table
+        facility['circuits'] = read_schedule_table(path)
+        return facility
+
+    with open(path, newline='' if ext == '.csv' else None) as f:
+        if ext == '.csv':
+            rows: List[Dict[str, Any]] = list(csv.DictReader(f))
+        elif ext == '.jsonl':
+            rows = [json.loads(line) for line in f if line.strip()]
+        elif ext == '.json':
+            data = json.load(f)
+            if isinstance(data, dict):
+                facility.update({k: v for k, v in data.items() if k != 'circuits'})
+                rows = data['circuits']
+            else:
+                rows = data
+        else:
+            raise ValueError(f"Unsupported panel schedule format: {path}")
+
+    facility['circuits'] = [coerce_circuit(r, strict) for r in rows]
+    return facility
+
+
+def iter_panel_schedule(path: str, chunk_size: int = 10_000) -> Iterator[List[Dict[str, Any]]]:
+    """
+    Stream a CSV or JSON Lines schedule in typed chunks
+
+    Only one chunk of rows is held in memory at a time, so a multi-GB
+    utility export reads in constant space. Plain .json arrays cannot be
+    streamed — convert them to .jsonl first.
+    """
+    ext = os.path.splitext(path)[1].lower()
+    if ext not in ('.csv', '.jsonl'):
+        raise ValueError(f"Streaming needs a .csv or .jsonl schedule: {path}")
+
+    with open(path, newline='' if ext == '.csv' else None) as f:
+        if ext == '.csv':
+            rows = csv.DictReader(f)
+        else:
+            rows = (json.loads(line) for line in f if line.strip())
+        chunk: List[Dict[str, Any]] = []
+        for row in rows:
+            chunk.append(coerce_circuit(row))
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+
+def list_panel_schedules(directory: str) -> List[str]:
+    """Sorted paths of every schedule file in a directory"""
+    return sorted(
+        os.path.join(directory, f) for f in os.listdir(directory)
+        if f.lower().endswith(SCHEDULE_EXTENSIONS)
+    )
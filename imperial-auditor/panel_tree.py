@@ -0,0 +1,410 @@
+#!/usr/bin/env python3
+"""
+Imperial Auditor - Panel Tree Roll-Up
+=====================================
+A facility as a tree instead of one flat schedule:
+
+    service → switchboards → distribution panels → branch panels
+
+with NEC 517 emergency branches flagged anywhere in the tree (a flag is
+inherited by everything fed from that panel). Each panel keeps its own
+circuits in a LoadAudit and caches the subtotals of its whole subtree:
+
+• Total VA, per-phase loads, circuit and critical counts
+• Largest single unit (for N+1)
+• Emergency VA
+
+Editing a circuit changes its panel's LoadAudit and then walks only the
+panel's path to the root — O(depth) for the sums, plus one look at each
+ancestor's direct children when the largest unit shrinks. Imbalance and
+N+1 capacity (v3 rules) come straight from the cached values at any node.
+
+"Every panel answers to the one above it."
+"""
+
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from incremental_audit import PHASES, LoadAudit
+
+
+PANEL_KINDS = ('service', 'switchboard', 'distribution', 'branch')
+
+
+class PanelNode:
+    """One panel: its own circuits plus cached subtotals for its subtree"""
+
+    __slots__ = ('name', 'kind', 'emergency', 'parent', 'children', 'audit',
+                 'total_va', '_phase', 'max_unit', 'circuit_count', 'critical_count', 'emergency_va')
+
+    def __init__(self, name: str, kind: str = 'branch', emergency: bool = False,
+                 parent: Optional['PanelNode'] = None):
+        if kind not in PANEL_KINDS:
+            raise ValueError(f"kind must be one of {PANEL_KINDS}, got {kind!r}")
+        self.name = name
+        self.kind = kind
+        self.emergency = emergency
+        self.parent = parent
+        self.children: Dict[str, 'PanelNode'] = {}
+        self.audit = LoadAudit()
+        self.total_va = 0.0
+        self._phase = [0.0, 0.0, 0.0]
+        self.max_unit = 0.0
+        self.circuit_count = 0
+        self.critical_count = 0
+        self.emergency_va = 0.0
+
+    def __repr__(self) -> str:
+        return f"PanelNode({self.name!r}, kind={self.kind!r}, circuits={self.circuit_count})"
+
+    # ───────────────────────────────────────────────────────
+    # Structure
+    # ───────────────────────────────────────────────────────
+    @property
+    def on_emergency_branch(self) -> bool:
+        """This panel or any panel feeding it is an NEC 517 emergency branch"""
+        node = self
+        while node is not None:
+            if node.emergency:
+                return True
+            node = node.parent
+        return False
+
+    def path(self) -> List[str]:
+        """Panel names from the root down to this panel"""
+        names = []
+        node = self
+        while node is not None:
+            names.append(node.name)
+            node = node.parent
+        return names[::-1]
+
+    def walk(self) -> Iterator['PanelNode']:
+        """This panel and everything it feeds, depth first"""
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            yield node
+            stack.extend(reversed(list(node.children.values())))
+
+    # ───────────────────────────────────────────────────────
+    # Cached subtree queries (v3 rules)
+    # ───────────────────────────────────────────────────────
+    @property
+    def phase_loads(self) -> Dict[str, float]:
+        return dict(zip(PHASES, self._phase))
+
+    @property
+    def imbalance(self) -> float:
+        max_phase = max(self._phase)
+        min_phase = min(self._phase)
+        return ((max_phase - min_phase) / max_phase) * 100 if max_phase > 0 else 0
+
+    @property
+    def phase_balanced(self) -> bool:
+        return self.imbalance <= 10
+
+    @property
+    def n1_capacity_option1(self) -> float:
+        return self.total_va * 2
+
+    @property
+    def n1_capacity_option2(self) -> float:
+        return self.total_va + self.max_unit
+
+    @property
+    def n1_capacity(self) -> float:
+        """v3 N+1 selection: max(full mirror, total + largest unit)"""
+        return max(self.n1_capacity_option1, self.n1_capacity_option2)
+
+    def results(self) -> Dict[str, Any]:
+        """v3-style summary for this panel's whole subtree"""
+        return {
+            'panel': self.name,
+            'kind': self.kind,
+            'path': self.path(),
+            'emergency': self.on_emergency_branch,
+            'circuit_count': self.circuit_count,
+            'local_circuit_count': len(self.audit),
+            'total_va': round(self.total_va, 2),
+            'total_kva': round(self.total_va / 1000, 2),
+            'max_unit_va': round(self.max_unit, 2),
+            'n1_capacity_option1': round(self.n1_capacity_option1, 2),
+            'n1_capacity_option2': round(self.n1_capacity_option2, 2),
+            'n1_capacity': round(self.n1_capacity, 2),
+            'phase_loads': {k: round(v, 2) for k, v in self.phase_loads.items()},
+            'imbalance_percent': round(self.imbalance, 2),
+            'phase_balanced': self.phase_balanced,
+            'critical_circuits_count': self.critical_count,
+            'emergency_va': round(self.emergency_va, 2),
+            'normal_va': round(self.total_va - self.emergency_va, 2),
+        }
+
+
+def _local_totals(node: PanelNode) -> Tuple[float, float, float, float, int, int, float]:
+    """(VA, A, B, C, circuits, critical, emergency VA) for the panel's own circuits"""
+    audit = node.audit
+    a, b, c = audit._phase
+    emergency = audit.total_va if node.on_emergency_branch else 0.0
+    return (audit.total_va, a, b, c, len(audit), audit.critical_count, emergency)
+
+
+class PanelTree:
+    """
+    Facility distribution tree with cached roll-ups
+
+    Panel names are unique across the tree; circuit names only need to
+    be unique within their panel. Like LoadAudit, cached sums are kept
+    with += / -=; rebuild() recomputes them from scratch.
+    """
+
+    def __init__(self, root: str = 'Service', kind: str = 'service'):
+        self.root = PanelNode(root, kind)
+        self._panels: Dict[str, PanelNode] = {root: self.root}
+
+    def __len__(self) -> int:
+        return len(self._panels)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._panels
+
+    def __getitem__(self, name: str) -> PanelNode:
+        return self._panels[name]
+
+    def __iter__(self) -> Iterator[PanelNode]:
+        return self.root.walk()
+
+    # ───────────────────────────────────────────────────────
+    # Propagation
+    # ───────────────────────────────────────────────────────
+    @staticmethod
+    def _propagate(node: Optional[PanelNode], delta: Iterable[float], max_dirty: bool = True) -> None:
+        """Add a subtotal delta to node and its ancestors; refresh largest unit on the way up"""
+        d_va, d_a, d_b, d_c, d_count, d_critical, d_emergency = delta
+        while node is not None:
+            node.total_va += d_va
+            phase = node._phase
+            phase[0] += d_a
+            phase[1] += d_b
+            phase[2] += d_c
+            node.circuit_count += d_count
+            node.critical_count += d_critical
+            node.emergency_va += d_emergency
+            if max_dirty:
+                previous = node.max_unit
+                node.max_unit = max([node.audit.max_unit] + [c.max_unit for c in node.children.values()])
+                # Ancestors only need a new maximum if this subtree's changed
+                max_dirty = node.max_unit != previous
+            node = node.parent
+
+    @staticmethod
+    def _subtree_totals(node: PanelNode) -> Tuple[float, ...]:
+        phase = node._phase
+        return (node.total_va, phase[0], phase[1], phase[2],
+                node.circuit_count, node.critical_count, node.emergency_va)
+
+    def _edit(self, node: PanelNode, edit, *args, **kwargs):
+        before = _local_totals(node)
+        result = edit(*args, **kwargs)
+        after = _local_totals(node)
+        self._propagate(node, [x - y for x, y in zip(after, before)])
+        return result
+
+    # ───────────────────────────────────────────────────────
+    # Panels
+    # ───────────────────────────────────────────────────────
+    def add_panel(self, name: str, parent: str, kind: str = 'branch', emergency: bool = False,
+                  circuits: Iterable[Dict[str, Any]] = ()) -> PanelNode:
+        """Add a panel fed from `parent`, optionally with its circuits"""
+        if name in self._panels:
+            raise ValueError(f"Panel {name!r} already exists")
+        feeder = self._panels[parent]
+        node = PanelNode(name, kind, emergency, parent=feeder)
+        feeder.children[name] = node
+        self._panels[name] = node
+        for circuit in circuits:
+            node.audit.add(circuit)
+        self._recompute(node)
+        self._propagate(feeder, self._subtree_totals(node))
+        return node
+
+    def remove_panel(self, name: str) -> PanelNode:
+        """Detach a panel and everything it feeds"""
+        node = self._panels[name]
+        if node is self.root:
+            raise ValueError("Cannot remove the service (root) panel")
+        feeder = node.parent
+        del feeder.children[name]
+        node.parent = None
+        for sub in node.walk():
+            del self._panels[sub.name]
+        self._propagate(feeder, [-x for x in self._subtree_totals(node)])
+        return node
+
+    def move_panel(self, name: str, new_parent: str) -> None:
+        """Re-feed a panel (and its subtree) from a different panel"""
+        node = self._panels[name]
+        feeder = self._panels[new_parent]
+        if node is self.root or name in feeder.path():
+            raise ValueError(f"Cannot feed {name!r} from {new_parent!r} (would create a loop)")
+        old = node.parent
+        del old.children[name]
+        node.parent = None
+        self._propagate(old, [-x for x in self._subtree_totals(node)])
+        node.parent = feeder
+        feeder.children[name] = node
+        # Emergency inheritance may have changed under the new feeder
+        self._recompute(node)
+        self._propagate(feeder, self._subtree_totals(node))
+
+    def set_emergency(self, name: str, emergency: bool = True) -> None:
+        """Flag or unflag a panel as an NEC 517 emergency branch"""
+        node = self._panels[name]
+        before = node.emergency_va
+        node.emergency = emergency
+        self._recompute(node)
+        self._propagate(node.parent, (0, 0, 0, 0, 0, 0, node.emergency_va - before), max_dirty=False)
+
+    # ───────────────────────────────────────────────────────
+    # Circuits
+    # ───────────────────────────────────────────────────────
+    def add_circuit(self, panel: str, circuit: Dict[str, Any]) -> None:
+        node = self._panels[panel]
+        self._edit(node, node.audit.add, circuit)
+
+    def remove_circuit(self, panel: str, circuit_name: str) -> Dict[str, Any]:
+        node = self._panels[panel]
+        return self._edit(node, node.audit.remove, circuit_name)
+
+    def update_circuit(self, panel: str, circuit_name: str, **changes: Any) -> None:
+        """Change fields on a circuit (amps, phase, continuous, ...) in place"""
+        node = self._panels[panel]
+        self._edit(node, node.audit.update, circuit_name, **changes)
+
+    # ───────────────────────────────────────────────────────
+    # Recompute
+    # ───────────────────────────────────────────────────────
+    def _recompute(self, node: PanelNode) -> None:
+        """Recompute a subtree's cached values bottom-up from the LoadAudits"""
+        for sub in reversed(list(node.walk())):
+            va, a, b, c, count, critical, emergency = _local_totals(sub)
+            phase = [a, b, c]
+            max_unit = sub.audit.max_unit
+            for child in sub.children.values():
+                va += child.total_va
+                for i in range(3):
+                    phase[i] += child._phase[i]
+                count += child.circuit_count
+                critical += child.critical_count
+                emergency += child.emergency_va
+                max_unit = max(max_unit, child.max_unit)
+            sub.total_va, sub._phase, sub.max_unit = va, phase, max_unit
+            sub.circuit_count, sub.critical_count, sub.emergency_va = count, critical, emergency
+
+    def rebuild(self) -> None:
+        """Resynchronize every LoadAudit and cached subtotal"""
+        for node in self:
+            node.audit.rebuild()
+        self._recompute(self.root)
+
+    # ───────────────────────────────────────────────────────
+    # Queries
+    # ───────────────────────────────────────────────────────
+    def results(self, panel: Optional[str] = None) -> Dict[str, Any]:
+        """v3-style summary for one panel's subtree (default: whole facility)"""
+        return (self._panels[panel] if panel else self.root).results()
+
+    def panel_report(self) -> List[Dict[str, Any]]:
+        """results() for every panel, depth first"""
+        return [node.results() for node in self]
+
+    def imbalanced_panels(self, limit: float = 10) -> List[str]:
+        return [node.name for node in self if node.imbalance > limit]
+
+    # ───────────────────────────────────────────────────────
+    # Construction
+    # ───────────────────────────────────────────────────────
+    @classmethod
+    def from_spec(cls, spec: Dict[str, Any]) -> 'PanelTree':
+        """
+        Build from a nested dict (e.g. loaded from JSON):
+
+            {'name': 'Service', 'kind': 'service', 'circuits': [...],
+             'children': [{'name': 'EM-1', 'kind': 'branch', 'emergency': True,
+                           'circuits': [...]}, ...]}
+        """
+        tree = cls(spec['name'], spec.get('kind', 'service'))
+        tree.root.emergency = bool(spec.get('emergency', False))
+        for circuit in spec.get('circuits', ()):
+            tree.root.audit.add(circuit)
+        stack = [(child, spec['name']) for child in reversed(spec.get('children', ()))]
+        while stack:
+            child, parent = stack.pop()
+            tree._attach(child, parent)
+            stack.extend((grandchild, child['name']) for grandchild in reversed(child.get('children', ())))
+        tree._recompute(tree.root)
+        return tree
+
+    def _attach(self, spec: Dict[str, Any], parent: str) -> None:
+        """Add a panel without propagating (from_spec recomputes once at the end)"""
+        name = spec['name']
+        if name in self._panels:
+            raise ValueError(f"Panel {name!r} already exists")
+        feeder = self._panels[parent]
+        node = PanelNode(name, spec.get('kind', 'branch'), bool(spec.get('emergency', False)), parent=feeder)
+        for circuit in spec.get('circuits', ()):
+            node.audit.add(circuit)
+        feeder.children[name] = node
+        self._panels[name] = node
+
+
+def print_panel_tree_report(tree: PanelTree) -> None:
+    """Print the facility tree with per-panel roll-ups"""
+    print()
+    print("=" * 78)
+    print("IMPERIAL PANEL TREE - FACILITY ROLL-UP")
+    print("=" * 78)
+    print(f"{'Panel':<30} {'Circuits':>8} {'kVA':>10} {'N+1 kVA':>10} {'Imbal %':>8}  Flags")
+    for node in tree:
+        depth = len(node.path()) - 1
+        flags = []
+        if node.emergency:
+            flags.append('⚡ EMERGENCY')
+        if not node.phase_balanced:
+            flags.append('⚠️  IMBALANCED')
+        label = '  ' * depth + node.name
+        print(f"{label:<30} {node.circuit_count:>8,} {node.total_va / 1000:>10,.2f} "
+              f"{node.n1_capacity / 1000:>10,.2f} {node.imbalance:>8.1f}  {' '.join(flags)}")
+    root = tree.root
+    print("-" * 78)
+    print(f"Emergency branches: {root.emergency_va / 1000:,.2f} kVA   "
+          f"Normal: {(root.total_va - root.emergency_va) / 1000:,.2f} kVA")
+    print("=" * 78)
+
+
+if __name__ == '__main__':
+    from vader_load_audit_v2 import HOSPITAL_NODE_SAMPLE
+
+    tree = PanelTree.from_spec({
+        'name': 'Service', 'kind': 'service',
+        'children': [
+            {'name': 'MSB-1', 'kind': 'switchboard', 'children': [
+                {'name': 'DP-Normal', 'kind': 'distribution', 'children': [
+                    {'name': 'LP-2A', 'circuits': [c for c in HOSPITAL_NODE_SAMPLE
+                                                   if c['circuit_name'] == 'General-Receptacles']},
+                ]},
+                {'name': 'ATS-Critical', 'kind': 'distribution', 'emergency': True, 'children': [
+                    {'name': 'CP-ICU', 'circuits': [c for c in HOSPITAL_NODE_SAMPLE
+                                                    if c['circuit_name'].startswith('ICU')]},
+                    {'name': 'CP-OR', 'circuits': [c for c in HOSPITAL_NODE_SAMPLE
+                                                   if c['circuit_name'] == 'OR-Lighting']},
+                ]},
+                {'name': 'ATS-Life-Safety', 'kind': 'distribution', 'emergency': True,
+                 'circuits': [c for c in HOSPITAL_NODE_SAMPLE if c['phases'] == 3]},
+            ]},
+        ],
+    })
+    print_panel_tree_report(tree)
+
+    tree.update_circuit('LP-2A', 'General-Receptacles', amps=40)
+    tree.remove_circuit('ATS-Life-Safety', 'Emergency-Panel')
+    print_panel_tree_report(tree)
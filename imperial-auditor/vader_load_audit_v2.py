@@ -9,55 +9,91 @@ Imperial Auditor v2.0 - NEC 2026 Compliant Load Calculator
 
 import math
 import json
+import sys
 from typing import List, Dict, Any
 
+from critical_circuits import DEFAULT_CLASSIFIER, CriticalCircuitClassifier, is_critical_name
 
-def imperial_load_audit_v2(circuits: List[Dict[str, Any]]) -> Dict[str, Any]:
+
+def _as_circuit_table(circuits):
+    """The CircuitTable itself, or None for plain lists (never imports numpy)"""
+    module = sys.modules.get('circuit_table')
+    if module is not None and isinstance(circuits, module.CircuitTable):
+        return circuits
+    return None
+
+
+def circuit_va(circuit: Dict[str, Any]) -> float:
+    """Volt-amps for one circuit, including the 125% continuous multiplier"""
+    voltage = circuit['voltage']
+    amps = circuit['amps']
+    phases = circuit.get('phases', 1)
+    continuous = circuit.get('continuous', False)
+    
+    # Order 66: 125% for continuous loads (NEC 210.19(A)(1))
+    multiplier = 1.25 if continuous else 1.0
+    
+    # The Force of Three: 3-phase power formula
+    if phases == 3:
+        return voltage * amps * math.sqrt(3) * multiplier
+    return voltage * amps * multiplier
+
+
+def imperial_load_audit_v2(circuits: List[Dict[str, Any]], verbose: bool = True,
+                           validate=None) -> Dict[str, Any]:
     """
     NEC 2026 Compliant Load Auditor
     
     Args:
-        circuits: List of circuit dictionaries with keys:
+        circuits: List of circuit dictionaries (or Circuit records, or a
+            CircuitTable) with keys:
             - voltage: int (e.g., 120, 208, 240, 480)
             - amps: float (current draw)
             - phases: int (1 or 3)
             - continuous: bool (True if load runs 3+ hours)
             - phase: str ('A', 'B', or 'C' for single-phase)
             - circuit_name: str (identifier)
+        verbose: Print the phase imbalance warning
+        validate: None/False (no checks), True or 'raise', or 'quarantine'
+            (see circuit_validation; loads pandas only when used)
     
     Returns:
         Dictionary with total_va, phase_loads, imbalance warning
     """
+    if validate:
+        from circuit_validation import enforce_schedule
+        circuits, report = enforce_schedule(circuits, 'raise' if validate is True else validate)
+        results = imperial_load_audit_v2(circuits, verbose=verbose)
+        results['validation'] = report.summary()
+        return results
+    
+    table = _as_circuit_table(circuits)
+    if table is not None:
+        va = table.va()
+        return summarize_phase_loads(float(va.sum()), table.phase_loads(va), verbose=verbose)
+    
     total_va = 0
     phase_loads = {'A': 0, 'B': 0, 'C': 0}
     
     for circuit in circuits:
-        voltage = circuit['voltage']
-        amps = circuit['amps']
-        phases = circuit.get('phases', 1)
-        continuous = circuit.get('continuous', False)
-        phase = circuit.get('phase', 'A')
-        
-        # Order 66: 125% for continuous loads (NEC 210.19(A)(1))
-        multiplier = 1.25 if continuous else 1.0
-        
-        # The Force of Three: 3-phase power formula
-        if phases == 3:
-            va = voltage * amps * math.sqrt(3) * multiplier
-        else:
-            va = voltage * amps * multiplier
-        
+        va = circuit_va(circuit)
         total_va += va
         
         # Track phase loading for balance check
-        if phases == 1:
-            phase_loads[phase] += va
+        if circuit.get('phases', 1) == 1:
+            phase_loads[circuit.get('phase', 'A')] += va
         else:
             # 3-phase loads spread across all phases
             phase_loads['A'] += va / 3
             phase_loads['B'] += va / 3
             phase_loads['C'] += va / 3
     
+    return summarize_phase_loads(total_va, phase_loads, verbose=verbose)
+
+
+def summarize_phase_loads(total_va: float, phase_loads: Dict[str, float],
+                          verbose: bool = True) -> Dict[str, Any]:
+    """Build the v2 results dictionary from raw totals"""
     # Phase balance check
     max_phase = max(phase_loads.values())
     min_phase = min(phase_loads.values())
@@ -71,28 +107,45 @@ def imperial_load_audit_v2(circuits: List[Dict[str, Any]]) -> Dict[str, Any]:
         'phase_balanced': imbalance < 10
     }
     
-    if not results['phase_balanced']:
+    if verbose and not results['phase_balanced']:
         print(f"⚠️  WARNING: Phase imbalance {imbalance:.1f}% exceeds 10% limit!")
     
     return results
 
 
-def check_n_plus_one_redundancy(circuits: List[Dict[str, Any]]) -> Dict[str, Any]:
+def is_critical_circuit(circuit: Dict[str, Any]) -> bool:
+    """NEC 517 critical circuit, by name keyword"""
+    return is_critical_name(circuit.get('circuit_name', ''))
+
+
+def check_n_plus_one_redundancy(circuits: List[Dict[str, Any]],
+                                classifier: CriticalCircuitClassifier = None) -> Dict[str, Any]:
     """
     NEC 517 - Health Care Facilities
     Verify N+1 redundancy for critical circuits
+    
+    Args:
+        circuits: Circuit dictionaries, Circuit records or a CircuitTable
+        classifier: Custom keyword set (default: shared CRITICAL_KEYWORDS)
     """
-    critical_keywords = ['ICU', 'OR', 'Emergency', 'Life Safety', 'Critical']
-    critical_circuits = [
-        c for c in circuits 
-        if any(k in c.get('circuit_name', '') for k in critical_keywords)
-    ]
+    classifier = classifier or DEFAULT_CLASSIFIER
+    table = _as_circuit_table(circuits)
+    if table is not None:
+        critical = classifier.classify(table.names)
+        count = int(critical.sum())
+        all_continuous = bool(table.continuous[critical].all())
+    else:
+        critical_circuits = [
+            c for c in circuits if classifier.is_critical(c.get('circuit_name', ''))
+        ]
+        count = len(critical_circuits)
+        all_continuous = all(c.get('continuous', False) for c in critical_circuits)
     
     return {
-        'critical_circuits_count': len(critical_circuits),
-        'has_redundancy': len(critical_circuits) >= 2,
-        'meets_nec_517': all(c.get('continuous', False) for c in critical_circuits),
-        'recommendation': 'PASS' if len(critical_circuits) >= 2 else 'ADD REDUNDANCY'
+        'critical_circuits_count': count,
+        'has_redundancy': count >= 2,
+        'meets_nec_517': all_continuous,
+        'recommendation': 'PASS' if count >= 2 else 'ADD REDUNDANCY'
     }
 
 
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Imperial Auditor v2.0 - Streaming Mode
+======================================
+Audits panel schedules too large to hold in memory. Rows are read from
+CSV or JSON Lines in chunks and folded into running accumulators, so
+peak memory is one chunk no matter how big the export is.
+
+The arithmetic is the same, in the same order, as imperial_load_audit_v2
+and check_n_plus_one_redundancy — results match the in-memory auditors
+exactly.
+
+"One circuit at a time, the Empire was built."
+"""
+
+from typing import Any, Dict, Iterable
+
+from panel_schedule import iter_panel_schedule
+from vader_load_audit_v2 import circuit_va, is_critical_circuit, summarize_phase_loads
+
+
+class StreamingLoadAudit:
+    """Running v2 totals: total VA, per-phase loads, largest unit, critical circuits"""
+
+    def __init__(self):
+        self.total_va = 0
+        self.phase_loads = {'A': 0, 'B': 0, 'C': 0}
+        self.max_unit = 0
+        self.circuit_count = 0
+        self.critical_count = 0
+        self.critical_all_continuous = True
+
+    def add(self, circuit: Dict[str, Any]) -> None:
+        """Fold one circuit into the accumulators"""
+        va = circuit_va(circuit)
+        self.total_va += va
+        self.circuit_count += 1
+        if va > self.max_unit:
+            self.max_unit = va
+
+        if circuit.get('phases', 1) == 1:
+            self.phase_loads[circuit.get('phase', 'A')] += va
+        else:
+            self.phase_loads['A'] += va / 3
+            self.phase_loads['B'] += va / 3
+            self.phase_loads['C'] += va / 3
+
+        if is_critical_circuit(circuit):
+            self.critical_count += 1
+            if not circuit.get('continuous', False):
+                self.critical_all_continuous = False
+
+    def add_chunk(self, circuits: Iterable[Dict[str, Any]]) -> None:
+        for circuit in circuits:
+            self.add(circuit)
+
+    def results(self, verbose: bool = True) -> Dict[str, Any]:
+        """v2 results plus N+1 capacity and the NEC 517 redundancy check"""
+        results = summarize_phase_loads(self.total_va, dict(self.phase_loads), verbose=verbose)
+        results['circuit_count'] = self.circuit_count
+        results['max_unit_va'] = round(self.max_unit, 2)
+        results['n1_capacity'] = round(max(self.total_va * 2, self.total_va + self.max_unit), 2)
+        results['redundancy'] = {
+            'critical_circuits_count': self.critical_count,
+            'has_redundancy': self.critical_count >= 2,
+            'meets_nec_517': self.critical_all_continuous,
+            'recommendation': 'PASS' if self.critical_count >= 2 else 'ADD REDUNDANCY'
+        }
+        return results
+
+
+def stream_load_audit(path: str, chunk_size: int = 10_000, verbose: bool = True) -> Dict[str, Any]:
+    """
+    Audit a CSV or JSON Lines schedule in bounded memory
+
+    Args:
+        path: .csv or .jsonl panel schedule
+        chunk_size: Rows parsed per chunk
+        verbose: Print the phase imbalance warning
+
+    Returns:
+        Dictionary with the imperial_load_audit_v2 keys plus circuit_count,
+        max_unit_va, n1_capacity and redundancy
+    """
+    audit = StreamingLoadAudit()
+    for chunk in iter_panel_schedule(path, chunk_size=chunk_size):
+        audit.add_chunk(chunk)
+    return audit.results(verbose=verbose)
+
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Stream-audit a large panel schedule")
+    parser.add_argument('path', help=".csv or .jsonl schedule")
+    parser.add_argument('--chunk-size', type=int, default=10_000)
+    args = parser.parse_args()
+
+    results = stream_load_audit(args.path, chunk_size=args.chunk_size)
+    print(f"Circuits: {results['circuit_count']:,}")
+    print(f"Total Load: {results['total_kva']:,.2f} kVA")
+    for phase, load in results['phase_loads'].items():
+        print(f"  Phase {phase}: {load/1000:,.2f} kVA")
+    print(f"Phase Imbalance: {results['imbalance_percent']:.1f}%")
+    print(f"Largest Single Unit: {results['max_unit_va']:,.0f} VA")
+    print(f"N+1 Capacity: {results['n1_capacity']:,.0f} VA")
+    print(f"Critical Circuits: {results['redundancy']['critical_circuits_count']:,}")
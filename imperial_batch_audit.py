@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+═══════════════════════════════════════════════════════════════
+  IMPERIAL BATCH AUDITOR — PORTFOLIO EDITION
+  Sovereign Circuit Academy • NEC 2026 Compliant
+
+  Audits many facilities in one run:
+  • Iterable of circuit lists, or a directory of CSV/JSON schedules
+  • concurrent.futures process pool with chunking
+  • Results returned in input order
+  • One bad facility never aborts the run
+  • Portfolio summary (total kVA, worst imbalance, N+1 per site)
+  • Optional result cache (sovereign_cache) so re-runs skip
+    facilities whose schedules have not changed
+
+  "The Empire is many hospitals. Audit them all."
+═══════════════════════════════════════════════════════════════
+"""
+
+import os
+import traceback
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional
+
+import sovereign_paths  # noqa: F401
+from panel_schedule import list_panel_schedules, read_panel_schedule
+from vader_load_audit_v2 import check_n_plus_one_redundancy, circuit_va, imperial_load_audit_v2
+
+
+ENGINES = ('v3', 'v2')
+
+
+@dataclass
+class FacilityAudit:
+    """Outcome of one facility in a batch"""
+    name: str
+    ok: bool
+    summary: Dict[str, Any] = field(default_factory=dict)
+    error: Optional[str] = None
+
+
+def _audit_v2(facility: Dict[str, Any]) -> Dict[str, Any]:
+    circuits = facility['circuits']
+    summary = imperial_load_audit_v2(circuits, verbose=False)
+    if hasattr(circuits, 'va'):     # CircuitTable from a columnar schedule
+        max_unit = float(circuits.va().max()) if len(circuits) else 0
+    else:
+        max_unit = max((circuit_va(c) for c in circuits), default=0)
+    summary['max_unit_va'] = round(max_unit, 2)
+    summary['n1_capacity'] = round(max(summary['total_va'] * 2, summary['total_va'] + max_unit), 2)
+    summary['circuit_count'] = len(circuits)
+    summary['redundancy'] = check_n_plus_one_redundancy(circuits)
+    return summary
+
+
+def _audit_v3(facility: Dict[str, Any]) -> Dict[str, Any]:
+    # Imported here so v2-only batches never pay for pandas
+    from imperial_load_audit_v3 import audit_hospital_node
+
+    result = audit_hospital_node(
+        facility['circuits'],
+        sq_ft=facility.get('sq_ft'),
+        climate_zone=facility.get('climate_zone', 'San Diego CA'),
+    )
+    return result.summary()
+
+
+def _audit_facility(facility: Dict[str, Any], engine: str, cache_path) -> Dict[str, Any]:
+    audit = _audit_v3 if engine == 'v3' else _audit_v2
+    if cache_path is None:
+        return audit(facility)
+    from sovereign_cache import get_cache
+
+    cache = get_cache(cache_path if isinstance(cache_path, str) else None)
+    inputs = {k: v for k, v in facility.items() if k != 'name'}
+    return cache.get_or_compute(f'batch_{engine}', audit, inputs)
+
+
+def audit_facility(facility: Dict[str, Any], engine: str = 'v3', cache=None) -> Dict[str, Any]:
+    """
+    Audit one facility dict ({"circuits", "sq_ft", "climate_zone", ...})
+
+    Same summary as a batch entry; v2 never imports numpy or pandas.
+    """
+    if engine not in ENGINES:
+        raise ValueError(f"engine must be one of {ENGINES}, got {engine!r}")
+    return _audit_facility(facility, engine, cache)
+
+
+def _audit_one(job) -> FacilityAudit:
+    """Worker: load (if needed) and audit one facility, never raising"""
+    index, source, engine, cache_path = job
+    if isinstance(source, os.PathLike):
+        source = os.fspath(source)
+    name = f'facility_{index}'
+    if isinstance(source, str):
+        name = os.path.splitext(os.path.basename(source))[0]
+    try:
+        if isinstance(source, str):
+            facility = read_panel_schedule(source)
+        elif isinstance(source, dict):
+            facility = dict(source)
+        else:
+            facility = {'circuits': list(source)}
+        name = facility.setdefault('name', name)
+        summary = _audit_facility(facility, engine, cache_path)
+        return FacilityAudit(name=name, ok=True, summary=summary)
+    except Exception as exc:
+        detail = traceback.format_exception_only(type(exc), exc)[-1].strip()
+        return FacilityAudit(name=name, ok=False, error=detail)
+
+
+def batch_audit(
+    facilities,
+    engine: str = 'v3',
+    max_workers: Optional[int] = None,
+    chunksize: int = 1,
+    cache=None,
+) -> List[FacilityAudit]:
+    """
+    Audit many facilities across a process pool
+
+    Args:
+        facilities: Directory of schedule files, a single schedule file, or
+            an iterable whose items are circuit lists, facility dicts
+            ({"name", "circuits", ...}), or schedule file paths
+        engine: 'v3' (Hospital Node) or 'v2' (pure-Python auditor)
+        max_workers: Pool size (None = CPU count, 1 = run in-process)
+        chunksize: Facilities handed to a worker at a time
+        cache: None (no caching), True (per-process memory cache, plus
+            $SCA_CACHE_DB if set) or a SQLite path shared by all workers
+
+    Returns:
+        One FacilityAudit per facility, in input order, with unique names
+        (a clash such as a.csv / a.json becomes 'a (a.csv)', 'a (a.json)')
+    """
+    if engine not in ENGINES:
+        raise ValueError(f"engine must be one of {ENGINES}, got {engine!r}")
+    if isinstance(facilities, (str, os.PathLike)):
+        path = os.fspath(facilities)
+        facilities = list_panel_schedules(path) if os.path.isdir(path) else [path]
+
+    jobs = [(i, source, engine, cache) for i, source in enumerate(facilities)]
+    if max_workers == 1:
+        results = [_audit_one(job) for job in jobs]
+    else:
+        # Imported here so single-facility callers (sovereign_cli) start fast
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            results = list(pool.map(_audit_one, jobs, chunksize=chunksize))
+    return _unique_names(results, [job[1] for job in jobs])
+
+
+def _unique_names(results: List[FacilityAudit], sources: List[Any]) -> List[FacilityAudit]:
+    """Disambiguate facilities sharing a name so portfolio keys never collide"""
+    counts = Counter(r.name for r in results)
+    for i, (result, source) in enumerate(zip(results, sources)):
+        if counts[result.name] > 1:
+            if isinstance(source, (str, os.PathLike)):
+                result.name = f'{result.name} ({os.path.basename(os.fspath(source))})'
+            else:
+                result.name = f'{result.name} #{i}'
+    taken = Counter(r.name for r in results)
+    for i, result in enumerate(results):
+        if taken[result.name] > 1:      # same file name in two directories
+            result.name = f'{result.name} #{i}'
+    return results
+
+
+def portfolio_summary(results: Iterable[FacilityAudit]) -> Dict[str, Any]:
+    """Combine facility audits into one portfolio report"""
+    results = list(results)
+    ok = [r for r in results if r.ok]
+    worst = max(ok, key=lambda r: r.summary['imbalance_percent'], default=None)
+    return {
+        'facilities': len(results),
+        'audited': len(ok),
+        'failed': {r.name: r.error for r in results if not r.ok},
+        'total_kva': round(sum(r.summary['total_va'] for r in ok) / 1000, 2),
+        'worst_imbalance': {
+            'facility': worst.name,
+            'imbalance_percent': worst.summary['imbalance_percent'],
+        } if worst else None,
+        'n1_capacity_va': {r.name: r.summary['n1_capacity'] for r in ok},
+    }
+
+
+def print_portfolio_report(summary: Dict[str, Any]) -> None:
+    """Print formatted portfolio report"""
+    print()
+    print("═" * 60)
+    print("  IMPERIAL BATCH AUDIT — PORTFOLIO SUMMARY")
+    print("═" * 60)
+    print(f"Facilities: {summary['audited']}/{summary['facilities']} audited")
+    print(f"Total Load: {summary['total_kva']:,.2f} kVA")
+    worst = summary['worst_imbalance']
+    if worst:
+        print(f"Worst Imbalance: {worst['facility']} ({worst['imbalance_percent']:.1f}%)")
+    print("N+1 Capacity per Site:")
+    for name, capacity in summary['n1_capacity_va'].items():
+        print(f"  {name}: {capacity:,.0f} VA")
+    for name, error in summary['failed'].items():
+        print(f"  ❌ {name}: {error}")
+    print("═" * 60)
+
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Audit a directory of panel schedules")
+    parser.add_argument('directory')
+    parser.add_argument('--engine', choices=ENGINES, default='v3')
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--chunksize', type=int, default=1)
+    parser.add_argument('--cache', metavar='DB', default=None,
+                        help="SQLite result cache shared across runs")
+    parser.add_argument('--export', metavar='PATH', default=None,
+                        help="write per-facility summaries (.json/.jsonl/.parquet/.csv)")
+    args = parser.parse_args()
+
+    results = batch_audit(args.directory, engine=args.engine,
+                          max_workers=args.workers, chunksize=args.chunksize,
+                          cache=args.cache)
+    print_portfolio_report(portfolio_summary(results))
+    if args.export:
+        from audit_io import write_audit_summaries
+        print(f"📦 Summaries exported: {write_audit_summaries(results, args.export)}")
@@ -16,43 +16,152 @@
 ═══════════════════════════════════════════════════════════════
 """
 
-import pandas as pd
-import matplotlib.pyplot as plt
-import math
 import json
+import os
+import warnings
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+import sovereign_paths  # noqa: F401
+from audit_io import read_schedule_frame
+from circuit_table import Circuit, CircuitTable
+from circuit_validation import ValidationReport, enforce_schedule
+from climate_data import DEFAULT_COOLING_FACTOR, DEFAULT_HEATING_FACTOR, climate_for
+from imperial_trace import stage
+from imperial_va_engine import (
+    compute_circuit_va,
+    compute_phase_loads,
+    critical_mask,
+    phase_imbalance,
+)
+
+
+@dataclass
+class HospitalAuditResult:
+    """Numbers produced by one v3 audit — no printing, no plotting"""
+    df: pd.DataFrame
+    total_va: float
+    max_unit: float
+    n1_capacity_option1: float
+    n1_capacity_option2: float
+    n1_capacity: float
+    phase_loads: Dict[str, float]
+    imbalance: float
+    critical_circuits: pd.DataFrame
+    sq_ft: Optional[float] = None
+    climate_zone: Any = "San Diego CA"     # name, ZIP or (lat, lon)
+    cooling_va: float = 0
+    heating_va: float = 0
+    validation: Optional[ValidationReport] = None
+
+    @property
+    def phase_balanced(self) -> bool:
+        return self.imbalance <= 10
+
+    @property
+    def total_with_hvac(self) -> float:
+        return self.total_va + self.cooling_va + self.heating_va
+
+    def summary(self) -> Dict[str, Any]:
+        """JSON-ready summary (everything except the per-circuit frames)"""
+        return {
+            'total_va': round(float(self.total_va), 2),
+            'total_kva': round(float(self.total_va) / 1000, 2),
+            'max_unit_va': round(float(self.max_unit), 2),
+            'circuit_count': len(self.df),
+            'n1_capacity_option1': round(float(self.n1_capacity_option1), 2),
+            'n1_capacity_option2': round(float(self.n1_capacity_option2), 2),
+            'n1_capacity': round(float(self.n1_capacity), 2),
+            'phase_loads': {k: round(v, 2) for k, v in self.phase_loads.items()},
+            'imbalance_percent': round(float(self.imbalance), 2),
+            'phase_balanced': self.phase_balanced,
+            'critical_circuits': self.critical_circuits['circuit_name'].tolist(),
+            'sq_ft': self.sq_ft,
+            'climate_zone': self.climate_zone,
+            'cooling_va': float(self.cooling_va),
+            'heating_va': float(self.heating_va),
+            'total_with_hvac': round(float(self.total_with_hvac), 2),
+            **({'validation': self.validation.summary()} if self.validation is not None else {}),
+        }
 
-def imperial_load_audit_v3(load_data, sq_ft=None, climate_zone="San Diego CA"):
+    def to_json(self, **kwargs) -> str:
+        return json.dumps(self.summary(), **kwargs)
+
+
+def hospital_hvac_factors(climate_zone) -> Tuple[float, float]:
     """
-    Imperial Load Auditor v3.0 - Hospital Node Edition
+    (cooling, heating) VA per sq ft for a site — name, ZIP or (lat, lon)
+
+    Unknown sites fall back to 45 / 35 VA per sq ft with a warning.
+    """
+    record = climate_for(climate_zone)
+    if record is None:
+        warnings.warn(
+            f"No climate design data for {climate_zone!r}; using default "
+            f"{DEFAULT_COOLING_FACTOR}/{DEFAULT_HEATING_FACTOR} VA per sq ft",
+            stacklevel=3,
+        )
+        return DEFAULT_COOLING_FACTOR, DEFAULT_HEATING_FACTOR
+    # Whole-number factors stay ints so VA totals keep their legacy type
+    return tuple(int(f) if float(f).is_integer() else f
+                 for f in (record.cooling_factor, record.heating_factor))
+
+
+def audit_hospital_node(load_data, sq_ft=None, climate_zone="San Diego CA",
+                        classifier=None, validate=None) -> HospitalAuditResult:
+    """
+    Headless Imperial Load Audit v3.0 — pure computation core
     
     Args:
-        load_data: List of circuit dictionaries
+        load_data: List of circuit dictionaries or Circuit records,
+            a CircuitTable, a DataFrame, or a schedule file path
+            (.csv/.json/.jsonl/.parquet/.arrow)
         sq_ft: Building square footage (for Manual J)
-        climate_zone: Location for climate calculations
+        climate_zone: Location for climate calculations — name, ZIP
+            or (lat, lon), resolved via climate_data
+        classifier: CriticalCircuitClassifier with a custom keyword set
+        validate: None/False (no checks), True or 'raise' (raise
+            ScheduleValidationError listing every violation), or
+            'quarantine' (audit only the valid rows; see result.validation —
+            a missing voltage/amps column still raises)
     
     Returns:
-        df: DataFrame with circuit analysis
-        total_va: Total volt-amps
-        n1_capacity: N+1 redundancy capacity
+        HospitalAuditResult with per-circuit VA and all audit totals
     """
     
-    df = pd.DataFrame(load_data)
+    with stage('v3.load') as st:
+        if isinstance(load_data, (str, os.PathLike)):
+            # A frame, not a CircuitTable, so extra columns (panel, ...) survive
+            df = read_schedule_frame(os.fspath(load_data))
+        elif isinstance(load_data, CircuitTable):
+            df = load_data.to_frame()
+        elif isinstance(load_data, list) and load_data and isinstance(load_data[0], Circuit):
+            df = pd.DataFrame([c.to_dict() for c in load_data])
+        else:
+            df = pd.DataFrame(load_data)
+        st.note(rows=len(df))
+    
+    validation = None
+    if validate:
+        with stage('v3.validate', rows=len(df)) as st:
+            df, validation = enforce_schedule(df, 'raise' if validate is True else validate)
+            if not validation.valid:
+                df = df.reset_index(drop=True)
+            st.note(violations=len(validation.violations))
     
     # ═══════════════════════════════════════════════════════
     # CORE: 3-Phase + 125% Continuous (NEC 210.19(A)(1))
     # ═══════════════════════════════════════════════════════
-    df["va"] = df.apply(
-        lambda r: (
-            r["voltage"] * r["amps"] * math.sqrt(3) 
-            if r.get("phases", 1) == 3 
-            else r["voltage"] * r["amps"]
-        ) * (1.25 if r.get("continuous", False) else 1.0),
-        axis=1
-    )
-    
-    total_va = df["va"].sum()
-    max_unit = df["va"].max()
+    with stage('v3.va', rows=len(df)):
+        df["va"] = compute_circuit_va(df)
+        
+        total_va = df["va"].sum()
+        max_unit = df["va"].max()
     
     # ═══════════════════════════════════════════════════════
     # N+1 REDUNDANCY (Imperial Guard - NEC 517)
@@ -63,20 +172,10 @@ def imperial_load_audit_v3(load_data, sq_ft=None, climate_zone="San Diego CA"):
     n1_capacity_option2 = total_va + max_unit
     n1_capacity = max(n1_capacity_option1, n1_capacity_option2)
     
-    # Phase balance check
-    phase_loads = {}
-    for idx, row in df.iterrows():
-        phase = row.get('phase', 'A')
-        if phase not in phase_loads:
-            phase_loads[phase] = 0
-        phase_loads[phase] += row['va']
-    
-    if len(phase_loads) > 1:
-        max_phase = max(phase_loads.values())
-        min_phase = min(phase_loads.values())
-        imbalance = ((max_phase - min_phase) / max_phase) * 100 if max_phase > 0 else 0
-    else:
-        imbalance = 0
+    # Phase balance check (3-phase loads split across A/B/C)
+    with stage('v3.phase_balance', rows=len(df)):
+        phase_loads = compute_phase_loads(df, df["va"].to_numpy())
+        imbalance = phase_imbalance(phase_loads)
     
     # ═══════════════════════════════════════════════════════
     # MANUAL J CLIMATE MODULE (Thermodynamics)
@@ -85,108 +184,269 @@ def imperial_load_audit_v3(load_data, sq_ft=None, climate_zone="San Diego CA"):
     heating_va = 0
     
     if sq_ft:
-        # Hospital-grade estimate (includes medical equipment, 15+ ACH)
-        # Base: 45 VA/sqft for cooling (hospital is 3-4× residential)
-        cooling_va = round(sq_ft * 45, 0)
-        
-        # Heating varies by climate zone
-        climate_factors = {
-            "San Diego CA": 25,
-            "Los Angeles CA": 30,
-            "Phoenix AZ": 50,
-            "Chicago IL": 45,
-            "New York NY": 40,
-            "Seattle WA": 20
-        }
-        heating_factor = climate_factors.get(climate_zone, 35)
-        heating_va = round(sq_ft * heating_factor, 0)
-        
-        print(f"\n🌡️  MANUAL J THERMODYNAMIC LOAD ({climate_zone}):")
-        print(f"   Building: {sq_ft:,} sq ft")
-        print(f"   Cooling Load: {cooling_va:,.0f} VA")
-        print(f"   Heating Load: {heating_va:,.0f} VA")
+        with stage('v3.manual_j', climate_zone=str(climate_zone)):
+            # Hospital-grade estimate (includes medical equipment, 15+ ACH)
+            # Base: 45 VA/sqft for cooling (hospital is 3-4× residential)
+            # Heating varies by climate zone
+            cooling_factor, heating_factor = hospital_hvac_factors(climate_zone)
+            cooling_va = round(sq_ft * cooling_factor, 0)
+            heating_va = round(sq_ft * heating_factor, 0)
     
     # ═══════════════════════════════════════════════════════
     # CRITICAL CIRCUIT CHECK (NEC Article 517)
     # ═══════════════════════════════════════════════════════
-    critical_keywords = ['ICU', 'OR', 'Emergency', 'Life Safety', 'Critical', 'Nurse']
-    critical_circuits = df[df['circuit_name'].apply(
-        lambda x: any(k in str(x) for k in critical_keywords)
-    )]
+    with stage('v3.critical', rows=len(df)) as st:
+        critical_circuits = df[critical_mask(df['circuit_name'], classifier)]
+        st.note(matches=len(critical_circuits))
+    
+    return HospitalAuditResult(
+        df=df,
+        total_va=total_va,
+        max_unit=max_unit,
+        n1_capacity_option1=n1_capacity_option1,
+        n1_capacity_option2=n1_capacity_option2,
+        n1_capacity=n1_capacity,
+        phase_loads=phase_loads,
+        imbalance=imbalance,
+        critical_circuits=critical_circuits,
+        sq_ft=sq_ft,
+        climate_zone=climate_zone,
+        cooling_va=cooling_va,
+        heating_va=heating_va,
+        validation=validation,
+    )
+
+
+def print_hospital_report(result: HospitalAuditResult) -> None:
+    """Print the Imperial Report for a v3 audit"""
+    if result.sq_ft:
+        print(f"\n🌡️  MANUAL J THERMODYNAMIC LOAD ({result.climate_zone}):")
+        print(f"   Building: {result.sq_ft:,} sq ft")
+        print(f"   Cooling Load: {result.cooling_va:,.0f} VA")
+        print(f"   Heating Load: {result.heating_va:,.0f} VA")
     
-    # ═══════════════════════════════════════════════════════
-    # IMPERIAL REPORT
-    # ═══════════════════════════════════════════════════════
     print("\n" + "═" * 60)
     print("  ✅ IMPERIAL LOAD AUDIT v3.0 — HOSPITAL NODE")
     print("═" * 60)
     print(f"\n⚡ ELECTRICAL LOAD:")
-    print(f"   Total Requisitioned: {total_va:,.0f} VA ({total_va/1000:,.1f} kVA)")
-    print(f"   Largest Single Unit: {max_unit:,.0f} VA")
-    print(f"   Circuit Count: {len(df)}")
+    print(f"   Total Requisitioned: {result.total_va:,.0f} VA ({result.total_va/1000:,.1f} kVA)")
+    print(f"   Largest Single Unit: {result.max_unit:,.0f} VA")
+    print(f"   Circuit Count: {len(result.df)}")
     
     print(f"\n🛡️  N+1 REDUNDANCY (Imperial Guard):")
-    print(f"   Option 1 (Full Mirror): {n1_capacity_option1:,.0f} VA")
-    print(f"   Option 2 (N+1 Efficient): {n1_capacity_option2:,.0f} VA")
-    print(f"   ✅ SELECTED: {n1_capacity:,.0f} VA")
+    print(f"   Option 1 (Full Mirror): {result.n1_capacity_option1:,.0f} VA")
+    print(f"   Option 2 (N+1 Efficient): {result.n1_capacity_option2:,.0f} VA")
+    print(f"   ✅ SELECTED: {result.n1_capacity:,.0f} VA")
     
-    if imbalance > 10:
-        print(f"\n⚠️  PHASE BALANCE WARNING: {imbalance:.1f}% imbalance exceeds 10% limit!")
+    if result.imbalance > 10:
+        print(f"\n⚠️  PHASE BALANCE WARNING: {result.imbalance:.1f}% imbalance exceeds 10% limit!")
     else:
-        print(f"\n✅ PHASE BALANCE: {imbalance:.1f}% (within 10% limit)")
+        print(f"\n✅ PHASE BALANCE: {result.imbalance:.1f}% (within 10% limit)")
     
+    critical_circuits = result.critical_circuits
     if len(critical_circuits) > 0:
         print(f"\n🏥 CRITICAL CIRCUITS (NEC 517): {len(critical_circuits)} circuits")
-        for idx, row in critical_circuits.iterrows():
-            print(f"   • {row['circuit_name']}: {row['va']:,.0f} VA")
+        for name, va in zip(critical_circuits['circuit_name'], critical_circuits['va']):
+            print(f"   • {name}: {va:,.0f} VA")
     
-    if sq_ft:
-        total_with_hvac = total_va + cooling_va + heating_va
-        print(f"\n🌡️  TOTAL WITH HVAC: {total_with_hvac:,.0f} VA")
+    if result.validation is not None and not result.validation.valid:
+        print(f"\n🚧 QUARANTINED: {len(result.validation.bad_rows):,} of {result.validation.rows:,} rows "
+              f"({len(result.validation.violations):,} violations)")
+    
+    if result.sq_ft:
+        print(f"\n🌡️  TOTAL WITH HVAC: {result.total_with_hvac:,.0f} VA")
     
     print("\n" + "═" * 60)
+
+
+THERMAL_GROUPINGS = ('panel', 'phase', 'critical')
+DEFAULT_TOP_N = 40
+
+
+def _top_n_bars(labels: np.ndarray, values: np.ndarray, critical: np.ndarray, top_n: int,
+                noun: str) -> Tuple[List[str], np.ndarray, np.ndarray]:
+    """Largest top_n bars (descending) plus one 'Other' bar for the rest — O(n)"""
+    if len(values) <= top_n:
+        return [str(label) for label in labels], values, critical
+    top = np.argpartition(values, -top_n)[-top_n:]
+    top = top[np.argsort(-values[top], kind='stable')]
+    rest = np.ones(len(values), dtype=bool)
+    rest[top] = False
+    other = f"Other ({int(rest.sum()):,} {noun})"
+    return ([str(label) for label in labels[top]] + [other],
+            np.append(values[top], values[rest].sum()),
+            np.append(critical[top], critical[rest].any()))
+
+
+def thermal_signature_bars(result: HospitalAuditResult, group_by: Optional[str] = None,
+                           top_n: int = DEFAULT_TOP_N) -> Tuple[List[str], np.ndarray, np.ndarray]:
+    """
+    Bars for the thermal signature: (labels, VA, contains-critical flags)
+
+    group_by=None keeps one bar per circuit in schedule order while the
+    schedule has at most top_n circuits; beyond that it shows the top_n
+    largest circuits plus an 'Other' bar. 'panel' sums by the schedule's
+    panel column (top_n panels + 'Other'), 'phase' shows the v3 per-phase
+    loads and 'critical' splits NEC 517 critical from other circuits.
+    At most top_n + 1 bars whatever the schedule size.
+    """
+    if group_by is not None and group_by not in THERMAL_GROUPINGS:
+        raise ValueError(f"group_by must be one of {THERMAL_GROUPINGS} or None, got {group_by!r}")
+    if top_n < 1:
+        raise ValueError(f"top_n must be at least 1, got {top_n!r}")
+    df = result.df
+    va = df['va'].to_numpy(dtype=np.float64)
+    is_critical = df.index.isin(result.critical_circuits.index)
+
+    if group_by == 'phase':
+        return (list(result.phase_loads), np.array(list(result.phase_loads.values()), dtype=np.float64),
+                np.zeros(len(result.phase_loads), dtype=bool))
+    if group_by == 'critical':
+        return (['Critical (NEC 517)', 'Non-critical'],
+                np.array([va[is_critical].sum(), va[~is_critical].sum()]),
+                np.array([True, False]))
+    if group_by == 'panel':
+        if 'panel' not in df.columns:
+            raise ValueError("group_by='panel' needs a 'panel' column in the schedule")
+        grouped = pd.DataFrame({'panel': df['panel'].fillna('(no panel)').astype(str).to_numpy(),
+                                'va': va, 'critical': is_critical})
+        grouped = grouped.groupby('panel', sort=False).agg(va=('va', 'sum'), critical=('critical', 'any'))
+        return _top_n_bars(grouped.index.to_numpy(), grouped['va'].to_numpy(),
+                           grouped['critical'].to_numpy(), top_n, 'panels')
+    if len(df) <= top_n:
+        return df['circuit_name'].astype(str).tolist(), va, is_critical
+    return _top_n_bars(df['circuit_name'].to_numpy(), va, is_critical, top_n, 'circuits')
+
+
+def plot_thermal_signature(result: HospitalAuditResult, filename=None, dpi=300, show=False,
+                           group_by: Optional[str] = None, top_n: int = DEFAULT_TOP_N,
+                           image_format: Optional[str] = None, rasterized: bool = True):
+    """
+    Render the thermal signature chart for a v3 audit
     
-    # ═══════════════════════════════════════════════════════
-    # THERMAL SIGNATURE VISUALIZATION
-    # ═══════════════════════════════════════════════════════
-    fig, ax = plt.subplots(figsize=(14, 8))
+    matplotlib is imported here, not at module load. Without `show` the
+    chart is drawn on a standalone Figure (no pyplot, no GUI backend), so
+    it is safe in headless workers.
+
+    Large schedules are aggregated first (see thermal_signature_bars), so
+    render time and image size stay flat as the circuit count grows.
     
-    colors = ['darkred' if c in critical_circuits['circuit_name'].values else 'firebrick' 
-              for c in df['circuit_name']]
+    Args:
+        result: HospitalAuditResult from audit_hospital_node
+        filename: Image path; None = timestamped name, False = don't save
+        dpi: Output resolution
+        show: Open an interactive window (plt.show) after saving
+        group_by: None (circuits), 'panel', 'phase' or 'critical'
+        top_n: Most bars drawn before the rest go into an 'Other' bar
+        image_format: 'png', 'svg', 'pdf', ... (default: from filename, else png)
+        rasterized: Rasterize the bars inside vector formats
     
-    bars = ax.bar(range(len(df)), df['va'], color=colors, alpha=0.8)
+    Returns:
+        Path of the saved image, or None if not saved
+    """
+    with stage('v3.render', circuits=len(result.df), dpi=dpi) as st:
+        if show:
+            import matplotlib.pyplot as plt
+            fig = plt.figure(figsize=(14, 8))
+        else:
+            from matplotlib.figure import Figure
+            fig = Figure(figsize=(14, 8))
+        ax = fig.add_subplot()
+        labels, values, critical = thermal_signature_bars(result, group_by, top_n)
+        st.note(bars=len(values))
+        n1_capacity = result.n1_capacity
+        colors = np.where(critical, 'darkred', 'firebrick')
+        ax.bar(range(len(values)), values, color=colors, alpha=0.8, rasterized=rasterized)
+        # N+1 redundancy line
+        ax.axhline(y=n1_capacity, color='gold', linestyle='--', linewidth=3, 
+                   label='N+1 REDUNDANCY CEILING')
+        ax.fill_between(range(len(values)), n1_capacity, color='gold', alpha=0.15, 
+                        label='Imperial Guard Buffer')
+        # HVAC loads
+        if result.sq_ft:
+            ax.axhline(y=result.total_va + result.cooling_va, color='cyan', linestyle=':', linewidth=2,
+                       label=f'+ Cooling ({result.cooling_va:,.0f} VA)')
+        ax.set_title(f'HOSPITAL NODE THERMAL SIGNATURE\nN+1 Redundancy + Manual J Enforced', 
+                     color='red', fontsize=16, fontweight='bold')
+        ax.set_ylabel('Volt-Amps (VA)', fontsize=12)
+        ax.set_xlabel({'panel': 'Panel', 'phase': 'Phase', 'critical': 'NEC 517 Class'}.get(group_by, 'Circuit'),
+                      fontsize=12)
+        ax.set_xticks(range(len(values)))
+        ax.set_xticklabels(labels, rotation=45, ha='right')
+        ax.legend(loc='upper right')
+        ax.grid(True, alpha=0.3)
+        fig.tight_layout()
+        saved = None
+        if filename is not False:
+            if filename is None:
+                timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+                filename = f"thermal_signature_hospital_{timestamp}.{image_format or 'png'}"
+            fig.savefig(filename, dpi=dpi, format=image_format, facecolor='#0a0a0a')
+            saved = filename
+        if show:
+            plt.show()
     
-    # N+1 redundancy line
-    ax.axhline(y=n1_capacity, color='gold', linestyle='--', linewidth=3, 
-               label='N+1 REDUNDANCY CEILING')
-    ax.fill_between(range(len(df)), n1_capacity, color='gold', alpha=0.15, 
-                    label='Imperial Guard Buffer')
+    return saved
+
+
+def plot_thermal_signature_async(result: HospitalAuditResult, filename=None, dpi=300,
+                                 executor: Optional[ProcessPoolExecutor] = None,
+                                 **plot_options: Any) -> Future:
+    """
+    Render the thermal signature in a background process
     
-    # HVAC loads
-    if sq_ft:
-        ax.axhline(y=total_va + cooling_va, color='cyan', linestyle=':', linewidth=2,
-                   label=f'+ Cooling ({cooling_va:,.0f} VA)')
+    The audit numbers are already available on `result`; the returned
+    Future resolves to the saved image path once rendering finishes.
+    Pass a shared executor when rendering many facilities; plot_options
+    (group_by, top_n, image_format, ...) go to plot_thermal_signature.
+    """
+    if filename is None:
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        filename = f"thermal_signature_hospital_{timestamp}.{plot_options.get('image_format') or 'png'}"
+    if executor is None:
+        executor = ProcessPoolExecutor(max_workers=1)
+        future = executor.submit(plot_thermal_signature, result, filename, dpi, **plot_options)
+        executor.shutdown(wait=False)
+        return future
+    return executor.submit(plot_thermal_signature, result, filename, dpi, **plot_options)
+
+
+def imperial_load_audit_v3(load_data, sq_ft=None, climate_zone="San Diego CA",
+                           report=True, plot=True, show=True):
+    """
+    Imperial Load Auditor v3.0 - Hospital Node Edition
     
-    ax.set_title(f'HOSPITAL NODE THERMAL SIGNATURE\nN+1 Redundancy + Manual J Enforced', 
-                 color='red', fontsize=16, fontweight='bold')
-    ax.set_ylabel('Volt-Amps (VA)', fontsize=12)
-    ax.set_xlabel('Circuit', fontsize=12)
-    ax.set_xticks(range(len(df)))
-    ax.set_xticklabels(df['circuit_name'], rotation=45, ha='right')
-    ax.legend(loc='upper right')
-    ax.grid(True, alpha=0.3)
+    Args:
+        load_data: Circuits in any form audit_hospital_node accepts
+        sq_ft: Building square footage (for Manual J)
+        climate_zone: Location for climate calculations
+        report: Print the Imperial Report
+        plot: Save the thermal signature PNG (True), render it in a
+            background process ('background'), or skip it (False)
+        show: Open the chart window after saving (plot=True only)
     
-    plt.tight_layout()
+    Returns:
+        df: DataFrame with circuit analysis
+        total_va: Total volt-amps
+        n1_capacity: N+1 redundancy capacity
+    """
+    result = audit_hospital_node(load_data, sq_ft=sq_ft, climate_zone=climate_zone)
     
-    # Save with timestamp
-    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-    filename = f"thermal_signature_hospital_{timestamp}.png"
-    plt.savefig(filename, dpi=300, facecolor='#0a0a0a')
-    print(f"\n📊 Thermal Signature saved: {filename}")
+    if report:
+        with stage('v3.report'):
+            print_hospital_report(result)
     
-    plt.show()
+    if plot == 'background':
+        future = plot_thermal_signature_async(result)
+        future.add_done_callback(
+            lambda f: print(f"\n📊 Thermal Signature saved: {f.result()}") if report else None
+        )
+    elif plot:
+        filename = plot_thermal_signature(result, show=show)
+        if report:
+            print(f"\n📊 Thermal Signature saved: {filename}")
     
-    return df, total_va, n1_capacity
+    return result.df, result.total_va, result.n1_capacity
 
 
 # ═══════════════════════════════════════════════════════════
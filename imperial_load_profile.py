@@ -0,0 +1,296 @@
+#!/usr/bin/env python3
+"""
+═══════════════════════════════════════════════════════════════
+  IMPERIAL LOAD PROFILE — 8760-HOUR SIMULATION
+  Sovereign Circuit Academy • NEC 2026 Compliant
+
+  Replaces the static "TOTAL WITH HVAC" sum with a full year of
+  hourly demand:
+  • Circuits carry a daily schedule and a duty cycle
+  • Manual J driven by an hourly outdoor temperature series
+  • Heating and cooling only where the weather calls for them
+  • Coincident peak, load factor and hourly N+1 headroom
+
+  Circuits are grouped by schedule, so the year is one
+  (8760 × schedules) @ (schedules × phases) matrix product.
+
+  "Heat and cold never strike together. Neither should the math."
+═══════════════════════════════════════════════════════════════
+"""
+
+import os
+from dataclasses import dataclass
+from typing import Any, Dict, Mapping, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+import sovereign_paths  # noqa: F401
+from circuit_table import CircuitTable
+from imperial_va_engine import PHASES, compute_circuit_va
+from manual_j_vectorized import manual_j_thermal_load_array
+
+
+HOURS_PER_YEAR = 8760
+
+# Fraction of connected load drawn in each hour of the day (hour 0 = midnight)
+DAILY_SCHEDULES: Dict[str, Sequence[float]] = {
+    'continuous': [1.0] * 24,
+    'business': [0.3] * 7 + [1.0] * 11 + [0.5] * 2 + [0.3] * 4,
+    'lighting': [0.4] * 6 + [0.8] * 2 + [1.0] * 10 + [0.9] * 4 + [0.5] * 2,
+    'night': [1.0] * 6 + [0.2] * 12 + [1.0] * 6,
+    'standby': [0.1] * 24,
+}
+
+
+def load_hourly_temperatures(path: str, column: str = 'temp_f') -> np.ndarray:
+    """
+    Read an 8760-hour outdoor temperature series (°F) from a local file
+
+    Accepts a .npy array, or a CSV with a `column` header (a single-column
+    CSV without that header is read as-is). Leap-year files (8784 hours)
+    drop 29 February.
+    """
+    if path.lower().endswith('.npy'):
+        temps = np.load(path)
+    else:
+        df = pd.read_csv(path)
+        if column not in df.columns:
+            df = pd.read_csv(path, header=None, names=[column])
+        temps = df[column].to_numpy()
+    temps = np.asarray(temps, dtype=np.float64).ravel()
+    if len(temps) == HOURS_PER_YEAR + 24:
+        temps = np.concatenate([temps[:59 * 24], temps[60 * 24:]])
+    if len(temps) != HOURS_PER_YEAR:
+        raise ValueError(f"{os.path.basename(path)}: expected {HOURS_PER_YEAR} hourly values, got {len(temps)}")
+    return temps
+
+
+def synthetic_temperatures(mean_f: float = 65.0, annual_swing_f: float = 15.0,
+                           daily_swing_f: float = 10.0) -> np.ndarray:
+    """Smooth sinusoidal design year (coldest mid-January, warmest mid-July, 3 PM daily high)"""
+    hours = np.arange(HOURS_PER_YEAR)
+    day = hours / 24.0
+    seasonal = -np.cos(2 * np.pi * (day - 15) / 365.0) * annual_swing_f
+    diurnal = -np.cos(2 * np.pi * ((hours % 24) - 3) / 24.0) * daily_swing_f / 2
+    return mean_f + seasonal + diurnal
+
+
+def _schedule_matrix(names: Sequence[str], schedules: Mapping[str, Sequence[float]]) -> np.ndarray:
+    """(8760 × len(names)) fractions: 24-hour profiles tiled over 365 days, or full 8760 profiles"""
+    columns = []
+    for name in names:
+        if name not in schedules:
+            raise KeyError(f"Unknown schedule {name!r}; known: {sorted(schedules)}")
+        profile = np.asarray(schedules[name], dtype=np.float64)
+        if len(profile) == 24:
+            profile = np.tile(profile, HOURS_PER_YEAR // 24)
+        elif len(profile) != HOURS_PER_YEAR:
+            raise ValueError(f"Schedule {name!r} must have 24 or {HOURS_PER_YEAR} values")
+        columns.append(profile)
+    return np.column_stack(columns)
+
+
+@dataclass
+class LoadProfileResult:
+    """A simulated year of demand"""
+    hourly_phase_va: np.ndarray     # (8760, 3) electrical + HVAC per phase
+    hourly_hvac_va: np.ndarray      # (8760,)
+    connected_va: float
+    max_unit: float
+    n1_capacity: float
+    static_total_with_hvac: float
+
+    @property
+    def hourly_va(self) -> np.ndarray:
+        return self.hourly_phase_va.sum(axis=1)
+
+    @property
+    def coincident_peak_va(self) -> float:
+        return float(self.hourly_va.max())
+
+    @property
+    def peak_hour(self) -> int:
+        return int(self.hourly_va.argmax())
+
+    @property
+    def load_factor(self) -> float:
+        hourly = self.hourly_va
+        peak = hourly.max()
+        return float(hourly.mean() / peak) if peak > 0 else 0.0
+
+    @property
+    def hourly_headroom_va(self) -> np.ndarray:
+        """N+1 capacity minus demand, per hour"""
+        return self.n1_capacity - self.hourly_va
+
+    @property
+    def hourly_imbalance(self) -> np.ndarray:
+        """v2-style percent imbalance, per hour"""
+        max_phase = self.hourly_phase_va.max(axis=1)
+        min_phase = self.hourly_phase_va.min(axis=1)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return np.where(max_phase > 0, (max_phase - min_phase) / max_phase * 100, 0.0)
+
+    def summary(self) -> Dict[str, Any]:
+        headroom = self.hourly_headroom_va
+        return {
+            'connected_va': round(self.connected_va, 2),
+            'coincident_peak_va': round(self.coincident_peak_va, 2),
+            'peak_hour': self.peak_hour,
+            'static_total_with_hvac': round(self.static_total_with_hvac, 2),
+            'load_factor': round(self.load_factor, 4),
+            'annual_kwh': round(float(self.hourly_va.sum()) / 1000, 1),
+            'n1_capacity': round(self.n1_capacity, 2),
+            'min_headroom_va': round(float(headroom.min()), 2),
+            'hours_over_n1': int((headroom < 0).sum()),
+            'hours_imbalanced': int((self.hourly_imbalance > 10).sum()),
+        }
+
+    def to_frame(self) -> pd.DataFrame:
+        """One row per hour of the year"""
+        df = pd.DataFrame(self.hourly_phase_va, columns=[f'phase_{p}_va' for p in PHASES])
+        df.insert(0, 'hour', np.arange(len(df)))
+        df['hvac_va'] = self.hourly_hvac_va
+        df['total_va'] = self.hourly_va
+        df['headroom_va'] = self.hourly_headroom_va
+        return df
+
+
+def _hourly_circuit_va(df: pd.DataFrame, va: np.ndarray,
+                       schedules: Mapping[str, Sequence[float]]) -> np.ndarray:
+    """(8760 × 3) scheduled circuit demand per phase"""
+    duty = df['duty_cycle'].fillna(1.0).to_numpy(dtype=np.float64) if 'duty_cycle' in df else 1.0
+    drawn = va * duty
+
+    # Per-circuit phase weights (v2 split), then collapse circuits → schedules
+    three_phase = (df['phases'].fillna(1).to_numpy() == 3) if 'phases' in df else np.zeros(len(df), bool)
+    labels = df['phase'].fillna('A').astype(str).to_numpy() if 'phase' in df else np.full(len(df), 'A')
+    phase_code = pd.Categorical(labels, categories=PHASES).codes
+    if ((phase_code < 0) & ~three_phase).any():
+        raise ValueError(f"Unknown phase label(s); expected one of {PHASES}")
+    weights = np.zeros((len(df), len(PHASES)))
+    weights[~three_phase, phase_code[~three_phase]] = 1.0
+    weights[three_phase, :] = 1.0 / 3
+
+    if 'schedule' in df:
+        sched = df['schedule'].fillna('continuous').astype(str)
+    else:
+        sched = pd.Series('continuous', index=df.index)
+    codes, names = pd.factorize(sched)
+    group_phase_va = np.zeros((len(names), len(PHASES)))
+    np.add.at(group_phase_va, codes, drawn[:, None] * weights)
+
+    return _schedule_matrix(list(names), schedules) @ group_phase_va
+
+
+def simulate_load_profile(
+    load_data,
+    temperatures: np.ndarray,
+    building_data: Optional[Dict[str, Any]] = None,
+    schedules: Optional[Mapping[str, Sequence[float]]] = None,
+    cooling_cop: float = 3.0,
+    heating_cop: float = 1.0,
+) -> LoadProfileResult:
+    """
+    Simulate hourly demand for a full year
+
+    Args:
+        load_data: Circuits (list of dicts, CircuitTable or DataFrame). Optional
+            per-circuit 'schedule' (key of DAILY_SCHEDULES / `schedules`,
+            default 'continuous') and 'duty_cycle' (0-1, default 1.0). An
+            empty schedule gives zero electrical load
+        temperatures: 8760 hourly outdoor temperatures (°F)
+        building_data: Manual J inputs (outdoor_design_temp is replaced by
+            the hourly series); None = no HVAC
+        schedules: Extra or overriding schedules (24 or 8760 fractions)
+        cooling_cop: Cooling BTU/h → electrical input (3.0 ≈ packaged DX)
+        heating_cop: Heating BTU/h → electrical input (1.0 = resistance heat)
+
+    Returns:
+        LoadProfileResult
+    """
+    temperatures = np.asarray(temperatures, dtype=np.float64)
+    if temperatures.shape != (HOURS_PER_YEAR,):
+        raise ValueError(f"temperatures must have {HOURS_PER_YEAR} hourly values")
+    schedules = {**DAILY_SCHEDULES, **(schedules or {})}
+
+    df = load_data.to_frame() if isinstance(load_data, CircuitTable) else pd.DataFrame(load_data)
+    if len(df):
+        va = compute_circuit_va(df)
+        hourly_phase_va = _hourly_circuit_va(df, va, schedules)
+    else:
+        # Empty schedule: no electrical load, so the year is HVAC only
+        va = np.zeros(0)
+        hourly_phase_va = np.zeros((HOURS_PER_YEAR, len(PHASES)))
+
+    # HVAC: heating below the indoor design temperature, cooling above it
+    hourly_hvac_va = np.zeros(HOURS_PER_YEAR)
+    if building_data:
+        hvac = manual_j_thermal_load_array({**building_data, 'outdoor_design_temp': temperatures})
+        indoor = building_data['indoor_design_temp']
+        heating = np.where(temperatures < indoor, hvac['heating_kw'] * 1000 / heating_cop, 0.0)
+        cooling = np.where(temperatures > indoor, hvac['cooling_kw'] * 1000 / cooling_cop, 0.0)
+        hourly_hvac_va = heating + cooling
+        hourly_phase_va = hourly_phase_va + hourly_hvac_va[:, None] / 3
+        static_hvac = heating.max() + cooling.max()
+    else:
+        static_hvac = 0.0
+
+    connected_va = float(va.sum())
+    max_unit = float(va.max()) if len(va) else 0.0
+    return LoadProfileResult(
+        hourly_phase_va=hourly_phase_va,
+        hourly_hvac_va=hourly_hvac_va,
+        connected_va=connected_va,
+        max_unit=max_unit,
+        n1_capacity=max(connected_va * 2, connected_va + max_unit),
+        static_total_with_hvac=connected_va + float(static_hvac),
+    )
+
+
+def print_load_profile_report(result: LoadProfileResult) -> None:
+    """Print the 8760 simulation summary"""
+    s = result.summary()
+    print("\n" + "═" * 60)
+    print("  📈 IMPERIAL LOAD PROFILE — 8760 HOURS")
+    print("═" * 60)
+    print(f"   Connected Load:         {s['connected_va']:,.0f} VA")
+    print(f"   Static Total with HVAC: {s['static_total_with_hvac']:,.0f} VA")
+    print(f"   Coincident Peak:        {s['coincident_peak_va']:,.0f} VA (hour {s['peak_hour']})")
+    print(f"   Load Factor:            {s['load_factor']:.1%}")
+    print(f"   Annual Energy:          {s['annual_kwh']:,.0f} kWh")
+    print(f"   N+1 Capacity:           {s['n1_capacity']:,.0f} VA")
+    print(f"   Minimum Headroom:       {s['min_headroom_va']:,.0f} VA")
+    if s['hours_over_n1']:
+        print(f"   ⚠️  Hours over N+1:      {s['hours_over_n1']:,}")
+    print(f"   Hours >10% imbalance:   {s['hours_imbalanced']:,}")
+    print("═" * 60)
+
+
+if __name__ == '__main__':
+    import time
+
+    rng = np.random.default_rng(8760)
+    n = 10_000
+    circuits = pd.DataFrame({
+        'circuit_name': [f'CKT-{i}' for i in range(n)],
+        'voltage': rng.choice([120, 277], size=n),
+        'amps': rng.uniform(2, 20, size=n).round(1),
+        'phases': 1,
+        'continuous': rng.random(n) < 0.6,
+        'phase': rng.choice(list('ABC'), size=n),
+        'schedule': rng.choice(list(DAILY_SCHEDULES), size=n),
+        'duty_cycle': rng.uniform(0.3, 1.0, size=n).round(2),
+    })
+    building = {
+        'square_footage': 120_000, 'ceiling_height': 12, 'insulation_r_value': 19,
+        'window_shgc': 0.3, 'window_area_sqft': 18_000, 'indoor_design_temp': 72,
+        'occupants': 600, 'lighting_watts': 150_000, 'appliance_watts': 250_000,
+    }
+
+    start = time.perf_counter()
+    result = simulate_load_profile(circuits, synthetic_temperatures(), building)
+    elapsed = time.perf_counter() - start
+    print_load_profile_report(result)
+    print(f"\n   Simulated {n:,} circuits × 8760 h in {elapsed:.3f} s")
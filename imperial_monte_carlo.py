@@ -0,0 +1,370 @@
+#!/usr/bin/env python3
+"""
+═══════════════════════════════════════════════════════════════
+  IMPERIAL MONTE CARLO — N+1 AND PHASE BALANCE RISK
+  Sovereign Circuit Academy • NEC 2026 Compliant
+
+  v3 picks N+1 capacity from nameplate amps. Real draws wander, so
+  this asks how often they break the plan:
+  • Per-circuit amp distribution: fixed, normal, lognormal, uniform
+    or triangular (schedule columns or one default for all)
+  • Optional facility-wide correlation (everything peaks together)
+  • P(load > capacity), P(load + largest unit > capacity) (the
+    v3 option-2 N+1 rule), P(imbalance > 10%), plus percentiles
+
+  Every chunk of trials is one (circuits × trials) NumPy matrix —
+  no Python loop over trials. Chunks are sized to a memory budget,
+  seeded from SeedSequence(seed).spawn(), and can run on a process
+  pool; results are identical for any worker count.
+
+  "Fear is the path to the dark side. Probability is the path out."
+═══════════════════════════════════════════════════════════════
+"""
+
+import math
+import os
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+import sovereign_paths  # noqa: F401
+from circuit_table import CircuitTable
+from imperial_va_engine import (
+    CONTINUOUS_MULTIPLIER,
+    PHASES,
+    SQRT3,
+    _column,
+    compute_circuit_va,
+    compute_phase_loads,
+    phase_imbalance,
+)
+
+
+DISTRIBUTIONS = ('fixed', 'normal', 'lognormal', 'uniform', 'triangular')
+DEFAULT_CV = 0.10
+DEFAULT_PERCENTILES = (50, 90, 95, 99)
+DEFAULT_CHUNK_BYTES = 64 * 1024 * 1024
+
+
+@dataclass
+class AmpModel:
+    """
+    Columnar per-circuit amp distributions, sorted by distribution
+
+    Circuits of one distribution are a contiguous row range (`slices`)
+    of each chunk's sample matrix, filled in place without copies.
+    """
+    mean: np.ndarray          # amps (mode for triangular)
+    sd: np.ndarray
+    low: np.ndarray
+    high: np.ndarray
+    va_per_amp: np.ndarray    # V (× √3) (× 1.25)
+    weights: np.ndarray       # (circuits × 3) v2 phase split
+    slices: Dict[str, Tuple[int, int]]
+
+    def __len__(self) -> int:
+        return len(self.mean)
+
+
+def amp_model(df: pd.DataFrame, distribution: str = 'normal', cv: float = DEFAULT_CV) -> AmpModel:
+    """
+    Build the amp distributions from schedule columns
+
+    Columns (all optional except amps):
+        amps_distribution  one of DISTRIBUTIONS (default `distribution`)
+        amps_sd            standard deviation in amps (default amps × amps_cv)
+        amps_cv            coefficient of variation (default `cv`)
+        amps_min/amps_max  bounds for uniform/triangular (default: the
+                           symmetric range with the same sd)
+    """
+    n = len(df)
+    dist = _column(df, 'amps_distribution', distribution).astype(str).str.strip().str.lower()
+    bad = sorted(set(dist) - set(DISTRIBUTIONS))
+    if bad:
+        raise ValueError(f"Unknown amp distribution(s) {bad}; expected one of {DISTRIBUTIONS}")
+    order = np.argsort(pd.Categorical(dist, categories=DISTRIBUTIONS).codes, kind='stable')
+
+    mean = df['amps'].to_numpy(dtype=np.float64)
+    cv_col = _column(df, 'amps_cv', cv).to_numpy(dtype=np.float64)
+    sd = _column(df, 'amps_sd', np.nan).to_numpy(dtype=np.float64)
+    sd = np.where(np.isnan(sd), mean * cv_col, sd)
+    if (sd < 0).any() or (mean < 0).any():
+        raise ValueError("amps and amps_sd must be non-negative")
+    # Uniform half-width √3·sd, symmetric triangular half-width √6·sd
+    half = np.where(dist.to_numpy() == 'triangular', math.sqrt(6), SQRT3) * sd
+    low = _column(df, 'amps_min', np.nan).to_numpy(dtype=np.float64)
+    high = _column(df, 'amps_max', np.nan).to_numpy(dtype=np.float64)
+    low = np.maximum(np.where(np.isnan(low), mean - half, low), 0.0)
+    high = np.where(np.isnan(high), mean + half, high)
+    if (high < low).any():
+        raise ValueError("amps_max must not be below amps_min")
+
+    voltage = df['voltage'].to_numpy(dtype=np.float64)
+    three_phase = _column(df, 'phases', 1).to_numpy() == 3
+    continuous = _column(df, 'continuous', False).to_numpy(dtype=bool)
+    va_per_amp = voltage * np.where(three_phase, SQRT3, 1.0) * np.where(continuous, CONTINUOUS_MULTIPLIER, 1.0)
+
+    labels = _column(df, 'phase', 'A').astype(str).to_numpy()
+    codes = pd.Categorical(labels, categories=PHASES).codes
+    if ((codes < 0) & ~three_phase).any():
+        raise ValueError(f"Unknown phase label(s); expected one of {PHASES}")
+    weights = np.zeros((n, len(PHASES)))
+    weights[~three_phase, codes[~three_phase]] = 1.0
+    weights[three_phase, :] = 1.0 / 3
+
+    sorted_dist = dist.to_numpy()[order]
+    slices = {}
+    for name in DISTRIBUTIONS:
+        hits = np.flatnonzero(sorted_dist == name)
+        if len(hits):
+            slices[name] = (int(hits[0]), int(hits[-1]) + 1)
+    return AmpModel(mean[order], sd[order], low[order], high[order],
+                    va_per_amp[order], weights[order], slices)
+
+
+def _simulate_chunk(model: AmpModel, trials: int, seed: np.random.SeedSequence,
+                    correlation: float) -> Tuple[np.ndarray, np.ndarray]:
+    """One (circuits × trials) draw → per-trial phase VA (trials × 3) and largest unit"""
+    rng = np.random.default_rng(seed)
+    # Circuits are rows, so each distribution's block is contiguous and
+    # the generators write straight into it
+    amps = np.empty((len(model), trials))
+    common = rng.standard_normal(trials) if correlation else None
+
+    def gaussian(block: np.ndarray) -> None:
+        rng.standard_normal(out=block)
+        if common is not None:
+            block *= math.sqrt(1 - correlation)
+            block += math.sqrt(correlation) * common
+
+    for name, (start, stop) in model.slices.items():
+        rows = slice(start, stop)
+        block = amps[rows]
+        mean, sd = model.mean[rows, None], model.sd[rows, None]
+        if name == 'fixed':
+            block[:] = mean
+        elif name == 'normal':
+            gaussian(block)
+            block *= sd
+            block += mean
+            np.maximum(block, 0.0, out=block)
+        elif name == 'lognormal':
+            with np.errstate(divide='ignore', invalid='ignore'):
+                sigma = np.sqrt(np.log1p(np.where(mean > 0, sd / mean, 0.0) ** 2))
+                mu = np.log(mean) - sigma ** 2 / 2
+            gaussian(block)
+            block *= sigma
+            block += mu
+            np.exp(block, out=block)
+        elif name == 'uniform':
+            low, high = model.low[rows, None], model.high[rows, None]
+            rng.random(out=block)
+            block *= high - low
+            block += low
+        else:
+            low, high = model.low[rows], model.high[rows]
+            mode = np.clip(model.mean[rows], low, high)
+            # numpy's triangular needs left < right; degenerate circuits stay at the mode
+            spread = high > low
+            block[:] = mode[:, None]
+            if spread.all():
+                block[:] = rng.triangular(low[:, None], mode[:, None], high[:, None], size=block.shape)
+            elif spread.any():
+                block[spread] = rng.triangular(low[spread, None], mode[spread, None], high[spread, None],
+                                               size=(int(spread.sum()), trials))
+
+    amps *= model.va_per_amp[:, None]
+    max_unit = amps.max(axis=0) if len(model) else np.zeros(trials)
+    return (model.weights.T @ amps).T, max_unit
+
+
+def _run_chunk(args) -> Tuple[np.ndarray, np.ndarray]:
+    """Process-pool entry point"""
+    return _simulate_chunk(*args)
+
+
+@dataclass
+class MonteCarloResult:
+    """Per-trial totals plus the deterministic v3 numbers they are judged against"""
+    phase_va: np.ndarray       # (trials × 3)
+    max_unit: np.ndarray       # (trials,)
+    nominal_va: float
+    nominal_imbalance: float
+    n1_capacity: float         # v3 selection from nameplate amps
+    capacity_va: float         # threshold for p_exceeds_capacity
+    seed: int
+    percentiles: Sequence[float] = DEFAULT_PERCENTILES
+
+    @property
+    def trials(self) -> int:
+        return len(self.max_unit)
+
+    @property
+    def total_va(self) -> np.ndarray:
+        return self.phase_va.sum(axis=1)
+
+    @property
+    def imbalance(self) -> np.ndarray:
+        """v2-style percent imbalance, per trial"""
+        max_phase = self.phase_va.max(axis=1)
+        min_phase = self.phase_va.min(axis=1)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return np.where(max_phase > 0, (max_phase - min_phase) / max_phase * 100, 0.0)
+
+    @property
+    def n1_demand(self) -> np.ndarray:
+        """v3 option-2 N+1 demand per trial: total + largest single unit"""
+        return self.total_va + self.max_unit
+
+    def exceedance(self, threshold_va: float) -> float:
+        """P(total load > threshold)"""
+        return float((self.total_va > threshold_va).mean())
+
+    def _percentiles(self, values: np.ndarray) -> Dict[str, float]:
+        return {f'p{q:g}': round(float(v), 2)
+                for q, v in zip(self.percentiles, np.percentile(values, self.percentiles))}
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            'trials': self.trials,
+            'seed': self.seed,
+            'nominal_va': round(self.nominal_va, 2),
+            'nominal_imbalance_percent': round(self.nominal_imbalance, 2),
+            'n1_capacity': round(self.n1_capacity, 2),
+            'capacity_va': round(self.capacity_va, 2),
+            'p_exceeds_nominal': self.exceedance(self.nominal_va),
+            'p_exceeds_capacity': self.exceedance(self.capacity_va),
+            'p_n1_insufficient': float((self.n1_demand > self.capacity_va).mean()),
+            'p_imbalance_over_10': float((self.imbalance > 10).mean()),
+            'total_va_percentiles': self._percentiles(self.total_va),
+            'max_phase_va_percentiles': self._percentiles(self.phase_va.max(axis=1)),
+            'imbalance_percentiles': self._percentiles(self.imbalance),
+        }
+
+
+def simulate_n1_risk(
+    load_data,
+    trials: int = 100_000,
+    seed: int = 1085,
+    distribution: str = 'normal',
+    cv: float = DEFAULT_CV,
+    correlation: float = 0.0,
+    capacity_va: Optional[float] = None,
+    workers: int = 1,
+    chunk_bytes: int = DEFAULT_CHUNK_BYTES,
+    percentiles: Sequence[float] = DEFAULT_PERCENTILES,
+) -> MonteCarloResult:
+    """
+    Monte Carlo of total load and phase balance under amp uncertainty
+
+    Args:
+        load_data: Circuits (list of dicts, CircuitTable or DataFrame) with
+            optional amps_distribution / amps_sd / amps_cv / amps_min /
+            amps_max columns (see amp_model)
+        trials: Number of samples
+        seed: Base seed; chunk i draws from SeedSequence(seed).spawn()[i],
+            so a (seed, chunk_bytes) pair reproduces the same samples
+        distribution: Default amp distribution for circuits without one
+        cv: Default coefficient of variation (sd = cv × amps)
+        correlation: 0-1 shared component in every normal/lognormal draw
+        capacity_va: Service/feeder rating to test (default: v3 N+1 capacity)
+        workers: Processes for the chunks (1 = in-process, 0 = all CPUs)
+        chunk_bytes: Memory budget for one chunk's sample matrix
+        percentiles: Percentiles reported in summary()
+
+    Returns:
+        MonteCarloResult; summary()['p_n1_insufficient'] is P(load +
+        largest unit > capacity_va)
+
+    Raises:
+        ValueError: No circuits, or bad distribution/correlation/trials
+    """
+    if distribution not in DISTRIBUTIONS:
+        raise ValueError(f"distribution must be one of {DISTRIBUTIONS}, got {distribution!r}")
+    if not 0 <= correlation <= 1:
+        raise ValueError("correlation must be between 0 and 1")
+    if trials < 1:
+        raise ValueError("trials must be at least 1")
+
+    df = load_data.to_frame() if isinstance(load_data, CircuitTable) else pd.DataFrame(load_data)
+    if len(df) == 0:
+        raise ValueError("load_data has no circuits to simulate")
+    va = compute_circuit_va(df)
+    nominal_va = float(va.sum())
+    max_unit = float(va.max()) if len(va) else 0.0
+    n1_capacity = max(nominal_va * 2, nominal_va + max_unit)
+    nominal_imbalance = phase_imbalance(compute_phase_loads(df, va))
+
+    model = amp_model(df, distribution, cv)
+    # Sample matrix + one same-sized temporary per distribution block
+    rows = max(1, int(chunk_bytes // (16 * max(len(model), 1))))
+    sizes = [rows] * (trials // rows) + ([trials % rows] if trials % rows else [])
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    jobs = [(model, size, child, correlation) for size, child in zip(sizes, seeds)]
+
+    workers = workers or os.cpu_count() or 1
+    if workers > 1 and len(jobs) > 1:
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=min(workers, len(jobs))) as pool:
+            chunks = list(pool.map(_run_chunk, jobs))
+    else:
+        chunks = [_run_chunk(job) for job in jobs]
+
+    return MonteCarloResult(
+        phase_va=np.concatenate([c[0] for c in chunks]),
+        max_unit=np.concatenate([c[1] for c in chunks]),
+        nominal_va=nominal_va,
+        nominal_imbalance=nominal_imbalance,
+        n1_capacity=n1_capacity,
+        capacity_va=n1_capacity if capacity_va is None else float(capacity_va),
+        seed=seed,
+        percentiles=tuple(percentiles),
+    )
+
+
+def print_monte_carlo_report(result: MonteCarloResult) -> None:
+    """Print the risk summary"""
+    s = result.summary()
+    print("\n" + "═" * 60)
+    print(f"  🎲 IMPERIAL MONTE CARLO — {s['trials']:,} TRIALS (seed {s['seed']})")
+    print("═" * 60)
+    print(f"   Nominal Load:           {s['nominal_va']:,.0f} VA")
+    print(f"   N+1 Capacity (v3):      {s['n1_capacity']:,.0f} VA")
+    if s['capacity_va'] != s['n1_capacity']:
+        print(f"   Tested Capacity:        {s['capacity_va']:,.0f} VA")
+    print(f"   P(load > nominal):      {s['p_exceeds_nominal']:.2%}")
+    print(f"   P(load > capacity):     {s['p_exceeds_capacity']:.4%}")
+    print(f"   P(load + unit > cap):   {s['p_n1_insufficient']:.4%}")
+    print(f"   P(imbalance > 10%):     {s['p_imbalance_over_10']:.2%}")
+    for label, key in (('Total VA', 'total_va_percentiles'),
+                       ('Max Phase VA', 'max_phase_va_percentiles'),
+                       ('Imbalance %', 'imbalance_percentiles')):
+        values = '  '.join(f"{p}={v:,.2f}" for p, v in s[key].items())
+        print(f"   {label:<14} {values}")
+    print("═" * 60)
+
+
+if __name__ == '__main__':
+    import time
+
+    rng = np.random.default_rng(517)
+    n = 2_000
+    circuits = pd.DataFrame({
+        'circuit_name': [f'CKT-{i}' for i in range(n)],
+        'voltage': rng.choice([120, 277], size=n),
+        'amps': rng.uniform(2, 20, size=n).round(1),
+        'phases': 1,
+        'continuous': rng.random(n) < 0.6,
+        'phase': rng.choice(list('ABC'), size=n),
+        'amps_distribution': rng.choice(['normal', 'lognormal', 'triangular'], size=n),
+        'amps_cv': 0.25,
+    })
+
+    start = time.perf_counter()
+    result = simulate_n1_risk(circuits, trials=100_000, correlation=0.3,
+                              capacity_va=circuits.eval('voltage * amps').sum() * 1.3)
+    elapsed = time.perf_counter() - start
+    print_monte_carlo_report(result)
+    print(f"\n   {result.trials:,} trials × {n:,} circuits in {elapsed:.2f} s")
@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+"""
+═══════════════════════════════════════════════════════════════
+  IMPERIAL TRACE — STAGE TIMERS, COUNTERS AND PROFILING HOOKS
+  Sovereign Circuit Academy
+
+  Tells you where an audit spends its time: schedule load, VA math,
+  phase balance, critical matching, Manual J, rendering, cache hits.
+
+  • Off by default. A disabled stage() is one attribute check and a
+    shared no-op context manager
+  • Enable with enable(), the tracing() context, or SCA_TRACE=1
+    (SCA_TRACE_OUT=path writes the trace at exit; a path ending in
+    .chrome.json gets the Chrome trace-event format)
+  • export_json: per-run summary + raw events
+  • export_chrome: load in chrome://tracing or ui.perfetto.dev
+  • profile_call: one call under cProfile and/or tracemalloc
+
+  "Measure twice. Optimize once."
+═══════════════════════════════════════════════════════════════
+"""
+
+import atexit
+import json
+import os
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+ENV_ENABLE = 'SCA_TRACE'
+ENV_OUTPUT = 'SCA_TRACE_OUT'
+
+_TRUE_STRINGS = {'1', 'true', 'yes', 'on'}
+
+
+class _NullStage:
+    """Shared no-op stage used while tracing is off"""
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def note(self, **args) -> None:
+        pass
+
+
+_NULL_STAGE = _NullStage()
+
+
+class _Stage:
+    __slots__ = ('tracer', 'name', 'args', 'start')
+
+    def __init__(self, tracer: 'Tracer', name: str, args: Dict[str, Any]):
+        self.tracer = tracer
+        self.name = name
+        self.args = args
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc):
+        self.tracer._record(self.name, self.start, time.perf_counter_ns() - self.start, self.args)
+        return False
+
+    def note(self, **args) -> None:
+        """Attach values (row counts, hits) to this stage's event"""
+        self.args.update(args)
+
+
+class Tracer:
+    """Collects stage events and counters for one process"""
+
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.events: List[Tuple[str, int, int, int, Dict[str, Any]]] = []
+            self.counters: Dict[str, float] = defaultdict(float)
+            self.origin_ns = time.perf_counter_ns()
+
+    def _record(self, name: str, start: int, duration: int, args: Dict[str, Any]) -> None:
+        with self._lock:
+            self.events.append((name, start, duration, threading.get_ident(), args))
+
+    def stage(self, name: str, **args: Any):
+        return _Stage(self, name, args) if self.enabled else _NULL_STAGE
+
+    def count(self, name: str, n: float = 1) -> None:
+        if self.enabled:
+            with self._lock:
+                self.counters[name] += n
+
+    # ───────────────────────────────────────────────────────
+    # Reports
+    # ───────────────────────────────────────────────────────
+    def summary(self) -> Dict[str, Any]:
+        """Per-stage calls / total / mean / max (ms) plus counters"""
+        stages: Dict[str, Dict[str, float]] = {}
+        for name, _, duration, _, _ in self.events:
+            s = stages.setdefault(name, {'calls': 0, 'total_ms': 0.0, 'max_ms': 0.0})
+            ms = duration / 1e6
+            s['calls'] += 1
+            s['total_ms'] += ms
+            s['max_ms'] = max(s['max_ms'], ms)
+        for s in stages.values():
+            s['mean_ms'] = s['total_ms'] / s['calls']
+            for key in ('total_ms', 'max_ms', 'mean_ms'):
+                s[key] = round(s[key], 4)
+        return {
+            'stages': dict(sorted(stages.items(), key=lambda kv: -kv[1]['total_ms'])),
+            'counters': {k: (int(v) if float(v).is_integer() else v) for k, v in self.counters.items()},
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'pid': os.getpid(),
+            **self.summary(),
+            'events': [
+                {'name': name, 'start_us': (start - self.origin_ns) / 1e3,
+                 'duration_us': duration / 1e3, 'thread': tid, 'args': args}
+                for name, start, duration, tid, args in self.events
+            ],
+        }
+
+    def export_json(self, path: str) -> str:
+        with open(path, 'w') as f:
+            json.dump(self.to_dict(), f, indent=2, default=str)
+        return path
+
+    def export_chrome(self, path: str) -> str:
+        """Chrome trace-event JSON (complete 'X' events + final counter values)"""
+        pid = os.getpid()
+        events = [
+            {'name': name, 'cat': name.split('.', 1)[0], 'ph': 'X', 'pid': pid, 'tid': tid,
+             'ts': (start - self.origin_ns) / 1e3, 'dur': duration / 1e3, 'args': args}
+            for name, start, duration, tid, args in self.events
+        ]
+        end_us = max((e['ts'] + e['dur'] for e in events), default=0.0)
+        events += [
+            {'name': name, 'ph': 'C', 'pid': pid, 'ts': end_us, 'args': {'value': value}}
+            for name, value in self.counters.items()
+        ]
+        with open(path, 'w') as f:
+            json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, f, default=str)
+        return path
+
+    def export(self, path: str) -> str:
+        """Chrome format for *.chrome.json, plain JSON otherwise"""
+        return self.export_chrome(path) if path.endswith('.chrome.json') else self.export_json(path)
+
+
+TRACER = Tracer(enabled=os.environ.get(ENV_ENABLE, '').strip().lower() in _TRUE_STRINGS)
+
+
+def stage(name: str, **args: Any):
+    """Time a block: `with stage('v3.va', rows=n):` — no-op while tracing is off"""
+    return _Stage(TRACER, name, args) if TRACER.enabled else _NULL_STAGE
+
+
+def count(name: str, n: float = 1) -> None:
+    """Bump a counter (rows processed, cache hits, ...) — no-op while tracing is off"""
+    if TRACER.enabled:
+        TRACER.count(name, n)
+
+
+def enabled() -> bool:
+    return TRACER.enabled
+
+
+def enable(reset: bool = True) -> Tracer:
+    if reset:
+        TRACER.reset()
+    TRACER.enabled = True
+    return TRACER
+
+
+def disable() -> Tracer:
+    TRACER.enabled = False
+    return TRACER
+
+
+@contextmanager
+def tracing(path: Optional[str] = None) -> Iterator[Tracer]:
+    """Trace a block (fresh events), optionally exporting to `path` afterwards"""
+    previous = TRACER.enabled
+    enable()
+    try:
+        yield TRACER
+    finally:
+        TRACER.enabled = previous
+        if path:
+            TRACER.export(path)
+
+
+def profile_call(fn: Callable, *args: Any, cprofile: bool = True, memory: bool = False,
+                 top: int = 25, **kwargs: Any) -> Tuple[Any, Dict[str, Any]]:
+    """
+    Run fn(*args, **kwargs) once with stage tracing plus cProfile and/or tracemalloc
+
+    Returns:
+        (result, report) — report has 'trace' (stage summary), 'profile'
+        (top functions by cumulative time) and 'memory' (peak + top
+        allocation sites)
+    """
+    import cProfile
+    import io
+    import pstats
+    import tracemalloc
+
+    report: Dict[str, Any] = {}
+    profiler = cProfile.Profile() if cprofile else None
+    if memory:
+        tracemalloc.start()
+    with tracing() as tracer:
+        if profiler:
+            profiler.enable()
+        try:
+            result = fn(*args, **kwargs)
+        finally:
+            if profiler:
+                profiler.disable()
+        report['trace'] = tracer.summary()
+    if memory:
+        snapshot = tracemalloc.take_snapshot()
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        report['memory'] = {
+            'current_bytes': current,
+            'peak_bytes': peak,
+            'top': [
+                {'where': str(stat.traceback), 'bytes': stat.size, 'blocks': stat.count}
+                for stat in snapshot.statistics('lineno')[:top]
+            ],
+        }
+    if profiler:
+        out = io.StringIO()
+        pstats.Stats(profiler, stream=out).sort_stats('cumulative').print_stats(top)
+        report['profile'] = out.getvalue()
+    return result, report
+
+
+def _export_at_exit() -> None:
+    path = os.environ.get(ENV_OUTPUT)
+    if path and TRACER.events:
+        TRACER.export(path)
+
+
+atexit.register(_export_at_exit)
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Imperial VA Engine - Columnar Load Math for the Hospital Node
+=============================================================
+Vectorized NumPy/pandas versions of the per-circuit formulas used by
+imperial_load_audit_v3 and vader_load_audit_v2:
+
+• VA = V × I (× √3 for 3-phase)
+• 125% continuous load multiplier (NEC 210.19(A)(1))
+• Per-phase totals (3-phase loads split evenly across A/B/C)
+• Critical circuit flags (NEC Article 517)
+
+Every function works on whole columns at once — no per-row Python.
+
+"A thousand circuits, one stroke of the saber."
+"""
+
+import math
+from typing import Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+import sovereign_paths  # noqa: F401
+from critical_circuits import DEFAULT_CLASSIFIER, CriticalCircuitClassifier
+
+
+SQRT3 = math.sqrt(3)
+CONTINUOUS_MULTIPLIER = 1.25
+PHASES = ('A', 'B', 'C')
+
+
+def _column(df: pd.DataFrame, name: str, default) -> pd.Series:
+    """Return a column with missing keys/cells filled like dict.get(name, default)"""
+    if name not in df.columns:
+        return pd.Series(default, index=df.index)
+    return df[name].fillna(default)
+
+
+def compute_circuit_va(df: pd.DataFrame) -> np.ndarray:
+    """
+    VA for every circuit in one pass
+
+    Args:
+        df: DataFrame with voltage, amps and optional phases/continuous columns
+
+    Returns:
+        float64 array of volt-amps, including the 125% continuous multiplier
+    """
+    voltage = df['voltage'].to_numpy(dtype=np.float64)
+    amps = df['amps'].to_numpy(dtype=np.float64)
+    three_phase = _column(df, 'phases', 1).to_numpy() == 3
+    continuous = _column(df, 'continuous', False).to_numpy(dtype=bool)
+
+    va = voltage * amps
+    va = np.where(three_phase, va * SQRT3, va)
+    return va * np.where(continuous, CONTINUOUS_MULTIPLIER, 1.0)
+
+
+def compute_phase_loads(df: pd.DataFrame, va: np.ndarray) -> Dict[str, float]:
+    """
+    Per-phase VA totals, vader_load_audit_v2 style
+
+    Single-phase circuits land on their 'phase' (default 'A'); 3-phase
+    circuits contribute one third of their VA to each of A, B and C.
+    """
+    three_phase = _column(df, 'phases', 1).to_numpy() == 3
+    single = ~three_phase
+
+    labels = _column(df, 'phase', 'A').astype(str).to_numpy()[single]
+    codes = pd.Categorical(labels, categories=PHASES).codes
+    if (codes < 0).any():
+        bad = sorted(set(labels[codes < 0]))
+        raise ValueError(f"Unknown phase label(s) {bad}; expected one of {PHASES}")
+
+    loads = np.bincount(codes, weights=va[single], minlength=len(PHASES))
+    loads = loads + va[three_phase].sum() / 3
+    return {p: float(v) for p, v in zip(PHASES, loads)}
+
+
+def phase_imbalance(phase_loads: Dict[str, float]) -> float:
+    """Percent imbalance between the heaviest and lightest phase"""
+    max_phase = max(phase_loads.values())
+    min_phase = min(phase_loads.values())
+    return ((max_phase - min_phase) / max_phase) * 100 if max_phase > 0 else 0
+
+
+def critical_mask(names: pd.Series,
+                  classifier: Optional[CriticalCircuitClassifier] = None) -> np.ndarray:
+    """Boolean array flagging NEC 517 critical circuits by name"""
+    return (classifier or DEFAULT_CLASSIFIER).classify(names)
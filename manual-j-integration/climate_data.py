@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+"""
+Climate Design Data - Indexed Site Lookup
+=========================================
+Outdoor design temperatures and hospital heating/cooling factors per
+location, shared by manual_j_thermal_load and imperial_load_audit_v3.
+
+Data lives in climate_design_data.csv (editable source) and is compiled
+to the committed climate_design_data.npy — a fixed-width NumPy structured
+array that is memory-mapped read-only on first use, so only the pages
+actually touched are read. After editing the CSV, rebuild explicitly:
+
+    python manual-j-integration/climate_data.py build
+
+Lookups:
+• exact: location name ("Chicago IL", case-insensitive) or 5-digit ZIP,
+  falling back to the first three ZIP digits
+• nearest: (lat, lon) through a k-d tree over unit vectors
+  (scipy.spatial.cKDTree when available, vectorized NumPy otherwise)
+
+Design temperatures are approximate ASHRAE 99.6% heating / 1% cooling
+dry-bulb values — confirm against the current Handbook for permit work.
+Rows without a heating factor use the legacy 35 VA/sq ft default.
+
+"Know the weather before you size the iron."
+"""
+
+import csv
+import difflib
+import math
+import os
+import sys
+import tempfile
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple, Union
+
+import numpy as np
+
+
+DATA_DIR = os.path.dirname(os.path.abspath(__file__))
+CSV_PATH = os.path.join(DATA_DIR, 'climate_design_data.csv')
+NPY_PATH = os.path.join(DATA_DIR, 'climate_design_data.npy')
+
+DEFAULT_HEATING_FACTOR = 35
+DEFAULT_COOLING_FACTOR = 45
+
+RECORD_DTYPE = np.dtype([
+    ('name', 'U32'),
+    ('zip', 'U5'),
+    ('lat', '<f4'),
+    ('lon', '<f4'),
+    ('heating_design_temp_f', '<f4'),
+    ('cooling_design_temp_f', '<f4'),
+    ('heating_factor', '<f4'),
+    ('cooling_factor', '<f4'),
+])
+
+Site = Union[str, int, Tuple[float, float]]
+
+NEAREST_CACHE_SIZE = 4096
+
+
+@dataclass(frozen=True)
+class ClimateRecord:
+    """Design data for one location"""
+    name: str
+    zip: str
+    lat: float
+    lon: float
+    heating_design_temp_f: float
+    cooling_design_temp_f: float
+    heating_factor: float
+    cooling_factor: float
+
+
+def build_climate_index(csv_path: str = CSV_PATH, npy_path: str = NPY_PATH) -> str:
+    """
+    Compile the CSV source into the memory-mappable .npy file
+
+    Written to a temporary file and swapped in with os.replace, so a
+    process loading the index never sees a half-written file.
+    """
+    with open(csv_path, newline='') as f:
+        rows = list(csv.DictReader(f))
+
+    def number(value: str, default: float = math.nan) -> float:
+        return float(value) if value not in (None, '') else default
+
+    records = np.array([
+        (
+            r['name'].strip(),
+            r['zip'].strip().zfill(5),
+            number(r['lat']),
+            number(r['lon']),
+            number(r['heating_design_temp_f']),
+            number(r['cooling_design_temp_f']),
+            number(r.get('heating_factor'), DEFAULT_HEATING_FACTOR),
+            number(r.get('cooling_factor'), DEFAULT_COOLING_FACTOR),
+        )
+        for r in rows
+    ], dtype=RECORD_DTYPE)
+    fd, tmp_path = tempfile.mkstemp(suffix='.npy', dir=os.path.dirname(os.path.abspath(npy_path)))
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            np.save(f, records)
+        os.chmod(tmp_path, 0o644)       # mkstemp creates 0600
+        os.replace(tmp_path, npy_path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    return npy_path
+
+
+def _unit_vectors(lat, lon) -> np.ndarray:
+    """(lat, lon) degrees → 3-D unit vectors; chord distance orders like great-circle distance"""
+    lat = np.radians(np.asarray(lat, dtype=np.float64))
+    lon = np.radians(np.asarray(lon, dtype=np.float64))
+    return np.stack([np.cos(lat) * np.cos(lon), np.cos(lat) * np.sin(lon), np.sin(lat)], axis=-1)
+
+
+def _normalize_name(name: str) -> str:
+    return ' '.join(name.replace(',', ' ').split()).lower()
+
+
+class ClimateIndex:
+    """Lazily loaded, read-only memory-mapped climate dataset with exact and nearest lookup"""
+
+    def __init__(self, npy_path: str = NPY_PATH):
+        self.npy_path = npy_path
+        self._records = None
+        self._by_name: Dict[str, int] = {}
+        self._by_zip: Dict[str, int] = {}
+        self._by_zip3: Dict[str, int] = {}
+        self._tree = None
+        self._points = None
+        # Per-instance (not functools.lru_cache on the method, which would keep the index alive)
+        self._nearest_cache: Dict[Tuple[float, float], int] = {}
+
+    # ───────────────────────────────────────────────────────
+    # Loading
+    # ───────────────────────────────────────────────────────
+    @property
+    def records(self) -> np.ndarray:
+        self._ensure_loaded()
+        return self._records
+
+    def _ensure_loaded(self) -> None:
+        if self._records is None:
+            self._load()
+
+    def _load(self) -> None:
+        # Never rebuilt here: the .npy is a build artifact (see build_climate_index)
+        self._records = np.load(self.npy_path, mmap_mode='r')
+        for i, (name, zip_code) in enumerate(zip(self._records['name'], self._records['zip'])):
+            self._by_name.setdefault(_normalize_name(str(name)), i)
+            self._by_zip.setdefault(str(zip_code), i)
+            self._by_zip3.setdefault(str(zip_code)[:3], i)
+
+    def _spatial_index(self):
+        if self._points is None:
+            records = self.records
+            self._points = _unit_vectors(records['lat'], records['lon'])
+            try:
+                from scipy.spatial import cKDTree
+                self._tree = cKDTree(self._points)
+            except ImportError:
+                self._tree = None
+        return self._tree
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def record(self, i: int) -> ClimateRecord:
+        row = self.records[i]
+        return ClimateRecord(
+            name=str(row['name']),
+            zip=str(row['zip']),
+            lat=float(row['lat']),
+            lon=float(row['lon']),
+            heating_design_temp_f=float(row['heating_design_temp_f']),
+            cooling_design_temp_f=float(row['cooling_design_temp_f']),
+            heating_factor=float(row['heating_factor']),
+            cooling_factor=float(row['cooling_factor']),
+        )
+
+    # ───────────────────────────────────────────────────────
+    # Lookup
+    # ───────────────────────────────────────────────────────
+    def lookup(self, key: Union[str, int]) -> Optional[ClimateRecord]:
+        """Exact lookup by location name or ZIP (then ZIP3 prefix); None if unknown"""
+        self._ensure_loaded()
+        key = str(key).strip()
+        if key.isdigit():
+            zip_code = key.zfill(5)
+            i = self._by_zip.get(zip_code, self._by_zip3.get(zip_code[:3]))
+        else:
+            i = self._by_name.get(_normalize_name(key))
+        return self.record(i) if i is not None else None
+
+    def nearest(self, lat: float, lon: float) -> ClimateRecord:
+        """Closest location by great-circle distance"""
+        return self.record(self._nearest_index(round(lat, 4), round(lon, 4)))
+
+    def _nearest_index(self, lat: float, lon: float) -> int:
+        key = (lat, lon)
+        i = self._nearest_cache.get(key)
+        if i is None:
+            tree = self._spatial_index()
+            point = _unit_vectors(lat, lon)
+            if tree is not None:
+                i = int(tree.query(point)[1])
+            else:
+                i = int(np.argmin(((self._points - point) ** 2).sum(axis=1)))
+            if len(self._nearest_cache) >= NEAREST_CACHE_SIZE:
+                self._nearest_cache.clear()
+            self._nearest_cache[key] = i
+        return i
+
+    def closest_known(self, key: Union[str, int]) -> Optional[ClimateRecord]:
+        """
+        Best guess for a key lookup() does not know, for error messages:
+        the numerically closest ZIP, or the most similar location name
+        """
+        self._ensure_loaded()
+        key = str(key).strip()
+        if key.isdigit():
+            zips = np.array([int(z) for z in self._by_zip])
+            closest = str(zips[np.argmin(np.abs(zips - int(key)))]).zfill(5)
+            return self.record(self._by_zip[closest])
+        match = difflib.get_close_matches(_normalize_name(key), list(self._by_name), n=1, cutoff=0)
+        return self.record(self._by_name[match[0]]) if match else None
+
+    def resolve(self, site: Site) -> Optional[ClimateRecord]:
+        """Name or ZIP → exact lookup; (lat, lon) → nearest location"""
+        if isinstance(site, (tuple, list)) and len(site) == 2:
+            return self.nearest(float(site[0]), float(site[1]))
+        return self.lookup(site)
+
+
+_DEFAULT_INDEX: Optional[ClimateIndex] = None
+
+
+def get_climate_index() -> ClimateIndex:
+    """Process-wide shared index (loaded on first lookup)"""
+    global _DEFAULT_INDEX
+    if _DEFAULT_INDEX is None:
+        _DEFAULT_INDEX = ClimateIndex()
+    return _DEFAULT_INDEX
+
+
+def climate_for(site: Site) -> Optional[ClimateRecord]:
+    """Resolve a site (name, ZIP or (lat, lon)) against the bundled dataset"""
+    return get_climate_index().resolve(site)
+
+
+if __name__ == '__main__':
+    import time
+
+    if sys.argv[1:] == ['build']:
+        print(f"Wrote {build_climate_index()}")
+        sys.exit(0)
+    index = get_climate_index()
+    print(f"{len(index)} locations in {os.path.basename(NPY_PATH)}")
+    for site in ['Chicago IL', '92130', (39.0, -105.5), 'Atlantis XX']:
+        start = time.perf_counter()
+        record = index.resolve(site)
+        elapsed = (time.perf_counter() - start) * 1e6
+        label = record.name if record else 'not found'
+        print(f"  {str(site):<18} → {label:<16} ({elapsed:,.1f} µs)")
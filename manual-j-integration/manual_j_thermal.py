@@ -11,6 +11,26 @@ import math
 from typing import Dict, Any
 
 
+def design_temp_for(location, condition: str = 'cooling') -> float:
+    """
+    Outdoor design temperature (°F) for a location name, ZIP or (lat, lon)
+
+    Raises:
+        ValueError: unknown condition, or a name/ZIP with no climate data
+            (the message names the nearest known site)
+    """
+    from climate_data import climate_for, get_climate_index
+
+    if condition not in ('cooling', 'heating'):
+        raise ValueError(f"design_condition must be 'cooling' or 'heating', got {condition!r}")
+    record = climate_for(location)
+    if record is None:
+        closest = get_climate_index().closest_known(location)
+        hint = f"; nearest known site is {closest.name!r} ({closest.zip})" if closest else ""
+        raise ValueError(f"No climate design data for location {location!r}{hint}")
+    return getattr(record, f'{condition}_design_temp_f')
+
+
 def manual_j_thermal_load(building_data: Dict[str, Any]) -> Dict[str, Any]:
     """
     ACCA Manual J Residential Load Calculation
@@ -22,7 +42,10 @@ def manual_j_thermal_load(building_data: Dict[str, Any]) -> Dict[str, Any]:
             - insulation_r_value: int
             - window_shgc: float (Solar Heat Gain Coefficient, 0-1)
             - window_area_sqft: int
-            - outdoor_design_temp: int (°F)
+            - outdoor_design_temp: int (°F) — or omit it and give
+              location: name, ZIP or (lat, lon), resolved from the
+              bundled climate data (design_condition: 'cooling' or
+              'heating', default 'cooling')
             - indoor_design_temp: int (°F)
             - occupants: int
             - lighting_watts: int
@@ -31,6 +54,15 @@ def manual_j_thermal_load(building_data: Dict[str, Any]) -> Dict[str, Any]:
     Returns:
         Dictionary with heating/cooling loads in BTU/h and tons
     """
+    if 'outdoor_design_temp' not in building_data and 'location' in building_data:
+        building_data = {
+            **building_data,
+            'outdoor_design_temp': design_temp_for(
+                building_data['location'],
+                building_data.get('design_condition', 'cooling'),
+            ),
+        }
+
     # Building volume
     volume = building_data['square_footage'] * building_data['ceiling_height']
     
@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""
+Manual J Integration - Vectorized Engine
+========================================
+Array-in / array-out version of manual_j_thermal_load for parametric
+sizing studies. Every formula is evaluated in the same order as the
+scalar function, and rounding follows Python's round(), so each element
+is identical to calling manual_j_thermal_load on that building.
+
+• manual_j_thermal_load_array   dict of arrays (or a DataFrame) → dict of arrays
+• outdoor_design_temps          location column → design temperatures (climate_data)
+• iter_manual_j_sweep           full Cartesian grid, in memory-bounded chunks
+
+"Ten million houses. One equation."
+"""
+
+from math import prod
+from typing import Any, Dict, Iterator, Mapping, Sequence, Tuple
+
+import numpy as np
+
+
+BUILDING_FIELDS = (
+    'square_footage',
+    'ceiling_height',
+    'insulation_r_value',
+    'window_shgc',
+    'window_area_sqft',
+    'outdoor_design_temp',
+    'indoor_design_temp',
+    'occupants',
+    'lighting_watts',
+    'appliance_watts',
+)
+
+
+def round_like_python(values: np.ndarray, ndigits: int) -> np.ndarray:
+    """
+    Element-wise round(x, ndigits) with Python's exact semantics
+
+    np.round scales by 10**ndigits first, which can land a value on the
+    wrong side of a .5 tie. Those few near-tie elements are re-rounded
+    with the builtin.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    if ndigits == 0:
+        return np.rint(values)
+    scaled = values * 10.0 ** ndigits
+    rounded = np.rint(scaled) / 10.0 ** ndigits
+    frac = np.abs(scaled - np.floor(scaled) - 0.5)
+    suspect = np.flatnonzero(frac <= 1e-9 * np.maximum(1.0, np.abs(scaled)))
+    if len(suspect):
+        flat = rounded.reshape(-1)
+        src = values.reshape(-1)
+        flat[suspect] = [round(float(src[i]), ndigits) for i in suspect]
+    return rounded
+
+
+def _object_array(values) -> np.ndarray:
+    """Sites as an object array; a str, ZIP or (lat, lon) tuple is one site for every building"""
+    if isinstance(values, (str, int, tuple, np.generic)):
+        out = np.empty((), dtype=object)
+        out[()] = values
+        return out
+    values = list(values)
+    out = np.empty(len(values), dtype=object)
+    out[:] = [tuple(v) if isinstance(v, list) else v for v in values]
+    return out
+
+
+def outdoor_design_temps(locations, conditions='cooling') -> np.ndarray:
+    """
+    Vectorized design_temp_for: one climate_data lookup per distinct
+    (location, condition) pair, broadcast back over the buildings
+    """
+    from manual_j_thermal import design_temp_for
+
+    sites, kinds = np.broadcast_arrays(_object_array(locations), _object_array(conditions))
+    resolved: Dict[Tuple[Any, Any], float] = {}
+    temps = np.empty(sites.shape, dtype=np.float64)
+    for i, key in enumerate(zip(sites.flat, kinds.flat)):
+        if key not in resolved:
+            resolved[key] = design_temp_for(*key)
+        temps.flat[i] = resolved[key]
+    return temps
+
+
+def _columns(building_data) -> Dict[str, np.ndarray]:
+    """Broadcast the Manual J inputs from a dict/DataFrame to common-shape arrays"""
+    columns = {f: building_data[f] for f in BUILDING_FIELDS if f in building_data}
+    if 'outdoor_design_temp' not in columns and 'location' in building_data:
+        condition = building_data['design_condition'] if 'design_condition' in building_data else 'cooling'
+        columns['outdoor_design_temp'] = outdoor_design_temps(building_data['location'], condition)
+    missing = [f for f in BUILDING_FIELDS if f not in columns]
+    if missing:
+        raise KeyError(f"Missing Manual J field(s): {missing}")
+    arrays = np.broadcast_arrays(*(np.asarray(columns[f]) for f in BUILDING_FIELDS))
+    return dict(zip(BUILDING_FIELDS, arrays))
+
+
+def manual_j_thermal_load_array(building_data) -> Dict[str, np.ndarray]:
+    """
+    ACCA Manual J Residential Load Calculation — vectorized
+
+    Args:
+        building_data: DataFrame, or mapping of the manual_j_thermal_load
+            field names to arrays/scalars (broadcast together). As in
+            manual_j_thermal_load, outdoor_design_temp may be replaced by
+            location (+ design_condition): a name, ZIP or (lat, lon) tuple
+            for every building, or a list/array/column with one per building
+
+    Returns:
+        Dictionary with the manual_j_thermal_load keys, each an array
+    """
+    b = _columns(building_data)
+
+    # Temperature differential
+    delta_t = b['indoor_design_temp'] - b['outdoor_design_temp']
+    abs_dt = np.abs(delta_t)
+
+    # Envelope UA (U-factor × Area)
+    envelope_ua = (
+        (b['square_footage'] * 0.3 / b['insulation_r_value']) +
+        (b['window_area_sqft'] / 3.0)
+    )
+
+    # Heating Load (BTU/h)
+    heating_load = envelope_ua * abs_dt * 1.1
+
+    # Solar gain through windows (BTU/h)
+    solar_gain = b['window_area_sqft'] * b['window_shgc'] * 150
+
+    # Internal gains (people, lights, appliances)
+    internal_gain = (
+        b['occupants'] * 400 +
+        b['lighting_watts'] * 3.41 +
+        b['appliance_watts'] * 3.41
+    )
+
+    # Total cooling load
+    cooling_load = (envelope_ua * abs_dt + solar_gain + internal_gain) * 1.1
+
+    return {
+        'heating_load_btu': round_like_python(heating_load, 0),
+        'cooling_load_btu': round_like_python(cooling_load, 0),
+        'heating_tons': round_like_python(heating_load / 12000, 2),
+        'cooling_tons': round_like_python(cooling_load / 12000, 2),
+        'heating_kw': round_like_python(heating_load / 3412, 2),
+        'cooling_kw': round_like_python(cooling_load / 3412, 2)
+    }
+
+
+def sweep_size(grid: Mapping[str, Sequence[Any]]) -> int:
+    """Number of combinations in a Cartesian grid"""
+    return prod(len(v) for v in grid.values())
+
+
+def iter_manual_j_sweep(
+    base: Mapping[str, Any],
+    grid: Mapping[str, Sequence[Any]],
+    chunk_size: int = 1_000_000,
+) -> Iterator[Tuple[Dict[str, np.ndarray], Dict[str, np.ndarray]]]:
+    """
+    Evaluate Manual J over the full Cartesian product of `grid`
+
+    Only `chunk_size` combinations are materialized at a time, so grids
+    of any size run in bounded memory.
+
+    Args:
+        base: Values for every field not being swept (e.g. EXAMPLE_HOME)
+        grid: Field name → 1-D values to sweep
+        chunk_size: Combinations per chunk
+
+    Yields:
+        (params, results) — params holds the swept values for the chunk,
+        results the manual_j_thermal_load_array output
+    """
+    unknown = set(grid) - set(BUILDING_FIELDS)
+    if unknown:
+        raise KeyError(f"Unknown Manual J field(s) in grid: {sorted(unknown)}")
+    names = list(grid)
+    axes = [np.asarray(grid[name]) for name in names]
+    shape = tuple(len(a) for a in axes)
+    total = prod(shape)
+
+    for start in range(0, total, chunk_size):
+        flat = np.arange(start, min(start + chunk_size, total))
+        coords = np.unravel_index(flat, shape)
+        params = {name: axis[idx] for name, axis, idx in zip(names, axes, coords)}
+        building = {f: params[f] if f in params else base[f] for f in BUILDING_FIELDS}
+        yield params, manual_j_thermal_load_array(building)
+
+
+def manual_j_sweep_frame(base: Mapping[str, Any], grid: Mapping[str, Sequence[Any]],
+                         chunk_size: int = 1_000_000):
+    """Collect a (moderately sized) sweep into one DataFrame"""
+    import pandas as pd
+
+    frames = [
+        pd.DataFrame({**params, **results})
+        for params, results in iter_manual_j_sweep(base, grid, chunk_size)
+    ]
+    return pd.concat(frames, ignore_index=True)
+
+
+if __name__ == '__main__':
+    import time
+
+    from manual_j_thermal import EXAMPLE_HOME
+
+    grid = {
+        'insulation_r_value': np.arange(11, 61),
+        'window_shgc': np.round(np.linspace(0.2, 0.7, 26), 3),
+        'window_area_sqft': np.arange(100, 1001, 10),
+        'outdoor_design_temp': np.arange(80, 116),
+    }
+    n = sweep_size(grid)
+
+    start = time.perf_counter()
+    peak_cooling = 0.0
+    for params, results in iter_manual_j_sweep(EXAMPLE_HOME, grid, chunk_size=500_000):
+        peak_cooling = max(peak_cooling, float(results['cooling_tons'].max()))
+    elapsed = time.perf_counter() - start
+
+    print(f"Swept {n:,} combinations in {elapsed:.2f} s ({n / elapsed:,.0f}/s)")
+    print(f"Worst-case cooling: {peak_cooling:.2f} tons")
@@ -0,0 +1,393 @@
+#!/usr/bin/env python3
+"""
+═══════════════════════════════════════════════════════════════
+  SOVEREIGN CACHE — MEMOIZATION FOR REPEATED CALCULATIONS
+  Sovereign Circuit Academy
+
+  Portfolio runs keep recomputing the same panel templates, prototype
+  buildings and box configurations. This cache keys every result by a
+  SHA-256 hash of its inputs:
+
+  • Memory tier: LRU bounded by entry count and pickled size
+  • Disk tier (optional): SQLite file shared across processes and runs
+  • Hit/miss counters per tier
+  • Ready-made wrappers for box fill, Manual J and the load audits
+
+  The disk tier is enabled by passing disk_path or setting SCA_CACHE_DB.
+  Bump CACHE_VERSION whenever a calculator's formulas change.
+
+  "Do not compute what the Empire already knows."
+═══════════════════════════════════════════════════════════════
+"""
+
+import copy
+import dataclasses
+import hashlib
+import inspect
+import json
+import os
+import pickle
+import sqlite3
+import sys
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import sovereign_paths  # noqa: F401
+from imperial_trace import count
+
+
+CACHE_VERSION = 1
+ENV_DISK_PATH = 'SCA_CACHE_DB'
+
+_MISSING = object()
+
+
+# ═══════════════════════════════════════════════════════════
+# CONTENT KEYS
+# ═══════════════════════════════════════════════════════════
+def _canonical(obj: Any) -> Any:
+    """Reduce inputs to JSON-serializable primitives with a stable order"""
+    if obj is None or isinstance(obj, (bool, int, float, str)):
+        return obj
+    if isinstance(obj, dict):
+        return {str(k): _canonical(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_canonical(v) for v in obj]
+    if isinstance(obj, (set, frozenset)):
+        return sorted(_canonical(v) for v in obj)
+    if hasattr(obj, 'to_frame') and hasattr(obj, 'phase_code'):     # CircuitTable
+        return _canonical(obj.to_frame())
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return _canonical(dataclasses.asdict(obj))
+    pd = sys.modules.get('pandas')
+    if pd is not None and isinstance(obj, pd.DataFrame):
+        return {
+            '__frame__': list(map(str, obj.columns)),
+            'hash': hashlib.sha256(
+                pd.util.hash_pandas_object(obj, index=False).to_numpy().tobytes()
+            ).hexdigest(),
+        }
+    np = sys.modules.get('numpy')
+    if np is not None:
+        if isinstance(obj, np.ndarray):
+            data = obj.tobytes() if obj.dtype != object else repr(obj.tolist()).encode()
+            return {'__array__': str(obj.dtype), 'shape': list(obj.shape),
+                    'hash': hashlib.sha256(data).hexdigest()}
+        if isinstance(obj, np.generic):
+            return obj.item()
+    raise TypeError(f"Cannot build a cache key from {type(obj).__name__}")
+
+
+_SIGNATURES: Dict[Callable, inspect.Signature] = {}
+
+
+def _bound_arguments(fn: Callable, args: Tuple, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    """Arguments by parameter name with defaults applied, so f(6) and f(conductors=6) share a key"""
+    sig = _SIGNATURES.get(fn)
+    if sig is None:
+        sig = _SIGNATURES[fn] = inspect.signature(fn)
+    bound = sig.bind(*args, **kwargs)
+    bound.apply_defaults()
+    return dict(bound.arguments)
+
+
+def content_key(namespace: str, *args: Any, **kwargs: Any) -> str:
+    """SHA-256 of the namespace, cache version and canonicalized arguments"""
+    try:
+        # Plain JSON data (the common case) goes straight through the C encoder
+        payload = json.dumps([namespace, CACHE_VERSION, args, kwargs],
+                             sort_keys=True, separators=(',', ':'))
+    except (TypeError, ValueError):
+        payload = json.dumps(
+            [namespace, CACHE_VERSION, _canonical(args), _canonical(kwargs)],
+            sort_keys=True, separators=(',', ':'), default=repr,
+        )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+# ═══════════════════════════════════════════════════════════
+# TIERS
+# ═══════════════════════════════════════════════════════════
+@dataclass
+class CacheStats:
+    """Hit/miss counters for one cache"""
+    hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+    @property
+    def lookups(self) -> int:
+        return self.hits + self.disk_hits + self.misses
+
+    @property
+    def hit_rate(self) -> float:
+        return (self.hits + self.disk_hits) / self.lookups if self.lookups else 0.0
+
+    def summary(self) -> Dict[str, Any]:
+        return {**dataclasses.asdict(self), 'hit_rate': round(self.hit_rate, 4)}
+
+
+class MemoryTier:
+    """In-process LRU bounded by entry count and total pickled bytes"""
+
+    def __init__(self, max_entries: int = 4096, max_bytes: int = 64 << 20):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self._data: "OrderedDict[str, Tuple[Any, int]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: str) -> Any:
+        entry = self._data.get(key)
+        if entry is None:
+            return _MISSING
+        self._data.move_to_end(key)
+        return entry[0]
+
+    def put(self, key: str, value: Any, size: int) -> int:
+        """Store a value; returns the number of entries evicted"""
+        if size > self.max_bytes:
+            return 0
+        if key in self._data:
+            self.nbytes -= self._data.pop(key)[1]
+        self._data[key] = (value, size)
+        self.nbytes += size
+        evicted = 0
+        while len(self._data) > self.max_entries or self.nbytes > self.max_bytes:
+            _, (_, old_size) = self._data.popitem(last=False)
+            self.nbytes -= old_size
+            evicted += 1
+        return evicted
+
+    def clear(self) -> None:
+        self._data.clear()
+        self.nbytes = 0
+
+
+class DiskTier:
+    """
+    SQLite store shared by every process that opens the same file
+
+    Hits do not write: access times are buffered and flushed in one
+    executemany every `touch_batch` hits, before each eviction sweep and
+    on close, so LRU order is current whenever it is actually used.
+    """
+
+    def __init__(self, path: str, max_bytes: int = 512 << 20, touch_batch: int = 256):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.touch_batch = touch_batch
+        self._touched: Dict[str, float] = {}
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS cache ('
+            ' key TEXT PRIMARY KEY, namespace TEXT, value BLOB,'
+            ' size INTEGER, accessed REAL)'
+        )
+        self._conn.execute('CREATE INDEX IF NOT EXISTS cache_accessed ON cache(accessed)')
+        self._conn.commit()
+
+    def get(self, key: str) -> Optional[bytes]:
+        row = self._conn.execute('SELECT value FROM cache WHERE key = ?', (key,)).fetchone()
+        if row is None:
+            return None
+        self._touched[key] = time.time()
+        if len(self._touched) >= self.touch_batch:
+            with self._conn:
+                self._flush_touched()
+        return row[0]
+
+    def _flush_touched(self) -> None:
+        """Write buffered access times (caller holds the transaction)"""
+        if self._touched:
+            self._conn.executemany('UPDATE cache SET accessed = ? WHERE key = ?',
+                                   [(t, k) for k, t in self._touched.items()])
+            self._touched.clear()
+
+    def put(self, key: str, namespace: str, blob: bytes) -> int:
+        """Store a pickled value; returns the number of entries evicted"""
+        self._touched.pop(key, None)
+        with self._conn:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO cache VALUES (?, ?, ?, ?, ?)',
+                (key, namespace, blob, len(blob), time.time()),
+            )
+            total = self._conn.execute('SELECT COALESCE(SUM(size), 0) FROM cache').fetchone()[0]
+            if total <= self.max_bytes:
+                return 0
+            self._flush_touched()
+            # Drop least-recently-used rows until the store fits again
+            evicted = 0
+            for old_key, size in self._conn.execute(
+                    'SELECT key, size FROM cache ORDER BY accessed').fetchall():
+                if total <= self.max_bytes:
+                    break
+                self._conn.execute('DELETE FROM cache WHERE key = ?', (old_key,))
+                total -= size
+                evicted += 1
+            return evicted
+
+    def __len__(self) -> int:
+        return self._conn.execute('SELECT COUNT(*) FROM cache').fetchone()[0]
+
+    def clear(self) -> None:
+        self._touched.clear()
+        with self._conn:
+            self._conn.execute('DELETE FROM cache')
+
+    def close(self) -> None:
+        with self._conn:
+            self._flush_touched()
+        self._conn.close()
+
+
+# ═══════════════════════════════════════════════════════════
+# CACHE
+# ═══════════════════════════════════════════════════════════
+class SovereignCache:
+    """
+    Two-tier content-addressed cache
+
+    Args:
+        max_entries: Memory-tier entry limit
+        max_bytes: Memory-tier size limit (pickled bytes)
+        disk_path: SQLite file for the disk tier (None = $SCA_CACHE_DB, or memory only)
+        disk_max_bytes: Disk-tier size limit
+
+    Values are returned as copies, so callers may mutate results freely.
+    """
+
+    def __init__(self, max_entries: int = 4096, max_bytes: int = 64 << 20,
+                 disk_path: Optional[str] = None, disk_max_bytes: int = 512 << 20):
+        disk_path = disk_path or os.environ.get(ENV_DISK_PATH)
+        self.memory = MemoryTier(max_entries, max_bytes)
+        self.disk = DiskTier(disk_path, disk_max_bytes) if disk_path else None
+        self.stats = CacheStats()
+        self._lock = threading.Lock()
+
+    def get(self, key: str, default: Any = None) -> Any:
+        with self._lock:
+            value = self.memory.get(key)
+            if value is not _MISSING:
+                self.stats.hits += 1
+                count('cache.hits')
+                return copy.deepcopy(value)
+            if self.disk is not None:
+                blob = self.disk.get(key)
+                if blob is not None:
+                    value = pickle.loads(blob)
+                    self.stats.disk_hits += 1
+                    count('cache.disk_hits')
+                    self.stats.evictions += self.memory.put(key, value, len(blob))
+                    return copy.deepcopy(value)
+            self.stats.misses += 1
+            count('cache.misses')
+            return default
+
+    def put(self, key: str, value: Any, namespace: str = '') -> None:
+        blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        with self._lock:
+            self.stats.evictions += self.memory.put(key, copy.deepcopy(value), len(blob))
+            if self.disk is not None:
+                self.stats.evictions += self.disk.put(key, namespace, blob)
+
+    def get_or_compute(self, namespace: str, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """fn(*args, **kwargs), served from the cache when the inputs were seen before"""
+        key = content_key(namespace, **_bound_arguments(fn, args, kwargs))
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = fn(*args, **kwargs)
+            self.put(key, value, namespace)
+        return value
+
+    def memoize(self, namespace: str) -> Callable:
+        """Decorator form of get_or_compute"""
+        def decorator(fn):
+            def wrapper(*args, **kwargs):
+                return self.get_or_compute(namespace, fn, *args, **kwargs)
+            wrapper.__name__ = fn.__name__
+            wrapper.__doc__ = fn.__doc__
+            wrapper.__wrapped__ = fn
+            return wrapper
+        return decorator
+
+    def clear(self, disk: bool = False) -> None:
+        with self._lock:
+            self.memory.clear()
+            if disk and self.disk is not None:
+                self.disk.clear()
+            self.stats = CacheStats()
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            **self.stats.summary(),
+            'memory_entries': len(self.memory),
+            'memory_bytes': self.memory.nbytes,
+            'disk_entries': len(self.disk) if self.disk is not None else None,
+        }
+
+
+_CACHES: Dict[Optional[str], SovereignCache] = {}
+
+
+def get_cache(disk_path: Optional[str] = None) -> SovereignCache:
+    """Per-process shared cache for a disk path (None = $SCA_CACHE_DB or memory only)"""
+    disk_path = disk_path or os.environ.get(ENV_DISK_PATH)
+    if disk_path not in _CACHES:
+        _CACHES[disk_path] = SovereignCache(disk_path=disk_path)
+    return _CACHES[disk_path]
+
+
+# ═══════════════════════════════════════════════════════════
+# CACHED CALCULATORS
+# ═══════════════════════════════════════════════════════════
+def cached_box_fill(*args: Any, cache: Optional[SovereignCache] = None, **kwargs: Any) -> Dict[str, Any]:
+    """box_fill_calculator through the cache (same arguments)"""
+    from box_fill_calculator import box_fill_calculator
+
+    return (cache or get_cache()).get_or_compute('box_fill', box_fill_calculator, *args, **kwargs)
+
+
+def cached_manual_j(building_data: Dict[str, Any], cache: Optional[SovereignCache] = None) -> Dict[str, Any]:
+    """manual_j_thermal_load through the cache"""
+    from manual_j_thermal import manual_j_thermal_load
+
+    return (cache or get_cache()).get_or_compute('manual_j', manual_j_thermal_load, building_data)
+
+
+def cached_audit_v2(circuits, cache: Optional[SovereignCache] = None) -> Dict[str, Any]:
+    """imperial_load_audit_v2 (quiet) through the cache"""
+    from vader_load_audit_v2 import imperial_load_audit_v2
+
+    return (cache or get_cache()).get_or_compute('audit_v2', imperial_load_audit_v2, circuits, verbose=False)
+
+
+def cached_audit_v3(load_data, sq_ft=None, climate_zone="San Diego CA",
+                    cache: Optional[SovereignCache] = None):
+    """audit_hospital_node through the cache (returns HospitalAuditResult)"""
+    from imperial_load_audit_v3 import audit_hospital_node
+
+    return (cache or get_cache()).get_or_compute(
+        'audit_v3', audit_hospital_node, load_data, sq_ft=sq_ft, climate_zone=climate_zone,
+    )
+
+
+if __name__ == '__main__':
+    from manual_j_thermal import EXAMPLE_HOME
+
+    cache = get_cache()
+    start = time.perf_counter()
+    for _ in range(10_000):
+        cached_manual_j(EXAMPLE_HOME)
+        cached_box_fill(6, largest_awg=12, devices=1)
+    elapsed = time.perf_counter() - start
+    print(f"20,000 cached calls in {elapsed:.3f} s")
+    print(json.dumps(cache.summary(), indent=2))
@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+"""
+═══════════════════════════════════════════════════════════════
+  SOVEREIGN CLI — ONE ENTRY POINT FOR EVERY CALCULATOR
+  Sovereign Circuit Academy • NEC 2026 Compliant
+
+  Subcommands (file inputs, JSON on stdout):
+    audit       Hospital Node audit (v3) of a schedule file
+    audit-v2    pure-Python audit (v2) — never loads numpy/pandas
+    box-fill    NEC 314.16 for one box, or a CSV of boxes
+    manual-j    Manual J loads from a building JSON and/or flags
+    batch       portfolio audit of a directory of schedules
+    risk        Monte Carlo N+1 / phase imbalance risk of a schedule
+
+  Only argparse/json load at startup; each subcommand imports its
+  calculator (and pandas / matplotlib, if it needs them) on demand.
+  Startup budget: see benchmarks/check_cli_startup.py.
+
+  "One command. Every answer. No waiting."
+═══════════════════════════════════════════════════════════════
+"""
+
+import argparse
+import json
+import sys
+from typing import Any, Dict, List, Optional
+
+import sovereign_paths  # noqa: F401
+
+
+def _positive_int(text: str) -> int:
+    """argparse type: integer >= 1"""
+    value = int(text)
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return value
+
+
+def _json_default(obj: Any) -> Any:
+    """numpy scalars/arrays and other stragglers → JSON"""
+    if hasattr(obj, 'item') and getattr(obj, 'ndim', 0) == 0:
+        return obj.item()
+    if hasattr(obj, 'tolist'):
+        return obj.tolist()
+    return str(obj)
+
+
+def _emit(payload: Any, args: argparse.Namespace) -> None:
+    json.dump(payload, sys.stdout, indent=2 if args.pretty else None, default=_json_default)
+    sys.stdout.write('\n')
+
+
+# ═══════════════════════════════════════════════════════════
+# SUBCOMMANDS
+# ═══════════════════════════════════════════════════════════
+def cmd_audit(args: argparse.Namespace) -> Dict[str, Any]:
+    from imperial_load_audit_v3 import audit_hospital_node, plot_thermal_signature
+    from panel_schedule import read_panel_schedule
+
+    facility = read_panel_schedule(args.schedule, strict=not args.validate)
+    audit_args = dict(
+        sq_ft=args.sq_ft if args.sq_ft is not None else facility.get('sq_ft'),
+        climate_zone=args.climate_zone or facility.get('climate_zone', 'San Diego CA'),
+        validate=args.validate,
+    )
+    if args.profile:
+        from imperial_trace import profile_call
+        result, report = profile_call(audit_hospital_node, facility['circuits'], memory=True, **audit_args)
+        print(report['profile'], file=sys.stderr)
+        print(json.dumps({'trace': report['trace'],
+                          'peak_bytes': report['memory']['peak_bytes'],
+                          'top_allocations': report['memory']['top'][:10]}, indent=2),
+              file=sys.stderr)
+    else:
+        result = audit_hospital_node(facility['circuits'], **audit_args)
+    summary = {'name': facility['name'], **result.summary()}
+    if args.circuits_out:
+        from audit_io import write_circuit_results
+        summary['circuits_file'] = write_circuit_results(result, args.circuits_out)
+    if args.plot:
+        summary['plot_file'] = plot_thermal_signature(
+            result, filename=args.plot, dpi=args.plot_dpi, group_by=args.plot_group_by,
+            top_n=args.plot_top, image_format=args.plot_format)
+    return summary
+
+
+def cmd_audit_v2(args: argparse.Namespace) -> Dict[str, Any]:
+    from imperial_batch_audit import audit_facility
+    from panel_schedule import read_panel_schedule
+
+    facility = read_panel_schedule(args.schedule)
+    return {'name': facility['name'], **audit_facility(facility, engine='v2')}
+
+
+def cmd_box_fill(args: argparse.Namespace) -> Any:
+    if args.input:
+        import pandas as pd
+
+        from box_fill_batch import box_fill_frame
+        out = box_fill_frame(pd.read_csv(args.input))
+        return json.loads(out.to_json(orient='records'))
+
+    from box_fill_calculator import box_fill_calculator
+    if args.conductors is None:
+        raise SystemExit("box-fill: give --conductors N or --input boxes.csv")
+    return box_fill_calculator(
+        conductors=args.conductors,
+        largest_awg=args.awg,
+        devices=args.devices,
+        grounds=not args.no_grounds,
+        clamps=not args.no_clamps,
+        fittings=args.fittings,
+    )
+
+
+MANUAL_J_FLAGS = (
+    'square_footage', 'ceiling_height', 'insulation_r_value', 'window_shgc',
+    'window_area_sqft', 'outdoor_design_temp', 'indoor_design_temp',
+    'occupants', 'lighting_watts', 'appliance_watts',
+)
+
+
+def cmd_manual_j(args: argparse.Namespace) -> Dict[str, Any]:
+    from manual_j_thermal import EXAMPLE_HOME, manual_j_thermal_load
+
+    building: Dict[str, Any] = {}
+    if args.input:
+        with open(args.input) as f:
+            building = json.load(f)
+    elif args.example:
+        building = dict(EXAMPLE_HOME)
+    for name in MANUAL_J_FLAGS:
+        value = getattr(args, name)
+        if value is not None:
+            building[name] = value
+    if args.location:
+        building['location'] = args.location
+        if args.outdoor_design_temp is None:
+            building.pop('outdoor_design_temp', None)
+    if args.design_condition:
+        building['design_condition'] = args.design_condition
+    return manual_j_thermal_load(building)
+
+
+def cmd_batch(args: argparse.Namespace) -> Dict[str, Any]:
+    from imperial_batch_audit import batch_audit, portfolio_summary
+
+    results = batch_audit(args.directory, engine=args.engine, max_workers=args.workers,
+                          chunksize=args.chunksize, cache=args.cache)
+    summary = portfolio_summary(results)
+    if args.export:
+        from audit_io import write_audit_summaries
+        summary['export_file'] = write_audit_summaries(results, args.export)
+    return summary
+
+
+def cmd_risk(args: argparse.Namespace) -> Dict[str, Any]:
+    from imperial_monte_carlo import simulate_n1_risk
+    from panel_schedule import read_panel_schedule
+
+    facility = read_panel_schedule(args.schedule)
+    result = simulate_n1_risk(
+        facility['circuits'], trials=args.trials, seed=args.seed, distribution=args.distribution,
+        cv=args.cv, correlation=args.correlation, capacity_va=args.capacity_va, workers=args.workers,
+    )
+    return {'name': facility['name'], **result.summary()}
+
+
+# ═══════════════════════════════════════════════════════════
+# PARSER
+# ═══════════════════════════════════════════════════════════
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog='sovereign_cli',
+        description="Sovereign Circuit Academy calculators — JSON in the terminal",
+    )
+    parser.add_argument('--pretty', action='store_true', help="indent JSON output")
+    parser.add_argument('--trace', metavar='PATH',
+                        help="write stage timings (*.chrome.json = Chrome trace format)")
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    p = sub.add_parser('audit', help="Hospital Node audit (v3) of a schedule file")
+    p.add_argument('schedule', help=".csv/.json/.jsonl/.parquet/.arrow panel schedule")
+    p.add_argument('--sq-ft', type=float, default=None)
+    p.add_argument('--climate-zone', default=None, help="location name or ZIP")
+    p.add_argument('--circuits-out', metavar='PATH', help="write per-circuit results")
+    p.add_argument('--plot', metavar='PNG', help="render the thermal signature")
+    p.add_argument('--plot-group-by', choices=('panel', 'phase', 'critical'), default=None)
+    p.add_argument('--plot-top', type=_positive_int, default=40, help="bars before the rest go into 'Other'")
+    p.add_argument('--plot-dpi', type=_positive_int, default=300)
+    p.add_argument('--plot-format', default=None, help="png, svg, pdf, ... (default: from --plot)")
+    p.add_argument('--validate', choices=('raise', 'quarantine'), default=None,
+                   help="schema-check the schedule first (quarantine = audit only the valid rows)")
+    p.add_argument('--profile', action='store_true',
+                   help="cProfile + tracemalloc the audit (report on stderr)")
+    p.set_defaults(handler=cmd_audit)
+
+    p = sub.add_parser('audit-v2', help="pure-Python audit (v2) of a schedule file")
+    p.add_argument('schedule', help=".csv/.json/.jsonl panel schedule")
+    p.set_defaults(handler=cmd_audit_v2)
+
+    p = sub.add_parser('box-fill', help="NEC 314.16 box fill")
+    p.add_argument('--input', metavar='CSV', help="CSV of boxes (box_fill_calculator column names)")
+    p.add_argument('--conductors', type=int)
+    p.add_argument('--awg', type=int, default=12)
+    p.add_argument('--devices', type=int, default=1)
+    p.add_argument('--fittings', type=int, default=0)
+    p.add_argument('--no-grounds', action='store_true')
+    p.add_argument('--no-clamps', action='store_true')
+    p.set_defaults(handler=cmd_box_fill)
+
+    p = sub.add_parser('manual-j', help="Manual J heating/cooling loads")
+    p.add_argument('--input', metavar='JSON', help="building_data JSON file")
+    p.add_argument('--example', action='store_true', help="start from the 2,500 sq ft example home")
+    for name in MANUAL_J_FLAGS:
+        p.add_argument('--' + name.replace('_', '-'), type=float, default=None)
+    p.add_argument('--location', help="site name or ZIP (replaces outdoor design temp)")
+    p.add_argument('--design-condition', choices=('cooling', 'heating'))
+    p.set_defaults(handler=cmd_manual_j)
+
+    p = sub.add_parser('batch', help="portfolio audit of a directory of schedules")
+    p.add_argument('directory')
+    p.add_argument('--engine', choices=('v3', 'v2'), default='v3')
+    p.add_argument('--workers', type=int, default=None)
+    p.add_argument('--chunksize', type=int, default=1)
+    p.add_argument('--cache', metavar='DB', default=None, help="SQLite result cache")
+    p.add_argument('--export', metavar='PATH', default=None, help="write per-facility summaries")
+    p.set_defaults(handler=cmd_batch)
+
+    p = sub.add_parser('risk', help="Monte Carlo N+1 / phase imbalance risk of a schedule")
+    p.add_argument('schedule', help=".csv/.json/.jsonl/.parquet/.arrow panel schedule")
+    p.add_argument('--trials', type=int, default=100_000)
+    p.add_argument('--seed', type=int, default=1085)
+    p.add_argument('--distribution', default='normal',
+                   choices=('fixed', 'normal', 'lognormal', 'uniform', 'triangular'),
+                   help="amp distribution for circuits without an amps_distribution column")
+    p.add_argument('--cv', type=float, default=0.10, help="default amps coefficient of variation")
+    p.add_argument('--correlation', type=float, default=0.0, help="shared 0-1 component across circuits")
+    p.add_argument('--capacity-va', type=float, default=None, help="rating to test (default: v3 N+1)")
+    p.add_argument('--workers', type=int, default=1, help="processes (0 = all CPUs)")
+    p.set_defaults(handler=cmd_risk)
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    if args.trace:
+        from imperial_trace import enable
+        enable()
+    try:
+        payload = args.handler(args)
+    except (OSError, KeyError, ValueError) as exc:
+        print(f"sovereign_cli {args.command}: error: {exc}", file=sys.stderr)
+        return 1
+    finally:
+        if args.trace:
+            from imperial_trace import TRACER
+            TRACER.export(args.trace)
+    _emit(payload, args)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,16 @@
+"""
+Module folders live in hyphenated directories (imperial-auditor/,
+box-fill-calculator/, manual-j-integration/) that cannot be imported as
+packages. Importing this module puts them on sys.path for the root tools.
+"""
+
+import os
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.abspath(__file__))
+MODULE_DIRS = ('imperial-auditor', 'box-fill-calculator', 'manual-j-integration')
+
+for _name in MODULE_DIRS:
+    _path = os.path.join(REPO_ROOT, _name)
+    if _path not in sys.path:
+        sys.path.insert(0, _path)
@@ -0,0 +1,445 @@
+#!/usr/bin/env python3
+"""
+═══════════════════════════════════════════════════════════════
+  SOVEREIGN SERVICE — LOCAL JSON API FOR THE CALCULATORS
+  Sovereign Circuit Academy • NEC 2026 Compliant
+
+  Long-running asyncio HTTP server, so callers pay the Python and
+  pandas imports once instead of per request.
+
+  Endpoints (POST, JSON body → JSON response):
+    /audit/v2     imperial_load_audit_v2 + N+1 (circuit list or facility dict)
+    /audit/v3     audit_hospital_node summary (headless)
+    /box-fill     box_fill_calculator — one box (object) or many (array)
+    /manual-j     manual_j_thermal_load — one building or many
+  GET /health, GET /stats
+
+  • Audits: content-hash cache (sovereign_cache), identical in-flight
+    requests coalesced; never run on the event loop — small schedules
+    go to a thread pool (concurrent small v2 audits micro-batched into
+    one hop), large ones to a warm process pool
+  • Box fill / Manual J: concurrent requests within a short window are
+    micro-batched into one box_fill_batch / manual_j_thermal_load_array call
+
+  Stdlib HTTP/1.1 with keep-alive — local use only, no TLS or auth.
+
+  "The Empire never sleeps. Neither does its auditor."
+═══════════════════════════════════════════════════════════════
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import time
+from collections import Counter
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from http import HTTPStatus
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import sovereign_paths  # noqa: F401
+from sovereign_cache import content_key, get_cache
+
+
+MAX_BODY_BYTES = 64 << 20
+
+
+# ═══════════════════════════════════════════════════════════
+# CALCULATOR ADAPTERS (run in workers or in-process)
+# ═══════════════════════════════════════════════════════════
+def _warm_worker() -> None:
+    """Pool initializer: import everything once per worker"""
+    import imperial_batch_audit  # noqa: F401
+    import imperial_load_audit_v3  # noqa: F401
+
+
+def _facility(body: Any) -> Dict[str, Any]:
+    if isinstance(body, list):
+        return {'circuits': body}
+    if isinstance(body, dict) and isinstance(body.get('circuits'), list):
+        return body
+    raise ValueError("expected a circuit list or {\"circuits\": [...], ...}")
+
+
+def run_audit(engine: str, facility: Dict[str, Any]) -> Dict[str, Any]:
+    """One facility summary — same shape as an imperial_batch_audit entry"""
+    from imperial_batch_audit import audit_facility
+
+    return audit_facility(facility, engine=engine)
+
+
+def audit_v2_one(facility: Dict[str, Any]) -> Dict[str, Any]:
+    return run_audit('v2', facility)
+
+
+def audit_v2_many(facilities: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    return [run_audit('v2', facility) for facility in facilities]
+
+
+BOX_FILL_DEFAULTS = {'largest_awg': 12, 'devices': 1, 'grounds': True, 'clamps': True, 'fittings': 0}
+BOX_FILL_KEYS = ('total_allowances', 'conductor_volume_per_unit', 'required_cubic_inches',
+                 'recommended_box', 'compliance')
+
+
+def box_fill_one(box: Dict[str, Any]) -> Dict[str, Any]:
+    from box_fill_calculator import box_fill_calculator
+
+    return box_fill_calculator(**box)
+
+
+def box_fill_many(boxes: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    from box_fill_batch import box_fill_batch
+
+    unknown = {k for box in boxes for k in box} - set(BOX_FILL_DEFAULTS) - {'conductors'}
+    if unknown:
+        raise TypeError(f"unexpected box fill argument(s): {sorted(unknown)}")
+    columns = {k: [box.get(k, default) for box in boxes] for k, default in BOX_FILL_DEFAULTS.items()}
+    results = box_fill_batch([box['conductors'] for box in boxes], **columns)
+    values = [results[k].tolist() for k in BOX_FILL_KEYS]
+    return [dict(zip(BOX_FILL_KEYS, row)) for row in zip(*values)]
+
+
+def manual_j_one(building: Dict[str, Any]) -> Dict[str, Any]:
+    from manual_j_thermal import manual_j_thermal_load
+
+    return manual_j_thermal_load(building)
+
+
+def manual_j_many(buildings: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    from manual_j_vectorized import BUILDING_FIELDS, manual_j_thermal_load_array, outdoor_design_temps
+
+    columns = {f: [b[f] for b in buildings] for f in BUILDING_FIELDS if f != 'outdoor_design_temp'}
+    # Buildings without a design temperature resolve `location`, as manual_j_thermal_load does
+    lookups = [b for b in buildings if 'outdoor_design_temp' not in b]
+    resolved = iter(outdoor_design_temps(
+        [b['location'] for b in lookups], [b.get('design_condition', 'cooling') for b in lookups]
+    ).tolist() if lookups else ())
+    columns['outdoor_design_temp'] = [
+        b['outdoor_design_temp'] if 'outdoor_design_temp' in b else next(resolved) for b in buildings
+    ]
+    results = manual_j_thermal_load_array(columns)
+    keys = list(results)
+    return [dict(zip(keys, row)) for row in zip(*(results[k].tolist() for k in keys))]
+
+
+# ═══════════════════════════════════════════════════════════
+# MICRO-BATCHING
+# ═══════════════════════════════════════════════════════════
+class MicroBatcher:
+    """
+    Collects concurrent single-item requests for `window` seconds (or
+    until max_batch) and answers them with one vectorized call
+
+    Batches smaller than min_vector use the scalar function — below that
+    NumPy's per-call overhead costs more than it saves. If the vectorized
+    call rejects the batch, items are retried one by one so only the bad
+    request fails. With an executor, each batch runs there in one hop
+    instead of on the event loop.
+    """
+
+    def __init__(self, scalar_fn: Callable, vector_fn: Callable, window: float = 0.002,
+                 max_batch: int = 512, min_vector: int = 16, executor: Optional[Executor] = None):
+        self.scalar_fn = scalar_fn
+        self.vector_fn = vector_fn
+        self.window = window
+        self.max_batch = max_batch
+        self.min_vector = min_vector
+        self.executor = executor
+        self.batches = 0
+        self.items = 0
+        self._pending: List[Tuple[Any, asyncio.Future]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+
+    async def submit(self, item: Any) -> Any:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((item, future))
+        if len(self._pending) >= self.max_batch:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.window, self._flush)
+        return await future
+
+    def run_many(self, items: List[Any]) -> List[Any]:
+        """Answer a whole list at once (array request bodies)"""
+        self.batches += 1
+        self.items += len(items)
+        if len(items) < self.min_vector:
+            return [self.scalar_fn(item) for item in items]
+        return self.vector_fn(items)
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        pending, self._pending = self._pending, []
+        if not pending:
+            return
+        if self.executor is None:
+            self._answer(pending, self._run_batch([item for item, _ in pending]))
+            return
+        loop = asyncio.get_running_loop()
+        done = loop.run_in_executor(self.executor, self._run_batch, [item for item, _ in pending])
+        done.add_done_callback(lambda f: self._answer(pending, self._outcomes(f, len(pending))))
+
+    @staticmethod
+    def _outcomes(done: asyncio.Future, n: int) -> List[Tuple[bool, Any]]:
+        if done.cancelled():
+            return [(False, asyncio.CancelledError())] * n
+        if done.exception() is not None:
+            return [(False, done.exception())] * n
+        return done.result()
+
+    def _run_batch(self, items: List[Any]) -> List[Tuple[bool, Any]]:
+        """(ok, result or exception) per item, falling back to scalar calls"""
+        try:
+            return [(True, result) for result in self.run_many(items)]
+        except Exception:
+            pass
+        outcomes = []
+        for item in items:
+            try:
+                outcomes.append((True, self.scalar_fn(item)))
+            except Exception as exc:
+                outcomes.append((False, exc))
+        return outcomes
+
+    @staticmethod
+    def _answer(pending: List[Tuple[Any, asyncio.Future]], outcomes: List[Tuple[bool, Any]]) -> None:
+        for (_, future), (ok, value) in zip(pending, outcomes):
+            if future.cancelled():
+                continue
+            if ok:
+                future.set_result(value)
+            else:
+                future.set_exception(value)
+
+
+# ═══════════════════════════════════════════════════════════
+# SERVICE
+# ═══════════════════════════════════════════════════════════
+class HTTPError(Exception):
+    def __init__(self, status: HTTPStatus, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+class SovereignService:
+    """
+    Args:
+        workers: Process pool size for large audits (0 = no process pool)
+        inline_circuits: Audits with at most this many circuits run on the
+            thread pool instead (pickling a small schedule costs more than
+            auditing it)
+        threads: Thread pool size for small audits (None = executor default)
+        batch_window_ms / max_batch: Micro-batching window and size cap
+        cache_path: SQLite file for the disk cache tier (None = memory only)
+    """
+
+    def __init__(self, workers: Optional[int] = None, inline_circuits: int = 2_000,
+                 threads: Optional[int] = None, batch_window_ms: float = 2.0,
+                 max_batch: int = 512, cache_path: Optional[str] = None):
+        self.pool = ProcessPoolExecutor(max_workers=workers, initializer=_warm_worker) \
+            if workers != 0 else None
+        self.threads = ThreadPoolExecutor(max_workers=threads, thread_name_prefix='audit')
+        self.inline_circuits = inline_circuits
+        self.cache = get_cache(cache_path)
+        window = batch_window_ms / 1000
+        self.batchers = {
+            # Batches run on the thread pool so a large window never stalls the event loop
+            '/box-fill': MicroBatcher(box_fill_one, box_fill_many, window, max_batch,
+                                      executor=self.threads),
+            '/manual-j': MicroBatcher(manual_j_one, manual_j_many, window, max_batch,
+                                      executor=self.threads),
+            # One thread hop per batch; min_vector=1 since there is no vector path to amortize
+            '/audit/v2': MicroBatcher(audit_v2_one, audit_v2_many, window, max_batch,
+                                      min_vector=1, executor=self.threads),
+        }
+        self.requests: Counter = Counter()
+        self.coalesced = 0
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self.started = time.time()
+        _warm_worker()
+
+    # ───────────────────────────────────────────────────────
+    # Routing
+    # ───────────────────────────────────────────────────────
+    async def dispatch(self, method: str, path: str, raw: bytes) -> Any:
+        if method == 'GET' and path == '/health':
+            return {'status': 'ok'}
+        if method == 'GET' and path == '/stats':
+            return self.stats()
+        if path in ('/audit/v2', '/audit/v3', '/box-fill', '/manual-j'):
+            if method != 'POST':
+                raise HTTPError(HTTPStatus.METHOD_NOT_ALLOWED, f"{path} needs POST")
+            self.requests[path] += 1
+            if path.startswith('/audit/'):
+                return await self.audit(path.rsplit('/', 1)[1], raw)
+            body = json.loads(raw) if raw else None
+            batcher = self.batchers[path]
+            if isinstance(body, list):
+                loop = asyncio.get_running_loop()
+                return await loop.run_in_executor(self.threads, batcher.run_many, body)
+            if not isinstance(body, dict):
+                raise ValueError("expected a JSON object or array")
+            return await batcher.submit(body)
+        raise HTTPError(HTTPStatus.NOT_FOUND, f"no route for {method} {path}")
+
+    async def audit(self, engine: str, raw: bytes) -> Dict[str, Any]:
+        # Keyed on the raw body first: a repeated request skips JSON parsing too
+        key = content_key(f'service_{engine}', hashlib.sha256(raw).hexdigest())
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+        if key in self._inflight:
+            self.coalesced += 1
+            return await asyncio.shield(self._inflight[key])
+
+        inputs = {k: v for k, v in _facility(json.loads(raw) if raw else None).items() if k != 'name'}
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._inflight[key] = future
+        try:
+            if self.pool is not None and len(inputs['circuits']) > self.inline_circuits:
+                result = await loop.run_in_executor(self.pool, run_audit, engine, inputs)
+            elif engine == 'v2':
+                result = await self.batchers['/audit/v2'].submit(inputs)
+            else:
+                result = await loop.run_in_executor(self.threads, run_audit, engine, inputs)
+            self.cache.put(key, result, f'service_{engine}')
+            future.set_result(result)
+            return result
+        except Exception as exc:
+            future.set_exception(exc)
+            future.exception()      # retrieved: waiters get it, no "never retrieved" warning
+            raise
+        finally:
+            del self._inflight[key]
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            'uptime_s': round(time.time() - self.started, 1),
+            'requests': dict(self.requests),
+            'coalesced_audits': self.coalesced,
+            'batching': {
+                path: {'batches': b.batches, 'items': b.items,
+                       'mean_batch': round(b.items / b.batches, 2) if b.batches else 0.0}
+                for path, b in self.batchers.items()
+            },
+            'cache': self.cache.summary(),
+        }
+
+    # ───────────────────────────────────────────────────────
+    # HTTP
+    # ───────────────────────────────────────────────────────
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                try:
+                    method, target, version = request_line.decode('latin-1').split()
+                except ValueError:
+                    await self._respond(writer, HTTPStatus.BAD_REQUEST, {'error': 'bad request line'}, False)
+                    break
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b'\r\n', b'\n', b''):
+                        break
+                    name, _, value = line.decode('latin-1').partition(':')
+                    headers[name.strip().lower()] = value.strip()
+
+                keep_alive = headers.get('connection', '').lower() != 'close' and version == 'HTTP/1.1'
+                try:
+                    length = int(headers.get('content-length', 0) or 0)
+                    if length < 0:
+                        raise ValueError(length)
+                except ValueError:
+                    # Body framing is unknown, so the connection cannot be reused
+                    await self._respond(writer, HTTPStatus.BAD_REQUEST, {'error': 'bad Content-Length'}, False)
+                    break
+                if length > MAX_BODY_BYTES:
+                    await self._respond(writer, HTTPStatus.REQUEST_ENTITY_TOO_LARGE,
+                                        {'error': 'body too large'}, False)
+                    break
+                raw = await reader.readexactly(length) if length else b''
+
+                status, payload = HTTPStatus.OK, None
+                try:
+                    payload = await self.dispatch(method, target.split('?', 1)[0], raw)
+                except HTTPError as exc:
+                    status, payload = exc.status, {'error': str(exc)}
+                except (ValueError, KeyError, TypeError) as exc:
+                    status, payload = HTTPStatus.BAD_REQUEST, {'error': f'{type(exc).__name__}: {exc}'}
+                except Exception as exc:
+                    status, payload = HTTPStatus.INTERNAL_SERVER_ERROR, {'error': f'{type(exc).__name__}: {exc}'}
+                await self._respond(writer, status, payload, keep_alive)
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionResetError):
+            pass
+        finally:
+            writer.close()
+
+    @staticmethod
+    async def _respond(writer: asyncio.StreamWriter, status: HTTPStatus, payload: Any,
+                       keep_alive: bool) -> None:
+        body = json.dumps(payload, default=_json_default).encode()
+        head = (
+            f'HTTP/1.1 {status.value} {status.phrase}\r\n'
+            f'Content-Type: application/json\r\n'
+            f'Content-Length: {len(body)}\r\n'
+            f'Connection: {"keep-alive" if keep_alive else "close"}\r\n\r\n'
+        )
+        writer.write(head.encode('latin-1') + body)
+        await writer.drain()
+
+    def close(self) -> None:
+        if self.pool is not None:
+            self.pool.shutdown(cancel_futures=True)
+        self.threads.shutdown(cancel_futures=True)
+
+
+def _json_default(obj: Any) -> Any:
+    if hasattr(obj, 'item') and getattr(obj, 'ndim', 0) == 0:
+        return obj.item()
+    if hasattr(obj, 'tolist'):
+        return obj.tolist()
+    return str(obj)
+
+
+async def serve(host: str = '127.0.0.1', port: int = 8766, **service_kwargs) -> None:
+    """Run the service until cancelled"""
+    service = SovereignService(**service_kwargs)
+    server = await asyncio.start_server(service.handle, host, port)
+    print(f"⚡ Sovereign service on http://{host}:{port} (pid {os.getpid()})", flush=True)
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        service.close()
+
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Local JSON API for the Sovereign calculators")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8766)
+    parser.add_argument('--workers', type=int, default=None, help="audit pool size (0 = in-process)")
+    parser.add_argument('--inline-circuits', type=int, default=2_000)
+    parser.add_argument('--threads', type=int, default=None, help="thread pool size for small audits")
+    parser.add_argument('--batch-window-ms', type=float, default=2.0)
+    parser.add_argument('--max-batch', type=int, default=512)
+    parser.add_argument('--cache', metavar='DB', default=None, help="SQLite cache file")
+    args = parser.parse_args()
+
+    try:
+        asyncio.run(serve(args.host, args.port, workers=args.workers,
+                          inline_circuits=args.inline_circuits, threads=args.threads,
+                          batch_window_ms=args.batch_window_ms,
+                          max_batch=args.max_batch, cache_path=args.cache))
+    except KeyboardInterrupt:
+        pass
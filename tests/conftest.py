@@ -0,0 +1,8 @@
+"""Put the repo root and the hyphenated module folders on sys.path"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import sovereign_paths  # noqa: E402,F401
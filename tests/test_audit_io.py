@@ -0,0 +1,49 @@
+import os
+
+import numpy as np
+import pytest
+
+pa = pytest.importorskip('pyarrow')
+
+from audit_io import read_schedule_table, write_schedule_table  # noqa: E402
+from panel_schedule import COLUMNAR_EXTENSIONS, list_panel_schedules, read_panel_schedule  # noqa: E402
+from vader_load_audit_v2 import HOSPITAL_NODE_SAMPLE  # noqa: E402
+
+
+def _mapped_ranges(path):
+    """Address ranges of `path` in this process's memory maps (Linux)"""
+    real = os.path.realpath(path)
+    with open('/proc/self/maps') as f:
+        for line in f:
+            if line.rstrip().endswith(real):
+                start, end = (int(x, 16) for x in line.split()[0].split('-'))
+                yield start, end
+
+
+@pytest.mark.parametrize('ext', ['.arrow', '.feather', '.ipc'])
+def test_arrow_ipc_round_trip_is_memory_mapped(tmp_path, ext):
+    if not os.path.exists('/proc/self/maps'):
+        pytest.skip('needs /proc/self/maps')
+    path = str(tmp_path / f'schedule{ext}')
+    write_schedule_table(HOSPITAL_NODE_SAMPLE, path)
+    table = read_schedule_table(path)
+    assert table.to_frame().equals(read_schedule_table(path, memory_map=False).to_frame())
+    address = table.voltage.ctypes.data
+    assert any(start <= address < end for start, end in _mapped_ranges(path))
+
+
+def test_parquet_keeps_zstd_by_default(tmp_path):
+    import pyarrow.parquet as pq
+
+    path = write_schedule_table(HOSPITAL_NODE_SAMPLE, str(tmp_path / 'schedule.parquet'))
+    assert pq.ParquetFile(path).metadata.row_group(0).column(0).compression == 'ZSTD'
+    assert np.allclose(read_schedule_table(path).va(), read_schedule_table(path, memory_map=False).va())
+
+
+def test_every_columnar_extension_is_listed_and_read(tmp_path):
+    for ext in COLUMNAR_EXTENSIONS:
+        write_schedule_table(HOSPITAL_NODE_SAMPLE, str(tmp_path / f'site{ext}'))
+    listed = list_panel_schedules(str(tmp_path))
+    assert sorted(os.path.splitext(p)[1] for p in listed) == sorted(COLUMNAR_EXTENSIONS)
+    for path in listed:
+        assert len(read_panel_schedule(path)['circuits']) == len(HOSPITAL_NODE_SAMPLE)
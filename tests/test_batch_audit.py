@@ -0,0 +1,70 @@
+import json
+import pathlib
+
+import pytest
+
+from imperial_batch_audit import batch_audit, portfolio_summary
+from vader_load_audit_v2 import HOSPITAL_NODE_SAMPLE
+
+
+SCHEDULE = (
+    "circuit_name,voltage,amps,phase,continuous\n"
+    "ICU-1,120,20,A,true\n"
+    "ICU-2,120,20,B,false\n"
+    "Chiller,208,30,C,true\n"
+)
+
+
+def test_single_file_is_one_facility(tmp_path):
+    path = tmp_path / 'site.csv'
+    path.write_text(SCHEDULE)
+    for source in (str(path), pathlib.Path(path)):
+        results = batch_audit(source, engine='v2', max_workers=1)
+        assert [r.name for r in results] == ['site']
+        assert results[0].ok, results[0].error
+
+
+def test_directory_expands_to_schedules(tmp_path):
+    for name in ('a', 'b'):
+        (tmp_path / f'{name}.csv').write_text(SCHEDULE)
+    results = batch_audit(str(tmp_path), engine='v2', max_workers=1)
+    assert sorted(r.name for r in results) == ['a', 'b']
+    assert all(r.ok for r in results)
+
+
+def test_missing_file_is_a_failed_facility(tmp_path):
+    results = batch_audit(str(tmp_path / 'missing.csv'), engine='v2', max_workers=1)
+    assert len(results) == 1 and not results[0].ok
+
+
+def test_same_stem_keeps_both_facilities(tmp_path):
+    (tmp_path / 'a.csv').write_text(SCHEDULE)
+    (tmp_path / 'a.json').write_text(json.dumps(
+        [{'circuit_name': 'X', 'voltage': 120, 'amps': 10, 'phase': 'A'}]))
+    results = batch_audit(str(tmp_path), engine='v2', max_workers=1)
+    assert sorted(r.name for r in results) == ['a (a.csv)', 'a (a.json)']
+    assert portfolio_summary(results)['facilities'] == 2
+    assert len(portfolio_summary(results)['n1_capacity_va']) == 2
+
+
+def test_duplicate_facility_dicts_get_unique_names():
+    facility = {'name': 'Mercy', 'circuits': HOSPITAL_NODE_SAMPLE}
+    results = batch_audit([facility, facility], engine='v2', max_workers=1)
+    assert [r.name for r in results] == ['Mercy #0', 'Mercy #1']
+
+
+def test_process_pool_matches_in_process():
+    facilities = [HOSPITAL_NODE_SAMPLE, HOSPITAL_NODE_SAMPLE[:5], [{'voltage': 'bad'}]]
+    for engine in ('v2', 'v3'):
+        serial = batch_audit(facilities, engine=engine, max_workers=1)
+        pooled = batch_audit(facilities, engine=engine, max_workers=2)
+        assert [(r.name, r.ok, r.summary) for r in serial] == [(r.name, r.ok, r.summary) for r in pooled]
+        assert [r.ok for r in pooled] == [True, True, False]
+
+
+def test_v3_and_v2_agree_on_totals():
+    v2, = batch_audit([HOSPITAL_NODE_SAMPLE], engine='v2', max_workers=1)
+    v3, = batch_audit([HOSPITAL_NODE_SAMPLE], engine='v3', max_workers=1)
+    assert v3.ok, v3.error
+    assert v3.summary['total_va'] == pytest.approx(v2.summary['total_va'], abs=0.01)
+    assert v3.summary['n1_capacity'] == pytest.approx(v2.summary['n1_capacity'], abs=0.02)
@@ -0,0 +1,51 @@
+import itertools
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from box_fill_batch import box_fill_batch, box_fill_frame
+from box_fill_calculator import box_fill_calculator
+
+KEYS = ('total_allowances', 'conductor_volume_per_unit', 'required_cubic_inches',
+        'recommended_box', 'compliance')
+
+
+def _grid():
+    return list(itertools.product(range(0, 16), [14, 12, 10, 8, 6, 4, 3, 2, 1, 0, 18],
+                                  range(0, 3), [True, False], [True, False], range(0, 2)))
+
+
+def test_batch_matches_scalar_on_every_combination():
+    grid = _grid()
+    columns = [np.array(col) for col in zip(*grid)]
+    batch = box_fill_batch(*columns)
+    for i, args in enumerate(grid):
+        scalar = box_fill_calculator(*args)
+        assert {k: batch[k][i] for k in KEYS} == scalar, args
+
+
+def test_float_columns_from_csv_match_scalar(tmp_path):
+    df = pd.DataFrame({'conductors': [4.0, 9.0, 2.0], 'largest_awg': [12.0, 10.0, 14.0],
+                       'devices': [1.0, 2.0, 0.0], 'fittings': [0.0, 1.0, 0.0]})
+    path = tmp_path / 'boxes.csv'
+    df.to_csv(path, index=False)
+    out = box_fill_frame(pd.read_csv(path))
+    for row, (_, box) in zip(out.itertuples(), df.iterrows()):
+        scalar = box_fill_calculator(int(box.conductors), int(box.largest_awg),
+                                     int(box.devices), fittings=int(box.fittings))
+        assert row.recommended_box == scalar['recommended_box']
+        assert row.required_cubic_inches == scalar['required_cubic_inches']
+
+
+def test_non_integral_awg_is_unknown_like_scalar():
+    batch = box_fill_batch([4], largest_awg=[12.5])
+    assert batch['conductor_volume_per_unit'][0] == box_fill_calculator(4, 12.5)['conductor_volume_per_unit']
+
+
+@pytest.mark.parametrize('field', ['conductors', 'devices', 'fittings'])
+def test_fractional_counts_are_rejected(field):
+    args = {'conductors': [4, 4], 'devices': [1, 1], 'fittings': [0, 0]}
+    args[field] = [1, 2.5]
+    with pytest.raises(ValueError, match=field):
+        box_fill_batch(**args)
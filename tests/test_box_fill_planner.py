@@ -0,0 +1,101 @@
+import itertools
+
+import numpy as np
+import pytest
+
+from box_fill_batch import required_volume
+from box_fill_planner import BoxSpec, build_catalog, plan_floor_boxes
+
+
+def _floor(rng, n):
+    return dict(
+        conductors=rng.integers(2, 9, size=n),
+        largest_awg=rng.choice([14, 12], size=n),
+        devices=rng.integers(0, 3, size=n),
+        grounds=np.ones(n, dtype=bool),
+        clamps=rng.random(n) < 0.5,
+    )
+
+
+def _brute_force(required, catalog, objective, k):
+    """Cheapest plan over every set of at most k box types"""
+    value = [b.cost if objective == 'cost' and b.cost is not None else b.volume for b in catalog]
+    best = np.inf
+    for size in range(1, k + 1):
+        for subset in itertools.combinations(range(len(catalog)), size):
+            total = 0.0
+            for need in required:
+                fitting = [value[i] for i in subset if catalog[i].volume >= need]
+                if not fitting:
+                    total = np.inf
+                    break
+                total += min(fitting)
+            best = min(best, total)
+    return best
+
+
+def _plan_value(plan, objective):
+    return plan.total_cost if objective == 'cost' else plan.total_volume
+
+
+def test_unlimited_types_pick_smallest_fitting_box():
+    rng = np.random.default_rng(1)
+    floor = _floor(rng, 500)
+    plan = plan_floor_boxes(floor)
+    _, _, required = required_volume(**floor)
+    volumes = np.array([plan.catalog[i].volume for i in plan.box_index[plan.compliant]])
+    assert (volumes >= required[plan.compliant]).all()
+    standard = sorted(b.volume for b in plan.catalog)
+    for need, got in zip(required[plan.compliant], volumes):
+        assert got == min(v for v in standard if v >= need)
+
+
+@pytest.mark.parametrize('objective', ['volume', 'cost'])
+@pytest.mark.parametrize('k', [1, 2, 3])
+def test_type_limit_dp_matches_brute_force(objective, k):
+    rng = np.random.default_rng(10 * k + len(objective))
+    for _ in range(15):
+        volumes = np.sort(rng.uniform(10, 45, size=7)).round(1)
+        catalog = [BoxSpec(f'box{i}', float(v), float(rng.uniform(0.5, 5)))
+                   for i, v in enumerate(volumes)]
+        floor = _floor(rng, int(rng.integers(1, 25)))
+        _, _, required = required_volume(**floor)
+        required = np.atleast_1d(required)
+        if required.max() > volumes.max():
+            continue
+        plan = plan_floor_boxes(floor, catalog, objective=objective, max_box_types=k)
+        assert plan.compliant.all()
+        assert len(plan.box_types) <= k
+        assigned = np.array([catalog[i].volume for i in plan.box_index])
+        assert (assigned >= required).all()
+        assert _plan_value(plan, objective) == pytest.approx(_brute_force(required, catalog, objective, k))
+
+
+def test_oversized_box_needs_custom():
+    plan = plan_floor_boxes({'conductors': np.array([2, 60])})
+    assert plan.compliant.tolist() == [True, False]
+    assert plan.summary()['custom_boxes_required'] == 1
+
+
+def test_bad_arguments():
+    floor = {'conductors': np.array([4])}
+    with pytest.raises(ValueError):
+        plan_floor_boxes(floor, objective='weight')
+    with pytest.raises(ValueError):
+        plan_floor_boxes(floor, max_box_types=0)
+
+
+def test_build_catalog_costs():
+    catalog = build_catalog(extra_boxes=[('deep', 30.0, 2.5)], costs={'4" × 1.5" round': 1.1})
+    by_name = {b.name: b for b in catalog}
+    assert by_name['deep'].cost == 2.5
+    assert by_name['4" × 1.5" round'].cost == 1.1
+
+
+def test_duplicate_box_names_are_rejected():
+    floor = {'conductors': np.array([4, 8])}
+    catalog = [BoxSpec('deep', 18.0, 1.0), BoxSpec('deep', 30.0, 2.0)]
+    with pytest.raises(ValueError, match='deep'):
+        plan_floor_boxes(floor, catalog)
+    with pytest.raises(ValueError, match='round'):
+        build_catalog(extra_boxes=[('4" × 1.5" round', 20.0)])
@@ -0,0 +1,73 @@
+import csv
+import random
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from circuit_table import Circuit, CircuitTable
+from circuit_validation import validate_schedule
+from panel_schedule import read_panel_schedule
+from vader_load_audit_v2 import circuit_va, imperial_load_audit_v2
+
+
+def _circuits(n=500, seed=6):
+    rng = random.Random(seed)
+    return [{'circuit_name': f'C{i}', 'voltage': rng.choice([120, 208, 277, 480]),
+             'amps': round(rng.uniform(1, 90), 1), 'phases': rng.choice([1, 1, 3]),
+             'continuous': rng.random() < 0.5, 'phase': rng.choice('ABC')} for i in range(n)]
+
+
+def test_va_and_phase_loads_match_dict_path():
+    circuits = _circuits()
+    table = CircuitTable.from_circuits(circuits)
+    assert np.allclose(table.va(), [circuit_va(c) for c in circuits], rtol=1e-12)
+
+    expected = {'A': 0.0, 'B': 0.0, 'C': 0.0}
+    for c in circuits:
+        va = circuit_va(c)
+        if c['phases'] == 1:
+            expected[c['phase']] += va
+        else:
+            for p in expected:
+                expected[p] += va / 3
+    assert table.phase_loads() == pytest.approx(expected, rel=1e-12)
+    assert imperial_load_audit_v2(table, verbose=False) == imperial_load_audit_v2(circuits, verbose=False)
+
+
+def test_records_round_trip():
+    circuits = _circuits(20)
+    table = CircuitTable.from_circuits([Circuit(**c) for c in circuits])
+    assert [c.to_dict() for c in table] == [Circuit(**c).to_dict() for c in circuits]
+    assert imperial_load_audit_v2(table.to_circuits(), verbose=False) == \
+        imperial_load_audit_v2(circuits, verbose=False)
+
+
+def test_file_loaders_parse_cells_the_same(tmp_path):
+    path = tmp_path / 'site.csv'
+    with open(path, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['circuit_name', 'voltage', 'amps', 'continuous', 'phase'])
+        for i, (flag, phase) in enumerate([('1.0', ' b'), ('yes', 'c'), ('0', 'A'), ('', ''), ('T', 'a ')]):
+            writer.writerow([f'C{i}', 120, 10, flag, phase])
+    rows = read_panel_schedule(str(path))['circuits']
+    table = CircuitTable.from_csv(str(path))
+    assert table.continuous.tolist() == [bool(r.get('continuous')) for r in rows] == \
+        [True, True, False, False, True]
+    assert [c.phase for c in table] == [r.get('phase', 'A') for r in rows] == ['B', 'C', 'A', 'A', 'A']
+
+
+def test_in_memory_labels_must_be_canonical_like_the_validator():
+    circuits = [{'circuit_name': 'x', 'voltage': 120, 'amps': 10, 'phase': 'b'}]
+    assert not validate_schedule(circuits).valid
+    with pytest.raises(ValueError):
+        CircuitTable.from_circuits(circuits)
+    with pytest.raises(ValueError):
+        CircuitTable.from_frame(pd.DataFrame(circuits))
+    assert CircuitTable.from_frame(pd.DataFrame(circuits), normalize_labels=True)[0].phase == 'B'
+
+
+def test_three_phase_rows_ignore_their_label():
+    table = CircuitTable.from_circuits([{'circuit_name': 'M', 'voltage': 480, 'amps': 10,
+                                         'phases': 3, 'phase': 'X'}])
+    assert table.three_phase.tolist() == [True]
@@ -0,0 +1,110 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from circuit_table import CircuitTable
+from circuit_validation import ScheduleValidationError, enforce_schedule, validate_schedule
+from imperial_load_audit_v3 import audit_hospital_node
+from vader_load_audit_v2 import imperial_load_audit_v2
+
+GOOD = [
+    {'circuit_name': 'ICU-1', 'voltage': 120, 'amps': 20, 'phase': 'A', 'continuous': True},
+    {'circuit_name': 'OR Lights', 'voltage': 277, 'amps': 20, 'phase': 'C'},
+    {'circuit_name': 'Chiller', 'voltage': 480, 'amps': 60, 'phases': 3, 'phase': 'X'},
+]
+BAD = [
+    {'circuit_name': 'No Volts', 'amps': 20, 'phase': 'B'},                         # row 3
+    {'circuit_name': 'Lobby', 'voltage': 120, 'amps': -5, 'phase': 'D'},             # row 4
+    {'circuit_name': 'Text', 'voltage': '120V', 'amps': 20, 'continuous': 'False'},  # row 5
+    {'circuit_name': 'Two', 'voltage': 208, 'amps': 20, 'phases': 2},                # row 6
+]
+SCHEDULE = GOOD + BAD
+MISSING_COLUMN = [{'circuit_name': 'x', 'amps': 20}]
+
+
+def test_every_violation_is_collected():
+    report = validate_schedule(SCHEDULE)
+    assert report.bad_rows.tolist() == [3, 4, 5, 6]
+    assert report.counts() == {
+        'voltage: not_null': 1, 'amps: non_negative': 1, "phase: in {'A', 'B', 'C'}": 1,
+        'voltage: numeric': 1, 'continuous: boolean': 1, 'phases: in {1, 3}': 1,
+    }
+
+
+@pytest.mark.parametrize('as_input', [list, pd.DataFrame])
+def test_valid_schedule_passes_both_modes(as_input):
+    for mode in ('raise', 'quarantine'):
+        circuits, report = enforce_schedule(as_input(GOOD), mode)
+        assert report.valid and len(circuits) == len(GOOD)
+
+
+def test_table_checks_only_floats():
+    table = CircuitTable.from_circuits(GOOD)
+    table.amps[1] = np.nan
+    assert validate_schedule(table).bad_rows.tolist() == [1]
+
+
+def test_raise_mode_lists_violations():
+    with pytest.raises(ScheduleValidationError) as info:
+        enforce_schedule(SCHEDULE, 'raise')
+    assert isinstance(info.value, ValueError)
+    assert len(info.value.report.bad_rows) == len(BAD)
+    assert 'row 4' in str(info.value)
+
+
+@pytest.mark.parametrize('as_input', [list, pd.DataFrame])
+def test_quarantine_mode_keeps_valid_rows(as_input):
+    circuits, report = enforce_schedule(as_input(SCHEDULE), 'quarantine')
+    assert len(circuits) == len(GOOD) and len(report.quarantined) == len(BAD)
+    assert type(circuits) is type(report.quarantined) is as_input
+
+
+def test_unique_names():
+    report = validate_schedule(GOOD + GOOD[:1], unique_names=True)
+    assert report.bad_rows.tolist() == [0, 3]
+
+
+@pytest.mark.parametrize('mode', ['raise', 'quarantine'])
+def test_missing_required_column_raises_in_both_modes(mode):
+    report = validate_schedule(MISSING_COLUMN)
+    assert report.missing_columns == ['voltage']
+    with pytest.raises(ScheduleValidationError):
+        enforce_schedule(MISSING_COLUMN, mode)
+    with pytest.raises(ScheduleValidationError):
+        audit_hospital_node(MISSING_COLUMN, validate=mode)
+    with pytest.raises(ScheduleValidationError):
+        imperial_load_audit_v2(MISSING_COLUMN, verbose=False, validate=mode)
+
+
+def test_audits_in_quarantine_mode_match_clean_schedule():
+    v3 = audit_hospital_node(SCHEDULE, validate='quarantine')
+    assert v3.summary()['total_va'] == audit_hospital_node(GOOD).summary()['total_va']
+    assert v3.validation.bad_rows.tolist() == [3, 4, 5, 6]
+    v2 = imperial_load_audit_v2(SCHEDULE, verbose=False, validate='quarantine')
+    assert v2['total_va'] == imperial_load_audit_v2(GOOD, verbose=False)['total_va']
+    with pytest.raises(ScheduleValidationError):
+        audit_hospital_node(SCHEDULE, validate=True)
+
+
+def test_bad_mode():
+    with pytest.raises(ValueError):
+        enforce_schedule(GOOD, 'ignore')
+
+
+def test_object_column_checks_match_per_value_rules():
+    from decimal import Decimal
+
+    from circuit_validation import _continuous_check, _not_a_number
+
+    pool = [True, False, np.True_, np.False_, 0, 1, 2, -1, 0.0, 1.0, 0.5, np.nan, None,
+            np.int8(1), np.int64(3), np.float32(0), np.float64(1.5), np.inf,
+            'True', 'False', '1', '', Decimal(1), Decimal('0.5'), 1 + 0j, 2j, [1], b'1']
+    rng = np.random.default_rng(7)
+    for _ in range(50):
+        col = pd.Series([pool[i] for i in rng.integers(0, len(pool), size=40)], dtype=object)
+        not_number = np.array([isinstance(v, (str, bool)) or not isinstance(v, (int, float, np.number))
+                               for v in col]) & col.notna().to_numpy()
+        not_boolean = np.array([not (v is None or (not isinstance(v, str) and (v != v or v in [True, False, 0, 1])))
+                                for v in col])
+        assert np.array_equal(_not_a_number(col), not_number)
+        assert np.array_equal(_continuous_check(col), not_boolean)
@@ -0,0 +1,51 @@
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+from vader_load_audit_v2 import HOSPITAL_NODE_SAMPLE
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CLI = os.path.join(REPO_ROOT, 'sovereign_cli.py')
+HEAVY_MODULES = ('numpy', 'pandas', 'matplotlib')
+
+
+def _imported_modules(stderr: str) -> set:
+    """Top-level package names from `python -X importtime` output"""
+    names = set()
+    for line in stderr.splitlines():
+        if line.startswith('import time:') and '|' in line:
+            name = line.rsplit('|', 1)[1].strip()
+            if name != 'imported package':
+                names.add(name.split('.')[0])
+    return names
+
+
+def _run_cli(tmp_path, command: str) -> set:
+    """Run one subcommand in a fresh interpreter; returns the packages it imported"""
+    schedule = tmp_path / 'node.json'
+    schedule.write_text(json.dumps(HOSPITAL_NODE_SAMPLE))
+    argv = {
+        'box-fill': ['box-fill', '--conductors', '6', '--awg', '12'],
+        'manual-j': ['manual-j', '--example'],
+        'audit-v2': ['audit-v2', str(schedule)],
+        'audit': ['audit', str(schedule)],
+    }[command]
+    env = {k: v for k, v in os.environ.items() if k != 'PYTHONPATH'}
+    result = subprocess.run([sys.executable, '-X', 'importtime', CLI, *argv],
+                            capture_output=True, text=True, env=env, cwd=str(tmp_path), check=True)
+    assert json.loads(result.stdout)
+    return _imported_modules(result.stderr)
+
+
+@pytest.mark.parametrize('command', ['box-fill', 'manual-j', 'audit-v2'])
+def test_light_subcommands_skip_heavy_imports(tmp_path, command):
+    imported = _run_cli(tmp_path, command)
+    assert 'sovereign_paths' in imported
+    assert not imported & set(HEAVY_MODULES), sorted(imported & set(HEAVY_MODULES))
+
+
+def test_import_probe_sees_heavy_imports(tmp_path):
+    assert {'numpy', 'pandas'} <= _run_cli(tmp_path, 'audit')
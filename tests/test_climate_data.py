@@ -0,0 +1,62 @@
+import os
+
+import numpy as np
+import pytest
+
+from climate_data import CSV_PATH, NPY_PATH, ClimateIndex, build_climate_index
+
+
+def test_committed_index_matches_csv(tmp_path):
+    rebuilt = build_climate_index(CSV_PATH, str(tmp_path / 'climate.npy'))
+    assert np.array_equal(np.load(rebuilt), np.load(NPY_PATH))
+
+
+def test_loading_never_rewrites_the_index(tmp_path):
+    npy = build_climate_index(CSV_PATH, str(tmp_path / 'climate.npy'))
+    os.utime(npy, (1, 1))               # CSV now looks newer than the .npy
+    index = ClimateIndex(npy)
+    assert index.lookup('Chicago IL').name == 'Chicago IL'
+    assert os.path.getmtime(npy) == 1
+    assert not index.records.flags.writeable
+
+
+def test_build_leaves_no_temp_files(tmp_path):
+    build_climate_index(CSV_PATH, str(tmp_path / 'climate.npy'))
+    assert os.listdir(tmp_path) == ['climate.npy']
+
+
+def test_nearest_cache_is_per_instance_and_bounded(monkeypatch):
+    import gc
+    import weakref
+
+    import climate_data
+
+    monkeypatch.setattr(climate_data, 'NEAREST_CACHE_SIZE', 3)
+    index = ClimateIndex()
+    for lat in range(30, 40):
+        assert index.nearest(lat, -100.0).name == index.nearest(lat, -100.0).name
+    assert 0 < len(index._nearest_cache) <= 3
+    assert ClimateIndex()._nearest_cache == {}
+
+    ref = weakref.ref(index)
+    del index
+    gc.collect()
+    assert ref() is None
+
+
+def test_lookup_loads_on_first_use():
+    index = ClimateIndex()
+    assert index._records is None
+    assert index.lookup('92101').name == 'San Diego CA'
+    assert index._records is not None
+
+
+@pytest.mark.parametrize('location, hint', [
+    ('Chicgo IL', 'Chicago IL'),
+    ('99999', 'Anchorage AK'),
+])
+def test_unknown_location_names_nearest_site(location, hint):
+    from manual_j_thermal import design_temp_for
+
+    with pytest.raises(ValueError, match=f"{location!r}.*nearest known site is '{hint}'"):
+        design_temp_for(location)
@@ -0,0 +1,55 @@
+import random
+
+import numpy as np
+import pandas as pd
+
+from critical_circuits import CRITICAL_KEYWORDS, CriticalCircuitClassifier, classify_names
+from imperial_load_audit_v3 import audit_hospital_node
+from vader_load_audit_v2 import is_critical_circuit
+
+WORDS = ['ICU', 'OR', 'Emergency', 'Life Safety', 'Critical', 'Nurse', 'Lobby', 'Kitchen',
+         'icu', 'Office', 'Corridor', 'DOOR', 'Storage', 'Lab', 'Nurse Call', '']
+
+
+def _names(n=3_000, seed=7):
+    rng = random.Random(seed)
+    names = [f'{rng.choice(WORDS)}{rng.choice(["", "-", " "])}{rng.choice(WORDS)}-{rng.randrange(50)}'
+             for _ in range(n)]
+    return names + [None, 42, float('nan'), 'ORx', 'x' * 500]
+
+
+def _reference(name, keywords=CRITICAL_KEYWORDS):
+    """The original any(k in str(name)) test"""
+    return any(k in str(name) for k in keywords)
+
+
+def test_matches_substring_reference_every_path():
+    names = _names()
+    expected = [_reference(n) for n in names]
+    assert [is_critical_circuit({'circuit_name': n}) for n in names] == expected
+    assert list(classify_names(names)) == expected
+    assert classify_names(pd.Series(names, dtype=object)).tolist() == expected
+    assert classify_names(np.array(names, dtype=object)).tolist() == expected
+
+
+def test_memo_reset_keeps_answers():
+    names = _names(500)
+    classifier = CriticalCircuitClassifier(memo_size=16)
+    first = classifier.classify(names)
+    assert classifier.classify(names) == first == [_reference(n) for n in names]
+    assert len(classifier._memo) <= 16 + len(names)
+
+
+def test_custom_keywords():
+    classifier = CriticalCircuitClassifier(['Lab', 'Lab', ''])
+    assert classifier.keywords == ('Lab',)
+    names = _names(300)
+    assert classifier.classify(names) == [_reference(n, ['Lab']) for n in names]
+    assert CriticalCircuitClassifier([]).classify(['ICU']) == [False]
+
+
+def test_v3_critical_circuits_match_reference():
+    names = _names(400)[:400]
+    circuits = [{'circuit_name': n, 'voltage': 120, 'amps': 10, 'phase': 'A'} for n in names]
+    result = audit_hospital_node(circuits)
+    assert result.critical_circuits['circuit_name'].tolist() == [n for n in names if _reference(n)]
@@ -0,0 +1,99 @@
+import json
+import threading
+
+import pytest
+
+import imperial_trace
+from imperial_trace import Tracer, count, stage, tracing
+
+
+@pytest.fixture(autouse=True)
+def _tracing_off():
+    previous = imperial_trace.TRACER.enabled
+    imperial_trace.disable()
+    imperial_trace.TRACER.reset()
+    yield
+    imperial_trace.TRACER.enabled = previous
+    imperial_trace.TRACER.reset()
+
+
+def test_disabled_tracing_records_nothing():
+    with stage('off', rows=3) as st:
+        st.note(extra=1)
+    count('off.rows', 5)
+    assert st is imperial_trace._NULL_STAGE
+    assert imperial_trace.TRACER.events == [] and not imperial_trace.TRACER.counters
+
+
+def test_stages_and_counters():
+    with tracing() as tracer:
+        for rows in (10, 20):
+            with stage('load', rows=rows) as st:
+                with stage('load.parse'):
+                    pass
+                st.note(bad_rows=1)
+        count('cache.hits')
+        count('cache.hits', 2)
+        count('kwh', 1.5)
+    assert not imperial_trace.enabled()
+
+    summary = tracer.summary()
+    assert summary['stages']['load']['calls'] == 2
+    assert summary['stages']['load.parse']['calls'] == 2
+    assert summary['stages']['load']['total_ms'] >= summary['stages']['load.parse']['total_ms']
+    assert summary['counters'] == {'cache.hits': 3, 'kwh': 1.5}
+    loads = [e for e in tracer.to_dict()['events'] if e['name'] == 'load']
+    assert [e['args'] for e in loads] == [{'rows': 10, 'bad_rows': 1}, {'rows': 20, 'bad_rows': 1}]
+
+
+def test_tracing_restores_previous_state():
+    imperial_trace.enable()
+    with tracing():
+        pass
+    assert imperial_trace.enabled()
+
+
+def test_chrome_export(tmp_path):
+    tracer = Tracer(enabled=True)
+
+    def work():
+        with tracer.stage('v3.va', rows=7):
+            with tracer.stage('v3.va.inner'):
+                pass
+
+    work()
+    thread = threading.Thread(target=work)
+    thread.start()
+    thread.join()
+    tracer.count('cache.misses', 4)
+
+    path = tracer.export(str(tmp_path / 'run.chrome.json'))
+    trace = json.loads(open(path).read())
+    spans = [e for e in trace['traceEvents'] if e['ph'] == 'X']
+    counters = [e for e in trace['traceEvents'] if e['ph'] == 'C']
+    assert len(spans) == 4 and len({e['tid'] for e in spans}) == 2
+    assert all(e['cat'] == 'v3' and e['ts'] >= 0 and e['dur'] >= 0 for e in spans)
+    for tid in {e['tid'] for e in spans}:
+        outer, inner = sorted((e for e in spans if e['tid'] == tid), key=lambda e: e['name'])
+        assert outer['ts'] <= inner['ts'] and inner['ts'] + inner['dur'] <= outer['ts'] + outer['dur'] + 1e-3
+        assert outer['args'] == {'rows': 7}
+    assert counters == [{'name': 'cache.misses', 'ph': 'C', 'pid': spans[0]['pid'],
+                         'ts': max(e['ts'] + e['dur'] for e in spans), 'args': {'value': 4.0}}]
+
+    plain = json.loads(open(tracer.export(str(tmp_path / 'run.json'))).read())
+    assert set(plain) == {'pid', 'stages', 'counters', 'events'}
+
+
+def test_v3_audit_stages_and_cache_counters():
+    from sovereign_cache import SovereignCache, cached_audit_v2
+    from imperial_load_audit_v3 import audit_hospital_node
+    from vader_load_audit_v2 import HOSPITAL_NODE_SAMPLE
+
+    cache = SovereignCache()
+    with tracing() as tracer:
+        audit_hospital_node(HOSPITAL_NODE_SAMPLE, sq_ft=10_000)
+        cached_audit_v2(HOSPITAL_NODE_SAMPLE, cache=cache)
+        cached_audit_v2(HOSPITAL_NODE_SAMPLE, cache=cache)
+    summary = tracer.summary()
+    assert {'v3.load', 'v3.va', 'v3.phase_balance', 'v3.manual_j', 'v3.critical'} <= set(summary['stages'])
+    assert summary['counters'] == {'cache.misses': 1, 'cache.hits': 1}
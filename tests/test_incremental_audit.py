@@ -0,0 +1,83 @@
+import random
+
+import pytest
+
+from incremental_audit import LoadAudit
+from vader_load_audit_v2 import HOSPITAL_NODE_SAMPLE, circuit_va, imperial_load_audit_v2
+
+
+def _assert_matches_fresh(audit):
+    circuits = [audit._circuits[name] for name in audit._circuits]
+    fresh = imperial_load_audit_v2(circuits, verbose=False) if circuits else None
+    if fresh:
+        assert audit.total_va == pytest.approx(fresh['total_va'], abs=0.006)
+        for phase, load in audit.phase_loads.items():
+            assert load == pytest.approx(fresh['phase_loads'][phase], abs=0.006)
+    assert audit.max_unit == pytest.approx(max((circuit_va(c) for c in circuits), default=0.0))
+
+
+def test_matches_v2_on_sample():
+    audit = LoadAudit(HOSPITAL_NODE_SAMPLE)
+    _assert_matches_fresh(audit)
+    assert len(audit) == len(HOSPITAL_NODE_SAMPLE)
+
+
+def test_random_edits_match_fresh_audit():
+    rng = random.Random(7)
+    audit = LoadAudit()
+    names = []
+    for step in range(2000):
+        op = rng.random()
+        if op < 0.45 or not names:
+            name = f'C{step}'
+            audit.add({'circuit_name': name, 'voltage': rng.choice((120, 208, 277, 480)),
+                       'amps': rng.uniform(1, 80), 'phase': rng.choice('ABC'),
+                       'phases': rng.choice((1, 1, 3)), 'continuous': rng.random() < 0.3})
+            names.append(name)
+        elif op < 0.75:
+            audit.update(rng.choice(names), amps=rng.uniform(1, 80), phase=rng.choice('ABC'))
+        else:
+            audit.remove(names.pop(rng.randrange(len(names))))
+        if step % 100 == 0:
+            _assert_matches_fresh(audit)
+    _assert_matches_fresh(audit)
+
+
+def test_rename_onto_existing_name_leaves_audit_intact():
+    audit = LoadAudit(HOSPITAL_NODE_SAMPLE)
+    first, second = (c['circuit_name'] for c in HOSPITAL_NODE_SAMPLE[:2])
+    before = audit.results()
+    with pytest.raises(ValueError):
+        audit.update(first, circuit_name=second)
+    assert first in audit and second in audit
+    assert audit.results() == before
+
+
+def test_rename_to_new_name():
+    audit = LoadAudit(HOSPITAL_NODE_SAMPLE)
+    first = HOSPITAL_NODE_SAMPLE[0]['circuit_name']
+    audit.update(first, circuit_name='Renamed')
+    assert 'Renamed' in audit and first not in audit
+    _assert_matches_fresh(audit)
+
+
+def test_bad_phase_update_leaves_audit_intact():
+    audit = LoadAudit(HOSPITAL_NODE_SAMPLE)
+    first = HOSPITAL_NODE_SAMPLE[0]
+    before = audit.results()
+    if first.get('phases', 1) == 1:
+        with pytest.raises(KeyError):
+            audit.update(first['circuit_name'], phase='D')
+        assert audit.results() == before
+
+
+def test_accepts_circuit_records():
+    from circuit_table import Circuit
+
+    records = [Circuit(**c) for c in HOSPITAL_NODE_SAMPLE]
+    audit = LoadAudit(records)
+    assert audit.results() == LoadAudit(HOSPITAL_NODE_SAMPLE).results()
+    audit.update(records[0].circuit_name, amps=1.0)
+    audit.add(Circuit('Spare', 120, 20, phase='B'))
+    _assert_matches_fresh(audit)
+    assert records[0].amps != 1.0          # the caller's record is not mutated
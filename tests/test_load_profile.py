@@ -0,0 +1,38 @@
+import numpy as np
+import pytest
+
+from circuit_table import CircuitTable
+from imperial_load_profile import HOURS_PER_YEAR, simulate_load_profile, synthetic_temperatures
+from vader_load_audit_v2 import HOSPITAL_NODE_SAMPLE, imperial_load_audit_v2
+
+BUILDING = {
+    'square_footage': 20_000, 'ceiling_height': 10, 'insulation_r_value': 19,
+    'window_shgc': 0.3, 'window_area_sqft': 2_000, 'indoor_design_temp': 72,
+    'occupants': 80, 'lighting_watts': 20_000, 'appliance_watts': 30_000,
+}
+
+
+@pytest.mark.parametrize('empty', [[], CircuitTable.from_circuits([])])
+def test_empty_schedule_is_all_zeros(empty):
+    result = simulate_load_profile(empty, synthetic_temperatures())
+    assert result.hourly_phase_va.shape == (HOURS_PER_YEAR, 3)
+    assert not result.hourly_phase_va.any()
+    summary = result.summary()
+    assert summary['connected_va'] == summary['coincident_peak_va'] == summary['annual_kwh'] == 0
+    assert summary['load_factor'] == 0 and summary['hours_over_n1'] == 0
+
+
+def test_empty_schedule_keeps_hvac():
+    temps = synthetic_temperatures()
+    hvac_only = simulate_load_profile([], temps, BUILDING)
+    with_load = simulate_load_profile(HOSPITAL_NODE_SAMPLE, temps, BUILDING)
+    assert np.array_equal(hvac_only.hourly_hvac_va, with_load.hourly_hvac_va)
+    assert np.allclose(hvac_only.hourly_va, hvac_only.hourly_hvac_va)
+
+
+def test_continuous_schedule_matches_v2_every_hour():
+    v2 = imperial_load_audit_v2(HOSPITAL_NODE_SAMPLE, verbose=False)
+    result = simulate_load_profile(HOSPITAL_NODE_SAMPLE, synthetic_temperatures())
+    assert np.allclose(result.hourly_va, v2['total_va'], atol=0.01)
+    for i, phase in enumerate('ABC'):
+        assert np.allclose(result.hourly_phase_va[:, i], v2['phase_loads'][phase], atol=0.01)
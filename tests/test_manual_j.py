@@ -0,0 +1,74 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from manual_j_thermal import EXAMPLE_HOME, manual_j_thermal_load
+from manual_j_vectorized import BUILDING_FIELDS, manual_j_thermal_load_array
+from sovereign_service import manual_j_many
+
+SITES = ['Chicago IL', 'phoenix az', '92101', 60601, (47.6, -122.3), (39.0, -105.5)]
+
+
+def _buildings(seed, n=300):
+    rng = np.random.default_rng(seed)
+    return [
+        {
+            **EXAMPLE_HOME,
+            'square_footage': int(rng.integers(800, 6000)),
+            'insulation_r_value': int(rng.integers(11, 61)),
+            'window_shgc': float(rng.choice([0.2, 0.25, 0.3, 0.45, 0.7])),
+            'window_area_sqft': int(rng.integers(50, 900)),
+            'outdoor_design_temp': int(rng.integers(-20, 116)),
+            'occupants': int(rng.integers(1, 9)),
+            'lighting_watts': float(rng.uniform(200, 3000)),
+        }
+        for _ in range(n)
+    ]
+
+
+def _rows(results):
+    keys = list(results)
+    return [dict(zip(keys, row)) for row in zip(*(results[k].tolist() for k in keys))]
+
+
+def test_array_matches_scalar_exactly():
+    buildings = _buildings(1)
+    columns = {f: [b[f] for b in buildings] for f in BUILDING_FIELDS}
+    assert _rows(manual_j_thermal_load_array(columns)) == [manual_j_thermal_load(b) for b in buildings]
+    frame = pd.DataFrame(buildings)
+    assert _rows(manual_j_thermal_load_array(frame)) == [manual_j_thermal_load(b) for b in buildings]
+
+
+def test_location_column_resolves_like_scalar():
+    buildings = _buildings(2, n=len(SITES) * 2)
+    for i, b in enumerate(buildings):
+        del b['outdoor_design_temp']
+        b['location'] = SITES[i % len(SITES)]
+        b['design_condition'] = 'heating' if i % 2 else 'cooling'
+    frame = pd.DataFrame(buildings)
+    expected = [manual_j_thermal_load(b) for b in buildings]
+    assert _rows(manual_j_thermal_load_array(frame)) == expected
+    assert manual_j_many(buildings) == expected
+
+
+def test_scalar_location_broadcasts():
+    building = {k: v for k, v in EXAMPLE_HOME.items() if k != 'outdoor_design_temp'}
+    results = manual_j_thermal_load_array({**building, 'location': (33.45, -112.07),
+                                          'insulation_r_value': [13, 30]})
+    for r_value, row in zip([13, 30], _rows(results)):
+        assert row == manual_j_thermal_load({**building, 'location': (33.45, -112.07),
+                                             'insulation_r_value': r_value})
+
+
+def test_explicit_temperature_wins_over_location():
+    buildings = _buildings(3, n=4)
+    buildings[0]['location'] = 'Phoenix AZ'
+    del buildings[1]['outdoor_design_temp']
+    buildings[1]['location'] = 'Chicago IL'
+    assert manual_j_many(buildings) == [manual_j_thermal_load(b) for b in buildings]
+
+
+def test_missing_temperature_and_location_is_reported():
+    building = {k: v for k, v in EXAMPLE_HOME.items() if k != 'outdoor_design_temp'}
+    with pytest.raises(KeyError, match='outdoor_design_temp'):
+        manual_j_thermal_load_array(building)
@@ -0,0 +1,49 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from imperial_monte_carlo import simulate_n1_risk
+from vader_load_audit_v2 import HOSPITAL_NODE_SAMPLE, imperial_load_audit_v2
+
+
+def test_fixed_draws_reproduce_nominal_audit():
+    result = simulate_n1_risk(HOSPITAL_NODE_SAMPLE, trials=10, distribution='fixed')
+    nominal = imperial_load_audit_v2(HOSPITAL_NODE_SAMPLE, verbose=False)
+    assert np.allclose(result.total_va, result.nominal_va)
+    assert result.nominal_va == pytest.approx(nominal['total_va'], abs=0.01)
+    assert result.summary()['p_exceeds_capacity'] == 0.0
+
+
+def test_n1_risk_is_not_the_nominal_exceedance():
+    nominal = simulate_n1_risk(HOSPITAL_NODE_SAMPLE, trials=1, distribution='fixed').nominal_va
+    summary = simulate_n1_risk(HOSPITAL_NODE_SAMPLE, trials=20_000, cv=0.2,
+                               capacity_va=nominal * 1.2).summary()
+    assert summary['p_n1_insufficient'] != summary['p_exceeds_nominal']
+    assert summary['p_n1_insufficient'] >= summary['p_exceeds_capacity']
+
+
+def test_same_seed_same_samples_across_workers():
+    kwargs = dict(trials=5_000, seed=7, cv=0.3, correlation=0.4, chunk_bytes=64 * 1024)
+    one = simulate_n1_risk(HOSPITAL_NODE_SAMPLE, workers=1, **kwargs)
+    two = simulate_n1_risk(HOSPITAL_NODE_SAMPLE, workers=2, **kwargs)
+    assert np.array_equal(one.phase_va, two.phase_va)
+    assert np.array_equal(one.max_unit, two.max_unit)
+
+
+def test_per_circuit_distribution_columns():
+    df = pd.DataFrame(HOSPITAL_NODE_SAMPLE)
+    df['amps_distribution'] = 'uniform'
+    df['amps_min'] = df['amps']
+    df['amps_max'] = df['amps'] * 1.5
+    result = simulate_n1_risk(df, trials=2_000)
+    assert (result.total_va >= result.nominal_va - 1e-6).all()
+    assert result.summary()['p_exceeds_nominal'] == 1.0
+
+
+def test_bad_arguments():
+    with pytest.raises(ValueError, match='no circuits'):
+        simulate_n1_risk([])
+    with pytest.raises(ValueError):
+        simulate_n1_risk(HOSPITAL_NODE_SAMPLE, distribution='cauchy')
+    with pytest.raises(ValueError):
+        simulate_n1_risk(HOSPITAL_NODE_SAMPLE, correlation=1.5)
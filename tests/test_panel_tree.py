@@ -0,0 +1,124 @@
+import random
+
+import pytest
+
+from panel_tree import PANEL_KINDS, PanelTree
+from vader_load_audit_v2 import circuit_va, is_critical_circuit
+
+CACHED = ('total_va', 'max_unit', 'circuit_count', 'critical_count', 'emergency_va')
+
+
+def _snapshot(tree):
+    return {node.name: [getattr(node, attr) for attr in CACHED] + list(node._phase) for node in tree}
+
+
+def _from_scratch(node):
+    """Subtree totals straight from the stored circuits, no caches"""
+    va = max_unit = emergency = 0.0
+    phase = [0.0, 0.0, 0.0]
+    count = critical = 0
+    for sub in node.walk():
+        for circuit in sub.audit._circuits.values():
+            unit = circuit_va(circuit)
+            va += unit
+            max_unit = max(max_unit, unit)
+            if circuit.get('phases', 1) == 1:
+                phase['ABC'.index(circuit.get('phase', 'A'))] += unit
+            else:
+                phase = [p + unit / 3 for p in phase]
+            count += 1
+            critical += is_critical_circuit(circuit)
+            if sub.on_emergency_branch:
+                emergency += unit
+    return [va, max_unit, count, critical, emergency] + phase
+
+
+def _assert_close(a, b):
+    assert a.keys() == b.keys()
+    for name in a:
+        assert a[name] == pytest.approx(b[name], rel=1e-9, abs=1e-6), name
+
+
+def _random_circuit(rng, name):
+    return {'circuit_name': name, 'voltage': rng.choice((120, 208, 277, 480)),
+            'amps': round(rng.uniform(1, 100), 1), 'phase': rng.choice('ABC'),
+            'phases': rng.choice((1, 1, 1, 3)), 'continuous': rng.random() < 0.3}
+
+
+def test_random_edits_match_rebuild_and_scratch():
+    rng = random.Random(2026)
+    tree = PanelTree()
+    circuits = {}           # panel → circuit names
+    circuits[tree.root.name] = []
+    for step in range(3000):
+        panels = list(tree._panels)
+        op = rng.random()
+        if op < 0.10 or len(panels) < 3:
+            name = f'P{step}'
+            tree.add_panel(name, rng.choice(panels), kind=rng.choice(PANEL_KINDS[1:]),
+                           emergency=rng.random() < 0.15,
+                           circuits=[_random_circuit(rng, f'{name}-c{i}') for i in range(rng.randrange(4))])
+            circuits[name] = list(tree[name].audit._circuits)
+        elif op < 0.14 and len(panels) > 6:
+            removed = tree.remove_panel(rng.choice(panels[1:]))
+            for sub in removed.walk():
+                del circuits[sub.name]
+        elif op < 0.22:
+            name, feeder = rng.choice(panels[1:]), rng.choice(panels)
+            if name in tree[feeder].path():
+                with pytest.raises(ValueError):
+                    tree.move_panel(name, feeder)
+            else:
+                tree.move_panel(name, feeder)
+        elif op < 0.30:
+            tree.set_emergency(rng.choice(panels), rng.random() < 0.5)
+        elif op < 0.60:
+            panel = rng.choice(panels)
+            name = f'c{step}'
+            tree.add_circuit(panel, _random_circuit(rng, name))
+            circuits[panel].append(name)
+        elif op < 0.80:
+            panel = rng.choice([p for p in panels if circuits[p]] or panels)
+            if circuits[panel]:
+                tree.update_circuit(panel, rng.choice(circuits[panel]),
+                                    amps=round(rng.uniform(1, 100), 1), phase=rng.choice('ABC'))
+        else:
+            panel = rng.choice([p for p in panels if circuits[p]] or panels)
+            if circuits[panel]:
+                tree.remove_circuit(panel, circuits[panel].pop(rng.randrange(len(circuits[panel]))))
+
+        if step % 250 == 0:
+            _assert_close(_snapshot(tree), {node.name: _from_scratch(node) for node in tree})
+
+    cached = _snapshot(tree)
+    _assert_close(cached, {node.name: _from_scratch(node) for node in tree})
+    tree.rebuild()
+    _assert_close(cached, _snapshot(tree))
+
+
+def test_emergency_flag_is_inherited():
+    tree = PanelTree.from_spec({
+        'name': 'Service',
+        'children': [{'name': 'EM', 'emergency': True, 'children': [
+            {'name': 'EM-1', 'circuits': [{'circuit_name': 'ICU', 'voltage': 120, 'amps': 20}]}]}],
+    })
+    assert tree['EM-1'].on_emergency_branch
+    assert tree.root.emergency_va == pytest.approx(2400)
+    tree.set_emergency('EM', False)
+    assert tree.root.emergency_va == 0
+    tree.add_panel('EM2', 'Service', emergency=True)
+    tree.move_panel('EM-1', 'EM2')
+    assert tree.root.emergency_va == pytest.approx(2400)
+    assert tree['EM'].circuit_count == 0
+
+
+def test_structure_errors():
+    tree = PanelTree()
+    tree.add_panel('A', 'Service')
+    tree.add_panel('B', 'A')
+    with pytest.raises(ValueError):
+        tree.move_panel('A', 'B')
+    with pytest.raises(ValueError):
+        tree.add_panel('A', 'Service')
+    with pytest.raises(ValueError):
+        tree.remove_panel('Service')
@@ -0,0 +1,76 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from circuit_table import Circuit, CircuitTable
+from phase_balancer import balance_phases, breaker_phase
+from vader_load_audit_v2 import HOSPITAL_NODE_SAMPLE, imperial_load_audit_v2
+
+
+def _schedule(n, pattern, seed=0):
+    rng = np.random.default_rng(seed)
+    return [{'circuit_name': f'CKT-{i}', 'voltage': 120, 'amps': round(float(rng.uniform(1, 20)), 1),
+             'phase': pattern[i % len(pattern)]} for i in range(n)]
+
+
+@pytest.mark.parametrize('strategy', ['lpt', 'incremental'])
+@pytest.mark.parametrize('n, pattern', [(30, 'A'), (1_000, 'A'), (1_000, 'AAB')])
+def test_lopsided_schedules_balance(strategy, n, pattern):
+    result = balance_phases(_schedule(n, pattern), strategy=strategy)
+    assert result.before['imbalance_percent'] >= 50
+    assert result.after['imbalance_percent'] < (2 if n < 100 else 0.01)
+    assert result.after['phase_balanced']
+
+
+def test_incremental_moves_fewer_circuits_than_lpt():
+    schedule = _schedule(1_000, 'AAB')
+    lpt = balance_phases(schedule, strategy='lpt')
+    incremental = balance_phases(schedule, strategy='incremental')
+    assert incremental.summary()['circuits_moved'] < lpt.summary()['circuits_moved'] / 2
+    balanced = _schedule(999, 'ABC', seed=3)
+    assert balance_phases(balanced, strategy='incremental').summary()['circuits_moved'] < 30
+
+
+def test_lpt_at_scale_matches_v2_audit():
+    schedule = _schedule(20_000, 'ABCAB', seed=7)
+    result = balance_phases(schedule)
+    audit = imperial_load_audit_v2(result.apply(schedule), verbose=False)
+    assert audit['phase_loads'] == pytest.approx(result.after['phase_loads'], abs=0.01)
+    assert audit['imbalance_percent'] == result.after['imbalance_percent'] < 0.01
+
+
+@pytest.mark.parametrize('strategy, pattern', [('lpt', 'A'), ('incremental', 'AAB')])
+def test_fixed_circuits_and_caps_are_respected(strategy, pattern):
+    schedule = _schedule(60, pattern, seed=1)
+    schedule[0]['pinned'] = True
+    result = balance_phases(schedule, strategy=strategy, positions={'CKT-1': 5},
+                            max_per_phase={'A': 40, 'B': 25, 'C': 21})
+    phases = result.assignments()
+    assert phases['CKT-0'] == 'A' and phases['CKT-1'] == breaker_phase(5) == 'C'
+    counts = pd.Series(list(phases.values())).value_counts()
+    assert counts['A'] <= 40 and counts['B'] <= 25 and counts['C'] <= 21
+    assert result.after['imbalance_percent'] < result.before['imbalance_percent']
+
+
+def test_apply_preserves_type_and_three_phase_rows():
+    result = balance_phases(HOSPITAL_NODE_SAMPLE, strategy='incremental')
+    expected = result.after['phase_loads']
+
+    as_dicts = result.apply(HOSPITAL_NODE_SAMPLE)
+    assert imperial_load_audit_v2(as_dicts, verbose=False)['phase_loads'] == pytest.approx(expected, abs=0.01)
+    for before, after in zip(HOSPITAL_NODE_SAMPLE, as_dicts):
+        if before.get('phases', 1) == 3:
+            assert after is before
+
+    table = CircuitTable.from_circuits(HOSPITAL_NODE_SAMPLE)
+    applied = result.apply(table)
+    assert isinstance(applied, CircuitTable)
+    assert applied.phase_loads() == pytest.approx(expected, abs=0.01)
+
+    records = list(table)
+    assert all(isinstance(c, Circuit) for c in result.apply(records))
+    original = pd.DataFrame(HOSPITAL_NODE_SAMPLE)
+    frame = result.apply(original)
+    single = ~result.three_phase
+    assert frame['phase'][single].tolist() == result.phases[single].tolist()
+    assert frame['phase'][~single].equals(original['phase'][~single])
@@ -0,0 +1,108 @@
+import asyncio
+import json
+import random
+
+import pytest
+
+from sovereign_service import SovereignService
+
+
+def _schedule(seed, n=50):
+    rng = random.Random(seed)
+    return [{'circuit_name': f'C{seed}-{i}', 'voltage': rng.choice([120, 208, 277]),
+             'amps': rng.choice([15, 20, 30]), 'phase': rng.choice('ABC')} for i in range(n)]
+
+
+async def _request(port, head: bytes, body: bytes = b''):
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    writer.write(head + body)
+    await writer.drain()
+    raw = await reader.read()
+    writer.close()
+    status = int(raw.split(b' ', 2)[1])
+    return status, json.loads(raw.split(b'\r\n\r\n', 1)[1])
+
+
+async def _post(port, path, payload):
+    body = json.dumps(payload).encode()
+    head = (f'POST {path} HTTP/1.1\r\nConnection: close\r\n'
+            f'Content-Length: {len(body)}\r\n\r\n').encode()
+    return await _request(port, head, body)
+
+
+def _with_service(test):
+    async def run():
+        service = SovereignService(workers=0, batch_window_ms=20)
+        server = await asyncio.start_server(service.handle, '127.0.0.1', 0)
+        port = server.sockets[0].getsockname()[1]
+        try:
+            async with server:
+                await test(service, port)
+        finally:
+            service.close()
+    asyncio.run(run())
+
+
+def test_concurrent_small_v2_audits_are_batched():
+    async def test(service, port):
+        results = await asyncio.gather(*(_post(port, '/audit/v2', _schedule(seed)) for seed in range(40)))
+        assert all(status == 200 for status, _ in results)
+        stats = service.stats()['batching']['/audit/v2']
+        assert stats['items'] == 40
+        assert stats['batches'] < 40
+    _with_service(test)
+
+
+def test_bad_v2_audit_in_a_batch_fails_alone():
+    async def test(service, port):
+        bad = [{'circuit_name': 'X', 'voltage': 120, 'amps': 20, 'phase': 'Q'}]
+        results = await asyncio.gather(_post(port, '/audit/v2', _schedule(100)),
+                                       _post(port, '/audit/v2', bad),
+                                       _post(port, '/audit/v2', _schedule(101)))
+        assert [status for status, _ in results] == [200, 400, 200]
+    _with_service(test)
+
+
+def test_audits_do_not_block_the_event_loop(monkeypatch):
+    import threading
+    import sovereign_service
+
+    release = threading.Event()
+    original_audit = sovereign_service.run_audit
+    original_box_fill = sovereign_service.box_fill_many
+
+    def slow_audit(engine, facility):
+        release.wait(5)
+        return original_audit(engine, facility)
+
+    def slow_box_fill(boxes):
+        release.wait(5)
+        return original_box_fill(boxes)
+
+    monkeypatch.setattr(sovereign_service, 'run_audit', slow_audit)
+
+    async def test(service, port):
+        service.batchers['/box-fill'].vector_fn = slow_box_fill
+        boxes = [{'conductors': n % 9 + 2} for n in range(64)]
+        audit = asyncio.ensure_future(_post(port, '/audit/v3', {'circuits': _schedule(200)}))
+        box_fill = asyncio.ensure_future(_post(port, '/box-fill', boxes))
+        await asyncio.sleep(0.05)
+        status, payload = await asyncio.wait_for(
+            _request(port, b'GET /health HTTP/1.1\r\nConnection: close\r\n\r\n'), timeout=1)
+        assert (status, payload) == (200, {'status': 'ok'})
+        assert not audit.done() and not box_fill.done()
+        release.set()
+        status, _ = await audit
+        assert status == 200
+        status, payload = await box_fill
+        assert status == 200 and payload == original_box_fill(boxes)
+    _with_service(test)
+
+
+@pytest.mark.parametrize('length', [b'abc', b'-5'])
+def test_malformed_content_length_is_400(length):
+    async def test(service, port):
+        head = b'POST /audit/v2 HTTP/1.1\r\nContent-Length: ' + length + b'\r\n\r\n'
+        status, payload = await _request(port, head)
+        assert status == 400 and 'Content-Length' in payload['error']
+    _with_service(test)
@@ -0,0 +1,80 @@
+import pickle
+
+from box_fill_calculator import box_fill_calculator
+from sovereign_cache import DiskTier, MemoryTier, SovereignCache, content_key
+
+
+def _blob(value):
+    return pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def test_memory_hit_miss_and_copies():
+    cache = SovereignCache()
+    first = cache.get_or_compute('box_fill', box_fill_calculator, 6)
+    first['recommended_box'] = 'mutated'
+    again = cache.get_or_compute('box_fill', box_fill_calculator, conductors=6)
+    assert again == box_fill_calculator(6)
+    assert cache.get('nope', 'default') == 'default'
+    assert (cache.stats.hits, cache.stats.misses) == (1, 2)
+
+
+def test_memory_evicts_least_recently_used():
+    tier = MemoryTier(max_entries=2)
+    tier.put('a', 1, 10)
+    tier.put('b', 2, 10)
+    tier.get('a')
+    assert tier.put('c', 3, 10) == 1
+    assert sorted(tier._data) == ['a', 'c']
+
+    sized = MemoryTier(max_bytes=25)
+    sized.put('a', 1, 10)
+    sized.put('b', 2, 10)
+    assert sized.put('c', 3, 10) == 1 and sized.nbytes == 20
+    assert sized.put('huge', 4, 26) == 0 and 'huge' not in sized._data
+
+
+def test_disk_hit_survives_a_new_cache(tmp_path):
+    path = str(tmp_path / 'cache.db')
+    writer = SovereignCache(disk_path=path)
+    expected = writer.get_or_compute('box_fill', box_fill_calculator, 8, largest_awg=10)
+    reader = SovereignCache(disk_path=path)
+    assert reader.get_or_compute('box_fill', box_fill_calculator, 8, largest_awg=10) == expected
+    assert (reader.stats.disk_hits, reader.stats.misses) == (1, 0)
+    assert reader.get(content_key('box_fill', conductors=9)) is None
+    assert reader.stats.misses == 1
+
+
+def test_disk_hits_do_not_write(tmp_path):
+    tier = DiskTier(str(tmp_path / 'cache.db'))
+    tier.put('a', 'ns', _blob(1))
+    changes = tier._conn.total_changes
+    for _ in range(10):
+        assert tier.get('a') == _blob(1)
+    assert tier.get('missing') is None
+    assert tier._conn.total_changes == changes and not tier._conn.in_transaction
+    tier.close()
+
+
+def test_disk_eviction_uses_buffered_access_times(tmp_path):
+    blob = _blob('x' * 100)
+    tier = DiskTier(str(tmp_path / 'cache.db'), max_bytes=len(blob) * 2, touch_batch=1000)
+    tier.put('old', 'ns', blob)
+    tier.put('new', 'ns', blob)
+    assert tier.get('old') == blob          # buffered, not yet written
+    assert tier.put('third', 'ns', blob) == 1
+    assert tier.get('old') == blob
+    assert tier.get('new') is None
+    assert len(tier) == 2
+
+
+def test_disk_flushes_after_touch_batch(tmp_path):
+    tier = DiskTier(str(tmp_path / 'cache.db'), touch_batch=2)
+    for key in 'ab':
+        tier.put(key, 'ns', _blob(key))
+    before = dict(tier._conn.execute('SELECT key, accessed FROM cache'))
+    tier.get('a')
+    assert tier._touched
+    tier.get('b')
+    assert not tier._touched
+    after = dict(tier._conn.execute('SELECT key, accessed FROM cache'))
+    assert all(after[k] >= before[k] for k in 'ab')
@@ -0,0 +1,52 @@
+import csv
+import json
+import random
+
+import pytest
+
+from panel_schedule import read_panel_schedule
+from vader_load_audit_v2 import check_n_plus_one_redundancy, circuit_va, imperial_load_audit_v2
+from vader_stream_audit import stream_load_audit
+
+FIELDS = ('circuit_name', 'voltage', 'amps', 'phases', 'continuous', 'phase')
+
+
+def _rows(n, seed=4):
+    rng = random.Random(seed)
+    return [{'circuit_name': f'{rng.choice(["ICU", "OR", "Lobby", "Kitchen", "Lab"])}-{i}',
+             'voltage': rng.choice([120, 208, 277, 480]), 'amps': round(rng.uniform(1, 90), 1),
+             'phases': rng.choice([1, 1, 3]), 'continuous': rng.random() < 0.5,
+             'phase': rng.choice('ABC')} for i in range(n)]
+
+
+@pytest.fixture(params=['csv', 'jsonl'])
+def schedule(request, tmp_path):
+    rows = _rows(2_345)
+    path = tmp_path / f'big.{request.param}'
+    with open(path, 'w', newline='') as f:
+        if request.param == 'csv':
+            writer = csv.DictWriter(f, FIELDS)
+            writer.writeheader()
+            writer.writerows(rows)
+        else:
+            f.writelines(json.dumps(r) + '\n' for r in rows)
+    return str(path)
+
+
+@pytest.mark.parametrize('chunk_size', [1, 100, 10_000])
+def test_stream_matches_in_memory_v2(schedule, chunk_size):
+    circuits = read_panel_schedule(schedule)['circuits']
+    expected = imperial_load_audit_v2(circuits, verbose=False)
+    streamed = stream_load_audit(schedule, chunk_size=chunk_size, verbose=False)
+    for key, value in expected.items():
+        assert streamed[key] == value, key
+    assert streamed['circuit_count'] == len(circuits)
+    assert streamed['max_unit_va'] == round(max(circuit_va(c) for c in circuits), 2)
+    assert streamed['redundancy'] == check_n_plus_one_redundancy(circuits)
+
+
+def test_streaming_needs_a_line_format(tmp_path):
+    path = tmp_path / 'site.json'
+    path.write_text('[]')
+    with pytest.raises(ValueError):
+        stream_load_audit(str(path))
@@ -0,0 +1,83 @@
+import random
+
+import numpy as np
+import pytest
+
+from imperial_load_audit_v3 import audit_hospital_node, thermal_signature_bars
+
+
+@pytest.fixture(scope='module')
+def result():
+    rng = random.Random(21)
+    circuits = [{'circuit_name': f'{rng.choice(["ICU", "Lobby", "HVAC"])} {i}', 'voltage': 120,
+                 'amps': rng.choice([15, 20, 30]), 'phase': rng.choice('ABC'),
+                 'panel': f'LP-{i % 7}'} for i in range(50)]
+    return audit_hospital_node(circuits)
+
+
+@pytest.mark.parametrize('group_by', [None, 'panel'])
+@pytest.mark.parametrize('top_n', [1, 5, 40])
+def test_bar_count_is_bounded(result, group_by, top_n):
+    labels, values, critical = thermal_signature_bars(result, group_by, top_n)
+    assert len(labels) == len(values) == len(critical) <= top_n + 1
+    assert values.sum() == pytest.approx(result.df['va'].sum())
+
+
+def test_small_schedule_keeps_every_circuit(result):
+    labels, values, _ = thermal_signature_bars(result, None, top_n=50)
+    assert labels == list(result.df['circuit_name'])
+    assert np.array_equal(values, result.df['va'].to_numpy())
+
+
+@pytest.mark.parametrize('top_n', [0, -3])
+def test_top_n_must_be_positive(result, top_n):
+    with pytest.raises(ValueError):
+        thermal_signature_bars(result, None, top_n)
+
+
+def test_cli_rejects_non_positive_plot_top():
+    from sovereign_cli import build_parser
+
+    with pytest.raises(SystemExit):
+        build_parser().parse_args(['audit', 'panel.csv', '--plot-top', '0'])
+    assert build_parser().parse_args(['audit', 'panel.csv', '--plot-top', '3']).plot_top == 3
+
+
+@pytest.mark.parametrize('ext', ['.csv', '.json', '.jsonl', '.parquet', '.arrow'])
+def test_path_inputs_keep_extra_columns(result, tmp_path, ext):
+    frame = result.df.drop(columns='va')
+    path = str(tmp_path / f'node{ext}')
+    if ext in ('.csv', '.json', '.jsonl'):
+        {'.csv': lambda: frame.to_csv(path, index=False),
+         '.json': lambda: frame.to_json(path, orient='records'),
+         '.jsonl': lambda: frame.to_json(path, orient='records', lines=True)}[ext]()
+    else:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        table = pa.Table.from_pandas(frame, preserve_index=False)
+        if ext == '.parquet':
+            pq.write_table(table, path)
+        else:
+            with pa.OSFile(path, 'wb') as sink, pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+    from_path = audit_hospital_node(path)
+    assert from_path.df['panel'].tolist() == result.df['panel'].tolist()
+    labels, values, critical = thermal_signature_bars(from_path, 'panel')
+    expected = thermal_signature_bars(result, 'panel')
+    assert labels == expected[0]
+    assert np.allclose(values, expected[1]) and np.array_equal(critical, expected[2])
+
+
+@pytest.mark.parametrize('group_by', [None, 'panel', 'phase', 'critical'])
+def test_plot_thermal_signature_renders_headless(result, tmp_path, group_by):
+    import matplotlib
+
+    from imperial_load_audit_v3 import plot_thermal_signature
+
+    matplotlib.use('Agg')
+    path = plot_thermal_signature(result, str(tmp_path / 'signature.png'), dpi=40,
+                                  group_by=group_by, top_n=5)
+    with open(path, 'rb') as f:
+        assert f.read(8) == b'\x89PNG\r\n\x1a\n'
+    assert plot_thermal_signature(result, filename=False, dpi=40) is None